@@ -0,0 +1,135 @@
+"""
+Shared fixtures for the benchmark scripts (test_*.py).
+
+Storage stand-ins serving files from a directory (no Supabase access needed),
+a synthetic deck with generated JPEG portraits, and helpers to run code
+quietly against a temporary image cache.
+"""
+import io
+import os
+import time
+import random
+import threading
+import contextlib
+from typing import Callable, Optional
+
+from PIL import Image
+from storage3.exceptions import StorageApiError
+from src.card import image_handler
+from src.supabase_client import character_from_row, connection_from_row
+from src.config import CATEGORY_ORDER
+
+
+class SimulatedBucket:
+    """Storage bucket stand-in serving files from a directory, with optional latency and transient errors."""
+
+    def __init__(self, directory: str, latency: float = 0.0, flaky: Optional[Callable[[str], bool]] = None):
+        """
+        Args:
+            directory: Directory holding the bucket's files
+            latency: Seconds added to every request
+            flaky: Files whose first download fails with a transient error
+        """
+        self.directory = directory
+        self.latency = latency
+        self.flaky = flaky
+        self.failed_once = set()
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def download(self, name: str) -> bytes:
+        time.sleep(self.latency)
+        with self.lock:
+            self.requests += 1
+            transient = self.flaky is not None and self.flaky(name) and name not in self.failed_once
+            self.failed_once.add(name)
+        if transient:
+            raise StorageApiError("Service unavailable", "ServiceUnavailable", 503)
+
+        path = os.path.join(self.directory, name)
+        if not os.path.exists(path):
+            raise StorageApiError("Object not found", "not_found", "404")
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def list(self, path: str = None, options: dict = None) -> list:
+        time.sleep(self.latency)
+        with self.lock:
+            self.requests += 1
+        return [
+            {'id': name, 'name': name, 'metadata': {'eTag': f'"{os.stat(os.path.join(self.directory, name)).st_mtime_ns}"'}}
+            for name in sorted(os.listdir(self.directory))
+        ]
+
+
+class SimulatedStorage:
+    def __init__(self, directory: str, **options):
+        self.bucket = SimulatedBucket(directory, **options)
+
+    def from_(self, bucket_name: str) -> SimulatedBucket:
+        return self.bucket
+
+
+class SimulatedClient:
+    """Supabase client stand-in with storage only; options are passed to SimulatedBucket."""
+
+    def __init__(self, directory: str, **options):
+        self.storage = SimulatedStorage(directory, **options)
+
+
+def use_image_cache(directory: str):
+    """Point the image cache at directory, keeping the project's image cache untouched."""
+    image_handler.CACHE_DIR = directory
+    image_handler.PRINT_CACHE_DIR = os.path.join(directory, 'print')
+    image_handler.METADATA_CACHE_DIR = os.path.join(directory, 'metadata')
+
+
+def create_portraits(directory: str, count: int, size: tuple = (1200, 1600), quality: int = 90) -> list:
+    """
+    Write one noisy, tinted JPEG portrait per card (PORTRAIT_001.jpg, ...).
+
+    Returns:
+        The portrait filenames
+    """
+    os.makedirs(directory, exist_ok=True)
+    rng = random.Random(42)
+    names = []
+    for card in range(1, count + 1):
+        name = f"PORTRAIT_{card:03d}.jpg"
+        noise = Image.effect_noise((size[0] // 4, size[1] // 4), 60).resize(size).convert('RGB')
+        tint = Image.new('RGB', noise.size, tuple(rng.randrange(256) for _ in range(3)))
+        Image.blend(noise, tint, 0.5).save(os.path.join(directory, name), quality=quality)
+        names.append(name)
+    return names
+
+
+def synthetic_tables(num_cards: int, connections_per_card: int) -> tuple:
+    """Characters (with the portraits of create_portraits) and random active connections between them."""
+    rng = random.Random(7)
+    categories = [code for code in CATEGORY_ORDER if code != 'T']
+    characters = [
+        character_from_row({
+            'id': card, 'name': f"CHARACTER {card:03d}", 'first_names': "Firstname",
+            'birth_date': "1500", 'death_date': "1560", 'biography': "A short biography. " * 6,
+            'type': rng.choice(categories), 'image_link': f"PORTRAIT_{card:03d}.jpg",
+        })
+        for card in range(1, num_cards + 1)
+    ]
+    connections = [
+        connection_from_row({
+            'id': conn_id, 'char1_id': card, 'char2_id': rng.randint(1, num_cards),
+            'value': rng.randint(1, 10), 'why': "Reason", 'why_short': "Short reason", 'active': True,
+        })
+        for conn_id, card in enumerate(
+            (card for card in range(1, num_cards + 1) for _ in range(connections_per_card)), start=1
+        )
+    ]
+    return characters, connections
+
+
+def timed(function, *args, **kwargs) -> tuple:
+    """Run quietly; return (seconds, result)."""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
@@ -6,13 +6,29 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.supabase_client import get_supabase_client
+from src.supabase_client import get_supabase_client, stream_table
 from src.download_images.models import Character
 
+# Columns that may record an image selection (checked in order)
+SELECTION_COLUMNS = ('wikimedia_selected_id', 'selected_image_id', 'selected_wikimedia_id', 'image_id')
+
+
+def find_selection_columns(client) -> list:
+    """Return the selection columns that exist in the character table (from one sample row)."""
+    sample = client.table('character').select('*').limit(1).execute().data
+    if not sample:
+        return []
+    return [column for column in SELECTION_COLUMNS if column in sample[0]]
+
+
 def main():
     # Connect to Supabase
     client = get_supabase_client()
 
+    # Only fetch the name and whichever selection columns the schema has
+    selection_columns = find_selection_columns(client)
+    columns = ','.join(['name'] + selection_columns)
+
     # Categories to check
     categories = ['R', 'S', 'P', 'M', 'N']
 
@@ -21,10 +37,14 @@ def main():
         print(f"CATEGORY {category}")
         print(f"{'='*80}")
 
-        # Fetch all characters in this category with raw data
-        response = client.table('character').select('*').eq('type', category).order('name').execute()
+        # Fetch all characters in this category (paged, so large categories are not truncated)
+        rows = list(stream_table(
+            client, 'character', columns,
+            filters=lambda query: query.eq('type', category),
+            order_by=('name',)
+        ))
 
-        if not response.data:
+        if not rows:
             print(f"No characters found in category {category}")
             continue
 
@@ -32,15 +52,10 @@ def main():
         selected = []
         missing = []
 
-        for row in response.data:
+        for row in rows:
             name = row.get('name', 'UNKNOWN')
             # Check various possible field names for selection
-            has_selection = (
-                row.get('wikimedia_selected_id') or
-                row.get('selected_image_id') or
-                row.get('selected_wikimedia_id') or
-                row.get('image_id')
-            )
+            has_selection = any(row.get(column) for column in selection_columns)
 
             if has_selection:
                 selected.append(name)
@@ -49,18 +64,18 @@ def main():
 
         # Print selected
         if selected:
-            print(f"\n✅ SELECTED ({len(selected)}/{len(response.data)}):")
+            print(f"\n✅ SELECTED ({len(selected)}/{len(rows)}):")
             for name in selected:
                 print(f"   {name}")
 
         # Print missing
         if missing:
-            print(f"\n❌ MISSING ({len(missing)}/{len(response.data)}):")
+            print(f"\n❌ MISSING ({len(missing)}/{len(rows)}):")
             for name in missing:
                 print(f"   {name}")
 
         # Summary
-        print(f"\nProgress: {len(selected)}/{len(response.data)} ({100*len(selected)//len(response.data) if response.data else 0}%)")
+        print(f"\nProgress: {len(selected)}/{len(rows)} ({100*len(selected)//len(rows) if rows else 0}%)")
 
     print(f"\n{'='*80}\n")
 
@@ -4,6 +4,8 @@ Image cache management utility.
 """
 import os
 import sys
+import json
+import shutil
 from pathlib import Path
 
 
@@ -12,6 +14,29 @@ def get_cache_dir():
     return os.path.join(os.path.dirname(__file__), 'image_cache')
 
 
+def get_print_cache_dir():
+    """Get the directory of print-resolution derivatives (inside the cache directory)."""
+    return os.path.join(get_cache_dir(), 'print')
+
+
+def get_metadata_cache_dir():
+    """Get the directory of cached image metadata (inside the cache directory)."""
+    return os.path.join(get_cache_dir(), 'metadata')
+
+
+def get_bucket_index_path():
+    """Get the path of the validators from the last bucket listing."""
+    return os.path.join(get_cache_dir(), 'bucket_index.json')
+
+
+def list_files(directory):
+    """List the regular files in a directory (empty if it does not exist), except the bucket index."""
+    if not os.path.exists(directory):
+        return []
+    return [f for f in os.listdir(directory)
+            if os.path.isfile(os.path.join(directory, f)) and os.path.join(directory, f) != get_bucket_index_path()]
+
+
 def show_cache_stats():
     """Display cache statistics."""
     cache_dir = get_cache_dir()
@@ -20,8 +45,10 @@ def show_cache_stats():
         print("Cache directory does not exist")
         return
 
-    files = os.listdir(cache_dir)
-    if not files:
+    files = list_files(cache_dir)
+    derivatives = list_files(get_print_cache_dir())
+    metadata = list_files(get_metadata_cache_dir())
+    if not files and not derivatives and not metadata:
         print("Cache is empty")
         return
 
@@ -41,7 +68,17 @@ def show_cache_stats():
         total_size += size
         print(f"  {f:40s} {size/1024:7.1f} KB")
 
+    derivatives_size = sum(os.path.getsize(os.path.join(get_print_cache_dir(), f)) for f in derivatives)
+    total_size += derivatives_size
+    metadata_size = sum(os.path.getsize(os.path.join(get_metadata_cache_dir(), f)) for f in metadata)
+    total_size += metadata_size
+
     print()
+    print(f"Print-resolution derivatives: {len(derivatives)} ({derivatives_size/(1024*1024):.2f} MB)")
+    print(f"Metadata files: {len(metadata)} ({metadata_size/1024:.1f} KB)")
+    if os.path.exists(get_bucket_index_path()):
+        with open(get_bucket_index_path(), 'r', encoding='utf-8') as f:
+            print(f"Bucket last listed: {json.load(f).get('listed_at')}")
     print(f"Total cache size: {total_size/1024:.1f} KB ({total_size/(1024*1024):.2f} MB)")
     print()
 
@@ -54,12 +91,15 @@ def clear_cache():
         print("Cache directory does not exist")
         return
 
-    files = os.listdir(cache_dir)
-    if not files:
+    files = list_files(cache_dir)
+    derivatives = list_files(get_print_cache_dir())
+    metadata = list_files(get_metadata_cache_dir())
+    if not files and not derivatives and not metadata:
         print("Cache is already empty")
         return
 
-    print(f"Found {len(files)} cached images")
+    print(f"Found {len(files)} cached images, {len(derivatives)} print-resolution derivatives "
+          f"and {len(metadata)} metadata files")
     response = input("Are you sure you want to delete all cached images? (y/N): ")
 
     if response.lower() != 'y':
@@ -68,8 +108,33 @@ def clear_cache():
 
     for f in files:
         os.remove(os.path.join(cache_dir, f))
+    shutil.rmtree(get_print_cache_dir(), ignore_errors=True)
+    shutil.rmtree(get_metadata_cache_dir(), ignore_errors=True)
+    if os.path.exists(get_bucket_index_path()):
+        os.remove(get_bucket_index_path())
+
+    print(f"✓ Deleted {len(files)} cached images, {len(derivatives)} derivatives and {len(metadata)} metadata files")
+
+
+def warm_cache(workers=None):
+    """Download every portrait of the deck (and its metadata) missing from the cache."""
+    from src.supabase_client import get_supabase_client, fetch_all_characters
+    from src.card.cache_warmer import warm_image_cache, refresh_bucket_index, WARM_WORKERS
+
+    workers = workers or WARM_WORKERS
+    print("Connecting to Supabase...")
+    client = get_supabase_client()
+    characters = fetch_all_characters(client, columns="id,image_link")
+
+    objects, stale = refresh_bucket_index(client)
+    print(f"Bucket lists {objects} files; removed {stale} stale cached files")
+
+    print(f"Warming cache for {len(characters)} characters with {workers} concurrent downloads...")
+    result = warm_image_cache(client, (c.image_link for c in characters), workers=workers)
 
-    print(f"✓ Deleted {len(files)} cached images")
+    for filename, error in result.failed:
+        print(f"  ✗ {filename}: {error}")
+    print(f"✓ {result.summary()}")
 
 
 def main():
@@ -79,6 +144,7 @@ def main():
         print("Usage:")
         print("  python manage_cache.py stats   - Show cache statistics")
         print("  python manage_cache.py clear   - Clear all cached images")
+        print("  python manage_cache.py warm [N] - Download all missing images using N concurrent requests (default: 8)")
         return
 
     command = sys.argv[1]
@@ -87,9 +153,11 @@ def main():
         show_cache_stats()
     elif command == "clear":
         clear_cache()
+    elif command == "warm":
+        warm_cache(int(sys.argv[2]) if len(sys.argv) > 2 else None)
     else:
         print(f"Unknown command: {command}")
-        print("Use 'stats' or 'clear'")
+        print("Use 'stats', 'clear' or 'warm'")
 
 
 if __name__ == "__main__":
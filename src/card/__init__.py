@@ -3,12 +3,15 @@ Card rendering package for Millennium card game.
 
 Public API for drawing card fronts and backs.
 """
-from src.card.renderer import draw_card_front, draw_card_back
+from src.card.renderer import draw_card_front, draw_card_back, prepare_card_front
+from src.card.components.front import NOT_PREPARED
 from src.config import CARD_WIDTH, CARD_HEIGHT
 
 __all__ = [
     'draw_card_front',
     'draw_card_back',
+    'prepare_card_front',
+    'NOT_PREPARED',
     'CARD_WIDTH',
     'CARD_HEIGHT',
 ]
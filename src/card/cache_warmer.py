@@ -0,0 +1,264 @@
+"""
+Validation and concurrent warm-up of the local image cache.
+
+A single listing of the storage bucket gives the ETag (or updated_at) of
+every image and metadata file. Cached copies whose validator changed since
+the previous listing are dropped, and the listing tells which images have no
+metadata at all, so a build with a warm cache makes no per-card requests.
+A single card is validated by downloading its portrait and metadata again
+instead, which costs less than listing the whole bucket.
+
+Portraits are otherwise downloaded lazily, one request at a time, so a cold
+build spends most of its time waiting on round trips. Warming fetches every
+missing original and its JSON metadata through a bounded thread pool first,
+retrying transient failures, and decodes each download (in the same worker
+threads; PIL releases the GIL while decoding) before it is cached. Rendering
+then only reads local files.
+"""
+import os
+import time
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.card import image_handler
+
+
+# Concurrent downloads
+WARM_WORKERS = 8
+
+# Attempts per file before giving up
+WARM_ATTEMPTS = 3
+
+# Seconds before the first retry, doubled on each further retry
+RETRY_BACKOFF = 0.5
+
+# Objects per bucket listing request
+LIST_PAGE_SIZE = 1000
+
+
+@dataclass
+class WarmResult:
+    """Outcome of a cache warm-up."""
+    images: int = 0                  # Distinct images referenced
+    cached: int = 0                  # Originals already in the cache
+    downloaded: int = 0              # Originals fetched and validated
+    metadata_downloaded: int = 0     # Metadata files fetched
+    bytes_downloaded: int = 0
+    seconds: float = 0.0
+    failed: List[Tuple[str, str]] = field(default_factory=list)  # (filename, error)
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes_downloaded / (1024 * 1024) / self.seconds if self.seconds else 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        files = self.downloaded + self.metadata_downloaded
+        return files / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.images} images: {self.cached} already cached, {self.downloaded} downloaded "
+            f"(+{self.metadata_downloaded} metadata), {len(self.failed)} failed; "
+            f"{self.bytes_downloaded / (1024 * 1024):.1f} MB in {self.seconds:.1f}s "
+            f"({self.megabytes_per_second:.1f} MB/s, {self.files_per_second:.1f} files/s)"
+        )
+
+
+def _filenames(image_links: Iterable[Optional[str]]) -> List[str]:
+    """Distinct cache filenames of a deck's image_link values (empty values are skipped)."""
+    return sorted({
+        os.path.basename(link.strip()) for link in image_links if link and os.path.basename(link.strip())
+    })
+
+
+def missing_images(image_links: Iterable[Optional[str]]) -> List[str]:
+    """Filenames of the deck's portraits that are not in the local cache."""
+    return [name for name in _filenames(image_links)
+            if not os.path.exists(os.path.join(image_handler.CACHE_DIR, name))]
+
+
+def _validator(entry: dict) -> str:
+    """ETag of a listed object, or its update time if storage did not report one."""
+    return (entry.get('metadata') or {}).get('eTag') or entry.get('updated_at') or ''
+
+
+def list_bucket(supabase_client) -> Dict[str, str]:
+    """
+    List every object in the image bucket.
+
+    Returns:
+        Dict of object name to validator
+    """
+    bucket = supabase_client.storage.from_(image_handler.BUCKET_NAME)
+    objects = {}
+    offset = 0
+    while True:
+        page = bucket.list(options={'limit': LIST_PAGE_SIZE, 'offset': offset})
+        for entry in page:
+            # Folders are listed with an id of None
+            if entry.get('id') is not None or entry.get('metadata'):
+                objects[entry['name']] = _validator(entry)
+        if len(page) < LIST_PAGE_SIZE:
+            return objects
+        offset += LIST_PAGE_SIZE
+
+
+def refresh_bucket_index(supabase_client) -> Tuple[int, int]:
+    """
+    List the bucket and drop cached files that are stale.
+
+    A cached original or metadata file is stale when its validator changed or
+    the object was deleted since the previous listing. Originals cached before
+    the first listing are kept and take the listed validator; metadata cached
+    before it was never validated and is dropped.
+
+    Args:
+        supabase_client: Supabase client instance
+
+    Returns:
+        (objects listed, stale cache entries removed)
+    """
+    previous = image_handler.load_bucket_index()
+    objects = list_bucket(supabase_client)
+
+    stale = 0
+    if previous is None:
+        previous = {}
+        if os.path.isdir(image_handler.METADATA_CACHE_DIR):
+            for name in os.listdir(image_handler.METADATA_CACHE_DIR):
+                os.remove(os.path.join(image_handler.METADATA_CACHE_DIR, name))
+                stale += 1
+    for name, validator in previous.items():
+        if objects.get(name) == validator:
+            continue
+        if name.lower().endswith('.json'):
+            path = os.path.join(image_handler.METADATA_CACHE_DIR, name)
+        else:
+            path = os.path.join(image_handler.CACHE_DIR, name)
+        if os.path.exists(path):
+            os.remove(path)
+            stale += 1
+
+    image_handler.save_bucket_index(objects, datetime.now(timezone.utc).isoformat())
+    return len(objects), stale
+
+
+def _is_missing(error: Exception) -> bool:
+    """True if a storage error means the file does not exist (retrying will not help)."""
+    # Storage reports missing objects as statusCode 404 / error 'not_found'
+    return str(getattr(error, 'status', '')) == '404' or str(getattr(error, 'code', '')).lower() == 'not_found'
+
+
+def _download(bucket, name: str, attempts: int) -> bytes:
+    """Download a file, retrying transient failures with exponential backoff."""
+    for attempt in range(attempts):
+        try:
+            return bucket.download(name)
+        except Exception as e:
+            if _is_missing(e) or attempt == attempts - 1:
+                raise
+            time.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+
+def _warm_one(supabase_client, filename: str, attempts: int) -> dict:
+    """Fetch one image and its metadata if they are not cached yet."""
+    bucket = supabase_client.storage.from_(image_handler.BUCKET_NAME)
+    outcome = {'image': 'cached', 'metadata': False, 'bytes': 0, 'errors': []}
+
+    if not os.path.exists(os.path.join(image_handler.CACHE_DIR, filename)):
+        try:
+            image_data = _download(bucket, filename, attempts)
+            image_handler.store_original(filename, image_data)  # Decodes the whole image
+            outcome['image'] = 'downloaded'
+            outcome['bytes'] += len(image_data)
+        except Exception as e:
+            outcome['image'] = 'failed'
+            outcome['errors'].append((filename, str(e)))
+            return outcome
+
+    name = image_handler.metadata_filename(filename)
+    index = image_handler.load_bucket_index()
+    if index is not None and name not in index:
+        return outcome  # The image has no metadata
+    if not os.path.exists(os.path.join(image_handler.METADATA_CACHE_DIR, name)):
+        try:
+            metadata_data = _download(bucket, name, attempts)
+            image_handler.store_metadata(filename, metadata_data)
+            outcome['metadata'] = True
+            outcome['bytes'] += len(metadata_data)
+        except Exception as e:
+            # Images without metadata are drawn unrotated
+            if not _is_missing(e):
+                outcome['errors'].append((name, str(e)))
+
+    return outcome
+
+
+def warm_image_cache(supabase_client, image_links: Iterable[Optional[str]], workers: int = WARM_WORKERS,
+                     attempts: int = WARM_ATTEMPTS) -> WarmResult:
+    """
+    Download every missing portrait and its metadata into the local cache.
+
+    Args:
+        supabase_client: Supabase client instance
+        image_links: image_link values of the deck (empty values are skipped)
+        workers: Number of concurrent downloads
+        attempts: Attempts per file before it is reported as failed
+
+    Returns:
+        WarmResult with counts and throughput
+    """
+    filenames = _filenames(image_links)
+    result = WarmResult(images=len(filenames))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="cache-warm") as pool:
+        for outcome in pool.map(lambda filename: _warm_one(supabase_client, filename, attempts), filenames):
+            result.failed += outcome['errors']
+            result.cached += outcome['image'] == 'cached'
+            result.downloaded += outcome['image'] == 'downloaded'
+            result.metadata_downloaded += outcome['metadata']
+            result.bytes_downloaded += outcome['bytes']
+    result.seconds = time.perf_counter() - start
+
+    return result
+
+
+def revalidate_image(supabase_client, image_link: Optional[str], attempts: int = WARM_ATTEMPTS) -> List[Tuple[str, str]]:
+    """
+    Download one portrait and its metadata again, replacing the cached copies.
+
+    Validates a single card without listing the whole bucket. A cached copy is
+    only replaced once its download succeeded; cached metadata is removed if
+    the bucket no longer has any.
+
+    Args:
+        supabase_client: Supabase client instance
+        image_link: image_link value of the card (nothing is done if empty)
+        attempts: Attempts per file before it is reported as failed
+
+    Returns:
+        List of (filename, error) for the files that could not be downloaded
+    """
+    failed = []
+    for filename in _filenames([image_link]):
+        bucket = supabase_client.storage.from_(image_handler.BUCKET_NAME)
+        try:
+            image_handler.store_original(filename, _download(bucket, filename, attempts))
+        except Exception as e:
+            failed.append((filename, str(e)))
+
+        name = image_handler.metadata_filename(filename)
+        try:
+            image_handler.store_metadata(filename, _download(bucket, name, attempts))
+        except Exception as e:
+            if not _is_missing(e):
+                failed.append((name, str(e)))
+                continue
+            path = os.path.join(image_handler.METADATA_CACHE_DIR, name)
+            if os.path.exists(path):
+                os.remove(path)  # Images without metadata are drawn unrotated
+    return failed
@@ -1,14 +1,125 @@
 """
 Connections table component for card back.
 """
+from dataclasses import dataclass
+from functools import lru_cache
 from reportlab.pdfgen import canvas
-from reportlab.platypus import Table, TableStyle
 from reportlab.lib import colors
 from reportlab.lib.colors import HexColor
 from reportlab.lib.units import mm
-from typing import List
+from typing import List, Optional, Tuple
 from src.types.supabase_types import DenormalizedConnection
-from src.config import CARD_WIDTH, CARD_HEIGHT, HEADER_HEIGHT, BANNER_HEIGHT, get_category_color
+from src.config import CARD_HEIGHT, HEADER_HEIGHT, BANNER_HEIGHT, get_category_color
+from src.card.text import text_width
+
+
+# Alternating row backgrounds
+ROW_COLORS = (colors.white, HexColor('#F0F0F0'))
+
+# Text is centered vertically like a table cell with a 12pt leading
+TABLE_LEADING = 12
+
+
+@dataclass(frozen=True)
+class Cell:
+    """One column of a connection entry."""
+    field: str  # 'value', 'category', 'name' or 'why'
+    width: float
+    font_name: str
+    font_size: float
+    left_padding: float
+    right_padding: float
+    centered: bool = False
+
+
+@dataclass(frozen=True)
+class TableLayout:
+    """Fixed geometry of a connections table: one or more entry sections side by side."""
+    cells: Tuple[Cell, ...]
+    sections: int
+    row_height: float
+    top_padding: float
+    separator_width: float = 0
+    max_rows: Optional[int] = None
+
+
+# Single-column detailed layout, full card width - edge to edge (total: 69mm)
+# Optimized: 4mm + 2.7mm + 17.5mm + 44.8mm = 69mm
+DETAILED_LAYOUT = TableLayout(
+    cells=(
+        Cell('value', 4 * mm, 'Helvetica-Bold', 5, 2, 2, centered=True),
+        Cell('category', 2.7 * mm, 'Helvetica', 5, 1, 1, centered=True),
+        Cell('name', 17.5 * mm, 'Helvetica', 5, 2, 4),  # Padding between name and why_short
+        Cell('why', 44.8 * mm, 'Helvetica', 4, 4, 2),
+    ),
+    sections=1,
+    row_height=2.5 * mm,
+    top_padding=6,  # Padding to ensure correct vertical alignment
+    max_rows=26,
+)
+
+# Two-column compact layout without why_short
+# Total: 3mm + 2.7mm + 26.65mm + 4mm + 3mm + 2.7mm + 26.65mm = 69mm (full card width)
+TWO_COLUMN_LAYOUT = TableLayout(
+    cells=(
+        Cell('value', 3 * mm, 'Helvetica-Bold', 4, 1, 1, centered=True),
+        Cell('category', 2.7 * mm, 'Helvetica', 4, 0.5, 0.5, centered=True),  # Extra tight padding
+        Cell('name', 26.65 * mm, 'Helvetica', 4, 1, 1),
+    ),
+    sections=2,
+    row_height=2 * mm,
+    top_padding=7,  # Padding to ensure correct vertical alignment (compact view)
+    separator_width=4 * mm,
+)
+
+# Three-column compact layout without why_short (maximum density)
+# Total: (2.5 + 2.7 + 16.3) * 3 + 2 * 2 = 68.5mm
+THREE_COLUMN_LAYOUT = TableLayout(
+    cells=(
+        Cell('value', 2.5 * mm, 'Helvetica-Bold', 4, 1, 1, centered=True),
+        Cell('category', 2.7 * mm, 'Helvetica', 4, 0.5, 0.5, centered=True),
+        Cell('name', 16.3 * mm, 'Helvetica', 4, 1, 1),
+    ),
+    sections=3,
+    row_height=2 * mm,
+    top_padding=7,
+    separator_width=2 * mm,
+)
+
+
+@dataclass(frozen=True)
+class _Grid:
+    """Precomputed positions of a layout, relative to the table's left edge."""
+    width: float
+    separators: Tuple[Tuple[float, float], ...]  # (x, width) of white separator columns
+    columns: Tuple[Tuple[int, Cell, float], ...]  # (section, cell, x of the cell)
+
+
+@lru_cache(maxsize=None)
+def _grid(layout: TableLayout) -> _Grid:
+    """Lay out the columns of a table once per layout."""
+    columns = []
+    separators = []
+    position = 0
+    for section in range(layout.sections):
+        if section:
+            separators.append((position, layout.separator_width))
+            position += layout.separator_width
+        for cell in layout.cells:
+            columns.append((section, cell, position))
+            position += cell.width
+
+    return _Grid(width=position, separators=tuple(separators), columns=tuple(columns))
+
+
+def _cell_text(conn: DenormalizedConnection, field: str) -> str:
+    if field == 'value':
+        return str(conn.value)
+    if field == 'category':
+        return conn.category_code
+    if field == 'name':
+        return conn.character_name or ""
+    return conn.why_short or ""
 
 
 def draw_connections_table(c: canvas.Canvas, connections: List[DenormalizedConnection],
@@ -64,314 +175,93 @@ def draw_connections_table(c: canvas.Canvas, connections: List[DenormalizedConne
 
     # Use detailed single-column if it fits (includes why_short descriptions)
     if rows_needed_single <= max_rows:
-        return _draw_detailed_table(c, connections, x, table_y)
+        return _draw_table(c, DETAILED_LAYOUT, connections, x, table_y)
     # Use two-column compact if it fits
     elif rows_needed_two_col <= max_rows:
-        return _draw_compact_two_column_table(c, connections, x, table_y)
+        return _draw_table(c, TWO_COLUMN_LAYOUT, connections, x, table_y)
     # Otherwise use three-column compact (most dense)
     else:
-        return _draw_compact_three_column_table(c, connections, x, table_y)
+        return _draw_table(c, THREE_COLUMN_LAYOUT, connections, x, table_y)
 
 
-def _draw_detailed_table(c: canvas.Canvas, connections: List[DenormalizedConnection],
-                        x: float, table_y: float) -> float:
+def _draw_table(c: canvas.Canvas, layout: TableLayout, connections: List[DenormalizedConnection],
+                x: float, table_y: float) -> float:
     """
-    Draw detailed single-column table with why_short (for <=26 connections).
-    """
-    table_data = []
-    for conn in connections[:26]:
-        why_text = conn.why_short or ""
-        table_data.append([
-            str(conn.value),
-            conn.category_code,
-            conn.character_name or "",
-            why_text
-        ])
-
-    # Full card width - edge to edge (total: 69mm)
-    # Optimized: 4mm + 2.7mm + 17.5mm + 44.8mm = 69mm
-    row_height = 2.5 * mm
-    row_heights = [row_height] * len(table_data)
-    table = Table(table_data, colWidths=[4 * mm, 2.7 * mm, 17.5 * mm, 44.8 * mm], rowHeights=row_heights)
-
-    # Style the table
-    table_style = TableStyle([
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 5),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-        ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-
-        ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, HexColor('#F0F0F0')]),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),  # Padding to ensure correct vertical alignment
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-        # Reduce category column padding to 1pt
-        ('LEFTPADDING', (1, 0), (1, -1), 1),
-        ('RIGHTPADDING', (1, 0), (1, -1), 1),
-        # Add padding between name and why_short columns
-        ('RIGHTPADDING', (2, 0), (2, -1), 4),
-        ('LEFTPADDING', (3, 0), (3, -1), 4),
-        ('WORDWRAP', (0, 0), (-1, -1), True),
-    ])
-
-    # Add category colors
-    for i, conn in enumerate(connections[:26]):
-        cat_color = get_category_color(conn.category_code)
-        table_style.add('BACKGROUND', (1, i), (1, i), cat_color)
-        table_style.add('TEXTCOLOR', (1, i), (1, i), colors.white)
-
-    # Set font sizes and styles
-    table_style.add('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold')  # Score column - bold
-    table_style.add('FONTSIZE', (2, 0), (2, -1), 5)  # Name column
-    table_style.add('FONTSIZE', (3, 0), (3, -1), 4)  # Why_short column
-
-    table.setStyle(table_style)
-
-    # Draw table
-    table.wrapOn(c, CARD_WIDTH, 1000)
-    bottom_y = table_y - len(table_data) * row_height
-    table.drawOn(c, x, bottom_y)
-
-    return bottom_y
-
+    Draw connections in a fixed-geometry table, straight onto the canvas.
 
-def _draw_compact_two_column_table(c: canvas.Canvas, connections: List[DenormalizedConnection],
-                                   x: float, table_y: float) -> float:
-    """
-    Draw compact 2-column table without why_short (for >26 connections).
-    Ordered top to bottom, then left to right.
-    Includes vertical white stripe separator between columns.
-    """
-    # Split connections into two columns, ordered top-to-bottom
-    num_per_column = (len(connections) + 1) // 2  # Round up for left column
-    left_connections = connections[:num_per_column]
-    right_connections = connections[num_per_column:]
-
-    # Build table data - each row has left and right connection with separator
-    table_data = []
-    for i in range(num_per_column):
-        left_conn = left_connections[i]
-        left_row = [
-            str(left_conn.value),
-            left_conn.category_code,
-            left_conn.character_name or ""
-        ]
-
-        # Right side (may be empty for last row if odd number of connections)
-        if i < len(right_connections):
-            right_conn = right_connections[i]
-            right_row = [
-                str(right_conn.value),
-                right_conn.category_code,
-                right_conn.character_name or ""
-            ]
-        else:
-            right_row = ["", "", ""]
-
-        # Add white separator column between left and right
-        table_data.append(left_row + [""] + right_row)
-
-    # Column widths: value(3mm) + cat(2.7mm) + name(26.65mm) + separator(4mm) = 36.35mm left + 4mm sep + 28.65mm right
-    # Total: 3mm + 2.7mm + 26.65mm + 4mm + 3mm + 2.7mm + 26.65mm = 69mm (full card width)
-    col_widths = [3 * mm, 2.7 * mm, 26.65 * mm, 4 * mm, 3 * mm, 2.7 * mm, 26.65 * mm]
-
-    # Smaller row height for compact layout
-    row_height = 2 * mm
-    row_heights = [row_height] * len(table_data)
-    table = Table(table_data, colWidths=col_widths, rowHeights=row_heights)
-
-    # Style the table
-    table_style = TableStyle([
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 4),  # Smaller font for compact layout
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (0, -1), 'CENTER'),  # Left value column
-        ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # Left category column
-        ('ALIGN', (4, 0), (4, -1), 'CENTER'),  # Right value column (after separator)
-        ('ALIGN', (5, 0), (5, -1), 'CENTER'),  # Right category column (after separator)
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-
-        ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, HexColor('#F0F0F0')]),
-        ('LEFTPADDING', (0, 0), (-1, -1), 1),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 1),
-        ('TOPPADDING', (0, 0), (-1, -1), 7),  # Padding to ensure correct vertical alignment (compact view)
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-        # Extra tight padding for category columns
-        ('LEFTPADDING', (1, 0), (1, -1), 0.5),
-        ('RIGHTPADDING', (1, 0), (1, -1), 0.5),
-        ('LEFTPADDING', (5, 0), (5, -1), 0.5),
-        ('RIGHTPADDING', (5, 0), (5, -1), 0.5),
-        # White separator column (column 3) - no padding
-        ('LEFTPADDING', (3, 0), (3, -1), 0),
-        ('RIGHTPADDING', (3, 0), (3, -1), 0),
-        ('BACKGROUND', (3, 0), (3, -1), colors.white),  # Always white
-    ])
-
-    # Add category colors for both columns
-    for i in range(len(table_data)):
-        # Left column
-        if i < len(left_connections):
-            left_conn = left_connections[i]
-            cat_color = get_category_color(left_conn.category_code)
-            table_style.add('BACKGROUND', (1, i), (1, i), cat_color)
-            table_style.add('TEXTCOLOR', (1, i), (1, i), colors.white)
-
-        # Right column (after separator at column 3)
-        if i < len(right_connections):
-            right_conn = right_connections[i]
-            cat_color = get_category_color(right_conn.category_code)
-            table_style.add('BACKGROUND', (5, i), (5, i), cat_color)
-            table_style.add('TEXTCOLOR', (5, i), (5, i), colors.white)
-
-    # Make score columns bold
-    table_style.add('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold')  # Left score column
-    table_style.add('FONTNAME', (4, 0), (4, -1), 'Helvetica-Bold')  # Right score column (after separator)
-
-    table.setStyle(table_style)
-
-    # Draw table
-    table.wrapOn(c, CARD_WIDTH, 1000)
-    bottom_y = table_y - len(table_data) * row_height
-    table.drawOn(c, x, bottom_y)
+    Connections are ordered top to bottom, then left to right across the
+    sections. Backgrounds are drawn first, then each column as one text object.
 
-    return bottom_y
-
-
-def _draw_compact_three_column_table(c: canvas.Canvas, connections: List[DenormalizedConnection],
-                                     x: float, table_y: float) -> float:
-    """
-    Draw compact 3-column table without why_short (for 73+ connections).
-    Ordered top to bottom, then left to right.
-    Maximum capacity: ~108 connections (36 rows × 3 columns).
-    Includes vertical white stripe separators between columns.
+    Returns:
+        Y position of bottom of table
     """
-    # Split connections into three columns, ordered top-to-bottom
-    num_per_column = (len(connections) + 2) // 3  # Round up for left column
-    left_connections = connections[:num_per_column]
-    middle_connections = connections[num_per_column:2*num_per_column]
-    right_connections = connections[2*num_per_column:]
-
-    # Build table data - each row has left, middle, and right connection with separators
-    table_data = []
-    for i in range(num_per_column):
-        # Left column
-        left_conn = left_connections[i]
-        left_row = [
-            str(left_conn.value),
-            left_conn.category_code,
-            left_conn.character_name or ""
-        ]
-
-        # Middle column (may be empty for last rows if not evenly divisible by 3)
-        if i < len(middle_connections):
-            middle_conn = middle_connections[i]
-            middle_row = [
-                str(middle_conn.value),
-                middle_conn.category_code,
-                middle_conn.character_name or ""
-            ]
-        else:
-            middle_row = ["", "", ""]
-
-        # Right column (may be empty for last rows if not evenly divisible by 3)
-        if i < len(right_connections):
-            right_conn = right_connections[i]
-            right_row = [
-                str(right_conn.value),
-                right_conn.category_code,
-                right_conn.character_name or ""
-            ]
-        else:
-            right_row = ["", "", ""]
-
-        # Add white separator columns between left/middle and middle/right
-        table_data.append(left_row + [""] + middle_row + [""] + right_row)
-
-    # Column widths: value(2.5mm) + cat(2.7mm) + name(16mm) + sep(2mm) = 21.2mm per section + 2mm separators
-    # Total: (2.5 + 2.7 + 16) + 2 + (2.5 + 2.7 + 16) + 2 + (2.5 + 2.7 + 16) = 21.2 + 2 + 21.2 + 2 + 21.2 = 67.6mm
-    # Adjusted: Add 1.4mm distributed to name columns (0.47mm each ~ 0.5mm each) = 69mm total
-    col_widths = [2.5 * mm, 2.7 * mm, 16.3 * mm,  # Left column
-                  2 * mm,                           # Separator 1
-                  2.5 * mm, 2.7 * mm, 16.3 * mm,  # Middle column
-                  2 * mm,                           # Separator 2
-                  2.5 * mm, 2.7 * mm, 16.3 * mm]  # Right column
-
-    # Smaller row height for compact layout
-    row_height = 2 * mm
-    row_heights = [row_height] * len(table_data)
-    table = Table(table_data, colWidths=col_widths, rowHeights=row_heights)
-
-    # Style the table
-    table_style = TableStyle([
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 4),  # Smaller font for compact layout
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        # Center align value and category columns
-        ('ALIGN', (0, 0), (0, -1), 'CENTER'),  # Left value column
-        ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # Left category column
-        ('ALIGN', (4, 0), (4, -1), 'CENTER'),  # Middle value column (after separator)
-        ('ALIGN', (5, 0), (5, -1), 'CENTER'),  # Middle category column (after separator)
-        ('ALIGN', (8, 0), (8, -1), 'CENTER'),  # Right value column (after separator)
-        ('ALIGN', (9, 0), (9, -1), 'CENTER'),  # Right category column (after separator)
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-
-        ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, HexColor('#F0F0F0')]),
-        ('LEFTPADDING', (0, 0), (-1, -1), 1),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 1),
-        ('TOPPADDING', (0, 0), (-1, -1), 7),  # Padding to ensure correct vertical alignment (compact view)
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-        # Extra tight padding for category columns
-        ('LEFTPADDING', (1, 0), (1, -1), 0.5),
-        ('RIGHTPADDING', (1, 0), (1, -1), 0.5),
-        ('LEFTPADDING', (5, 0), (5, -1), 0.5),
-        ('RIGHTPADDING', (5, 0), (5, -1), 0.5),
-        ('LEFTPADDING', (9, 0), (9, -1), 0.5),
-        ('RIGHTPADDING', (9, 0), (9, -1), 0.5),
-        # White separator columns (columns 3 and 7) - no padding
-        ('LEFTPADDING', (3, 0), (3, -1), 0),
-        ('RIGHTPADDING', (3, 0), (3, -1), 0),
-        ('BACKGROUND', (3, 0), (3, -1), colors.white),  # Separator 1 - always white
-        ('LEFTPADDING', (7, 0), (7, -1), 0),
-        ('RIGHTPADDING', (7, 0), (7, -1), 0),
-        ('BACKGROUND', (7, 0), (7, -1), colors.white),  # Separator 2 - always white
-    ])
-
-    # Add category colors for all three columns
-    for i in range(len(table_data)):
-        # Left column
-        if i < len(left_connections):
-            left_conn = left_connections[i]
-            cat_color = get_category_color(left_conn.category_code)
-            table_style.add('BACKGROUND', (1, i), (1, i), cat_color)
-            table_style.add('TEXTCOLOR', (1, i), (1, i), colors.white)
-
-        # Middle column (after separator at column 3)
-        if i < len(middle_connections):
-            middle_conn = middle_connections[i]
-            cat_color = get_category_color(middle_conn.category_code)
-            table_style.add('BACKGROUND', (5, i), (5, i), cat_color)
-            table_style.add('TEXTCOLOR', (5, i), (5, i), colors.white)
-
-        # Right column (after separator at column 7)
-        if i < len(right_connections):
-            right_conn = right_connections[i]
-            cat_color = get_category_color(right_conn.category_code)
-            table_style.add('BACKGROUND', (9, i), (9, i), cat_color)
-            table_style.add('TEXTCOLOR', (9, i), (9, i), colors.white)
-
-    # Make score columns bold
-    table_style.add('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold')  # Left score column
-    table_style.add('FONTNAME', (4, 0), (4, -1), 'Helvetica-Bold')  # Middle score column (after separator)
-    table_style.add('FONTNAME', (8, 0), (8, -1), 'Helvetica-Bold')  # Right score column (after separator)
-
-    table.setStyle(table_style)
-
-    # Draw table
-    table.wrapOn(c, CARD_WIDTH, 1000)
-    bottom_y = table_y - len(table_data) * row_height
-    table.drawOn(c, x, bottom_y)
+    if layout.max_rows:
+        connections = connections[:layout.max_rows]
+    grid = _grid(layout)
+    row_height = layout.row_height
+
+    # Split connections into sections, ordered top-to-bottom (round up for the left one)
+    num_rows = -(-len(connections) // layout.sections)
+    sections = [connections[i * num_rows:(i + 1) * num_rows] for i in range(layout.sections)]
+    bottom_y = table_y - num_rows * row_height
+
+    c.saveState()
+    c.translate(x, bottom_y)
+
+    # Rectangles are drawn down from the top of each row, in the order a table
+    # paints them, so antialiased edges between neighbouring cells match
+    def row_top(row: int) -> float:
+        return (num_rows - row) * row_height
+
+    # Row backgrounds, alternating from the top row
+    for row in range(num_rows):
+        c.setFillColor(ROW_COLORS[row % 2])
+        c.rect(0, row_top(row), grid.width, -row_height, fill=1, stroke=0)
+
+    # White separator columns between sections
+    if grid.separators:
+        c.setFillColor(colors.white)
+        for separator_x, separator_width in grid.separators:
+            c.rect(separator_x, row_top(0), separator_width, -num_rows * row_height, fill=1, stroke=0)
+
+    # Category cell backgrounds (connections are sorted by category, so the color rarely changes)
+    fill_color = None
+    for section, cell, cell_x in grid.columns:
+        if cell.field != 'category':
+            continue
+        for row, conn in enumerate(sections[section]):
+            category_color = get_category_color(conn.category_code)
+            if category_color != fill_color:
+                c.setFillColor(category_color)
+                fill_color = category_color
+            c.rect(cell_x, row_top(row), cell.width, -row_height, fill=1, stroke=0)
+
+    # Text, one text object per column (category codes in white)
+    for section, cell, cell_x in grid.columns:
+        if not sections[section]:
+            continue
+
+        text = c.beginText()
+        text.setFont(cell.font_name, cell.font_size, TABLE_LEADING)
+        text.setFillColor(colors.white if cell.field == 'category' else colors.black)
+
+        # Vertically centered in the row, below the top padding
+        text_y = (row_height - layout.top_padding + TABLE_LEADING) / 2 - cell.font_size
+        center_x = cell_x + (cell.width + cell.left_padding - cell.right_padding) * 0.5
+
+        for row, conn in enumerate(sections[section]):
+            value = _cell_text(conn, cell.field)
+            if not value:
+                continue
+            if cell.centered:
+                text_x = center_x - 0.5 * text_width(value, cell.font_name, cell.font_size)
+            else:
+                text_x = cell_x + cell.left_padding
+            text.setTextOrigin(text_x, row_top(row + 1) + text_y)
+            text.textOut(value)
+
+        c.drawText(text)
+
+    c.restoreState()
 
     return bottom_y
@@ -10,6 +10,39 @@ from src.config import (
     get_category_name
 )
 from src.card.utils import draw_wrapped_text, draw_text_with_outline
+from src.card.text import text_width, fit_length
+from src.card.forms import draw_form, form_name
+
+# Category box in the top right of the header
+CATEGORY_BOX_WIDTH = 30  # 14mm base + 1mm total padding (8mm left + 8mm right)
+CATEGORY_BOX_PADDING = 8  # 8mm padding on each side
+
+
+def draw_category_box(c: canvas.Canvas, category_code: str, category_color: HexColor):
+    """Draw the category box with its outlined category code relative to the card origin."""
+    card_num_box_height = HEADER_HEIGHT
+
+    c.setFillColor(category_color)
+    c.rect(
+        CARD_WIDTH - CATEGORY_BOX_WIDTH,
+        CARD_HEIGHT - card_num_box_height,
+        CATEGORY_BOX_WIDTH,
+        card_num_box_height,
+        fill=1,
+        stroke=0
+    )
+
+    # Draw category code centered in box (accounting for padding)
+    c.setFont("Helvetica-Bold", 14)
+    card_id_width = text_width(category_code, "Helvetica-Bold", 14)
+
+    # Center horizontally in the available space (box width minus padding) and vertically in box
+    available_width = CATEGORY_BOX_WIDTH - (2 * CATEGORY_BOX_PADDING)
+    card_id_x = CARD_WIDTH - CATEGORY_BOX_WIDTH + CATEGORY_BOX_PADDING + (available_width - card_id_width) / 2
+    card_id_y = CARD_HEIGHT - card_num_box_height / 2 - 5
+
+    # Draw with outline
+    draw_text_with_outline(c, category_code, card_id_x, card_id_y, "Helvetica-Bold", 14)
 
 
 def draw_back_header(c: canvas.Canvas, character: Character, x: float, y: float, category_color: HexColor):
@@ -31,11 +64,10 @@ def draw_back_header(c: canvas.Canvas, character: Character, x: float, y: float,
         category_color: Color for the category box and header background
     """
     category_name = get_category_name(character.type)
-    category_box_width = 30  # 14mm base + 1mm total padding (8mm left + 8mm right)
-    category_box_padding = 8  # 8mm padding on each side
-    card_num_box_height = HEADER_HEIGHT
+    category_code = f"{character.type or 'X'}"
 
     # Draw header section with category color at 75% opacity (actually 50% in implementation)
+    # NOTE: Kept inline, ReportLab does not attach the alpha ExtGState to form XObjects
     c.setFillColorRGB(
         category_color.red,
         category_color.green,
@@ -45,7 +77,7 @@ def draw_back_header(c: canvas.Canvas, character: Character, x: float, y: float,
     c.rect(x, y + CARD_HEIGHT - HEADER_HEIGHT, CARD_WIDTH, HEADER_HEIGHT, fill=1, stroke=0)
 
     # Calculate max text width excluding category box
-    max_header_text_width = CARD_WIDTH - (2 * MARGIN) - category_box_width
+    max_header_text_width = CARD_WIDTH - (2 * MARGIN) - CATEGORY_BOX_WIDTH
 
     # Draw character name at top of header
     c.setFillColor(colors.black)
@@ -68,7 +100,7 @@ def draw_back_header(c: canvas.Canvas, character: Character, x: float, y: float,
             # Draw name part
             c.setFont("Helvetica-Bold", 9)
             name_upper = name.upper()
-            name_width = c.stringWidth(f"{name_upper}, ", "Helvetica-Bold", 9)
+            name_width = text_width(f"{name_upper}, ", "Helvetica-Bold", 9)
             c.drawString(x + MARGIN, name_y, f"{name_upper},")
 
             # Draw first names part with smaller font
@@ -83,14 +115,12 @@ def draw_back_header(c: canvas.Canvas, character: Character, x: float, y: float,
     # Draw dates | category directly under name (constrained width)
     c.setFont("Helvetica", 6)
     dates = f"{character.birth_date or ''}-{character.death_date or ''}"
-    dates_category_text = f"{dates} | {category_name}"
     dates_category_y = name_y - 10  # Directly under name
 
-    # Truncate category if dates + category too long
-    category_display = category_name
-    while c.stringWidth(dates_category_text, "Helvetica", 6) > max_header_text_width and len(category_display) > 5:
-        category_display = category_display[:-1]
-        dates_category_text = f"{dates} | {category_display}"
+    # Truncate category if dates + category too long (keeping at least 5 characters)
+    category_length = fit_length(category_name, "Helvetica", 6, max_header_text_width,
+                                 prefix=f"{dates} | ", min_length=5)
+    dates_category_text = f"{dates} | {category_name[:category_length]}"
 
     c.drawString(x + MARGIN, dates_category_y, dates_category_text)
 
@@ -109,26 +139,9 @@ def draw_back_header(c: canvas.Canvas, character: Character, x: float, y: float,
             truncate_with_ellipsis=True
         )
 
-    # Draw category box (top right)
-    c.setFillColor(category_color)
-    c.rect(
-        x + CARD_WIDTH - category_box_width,
-        y + CARD_HEIGHT - card_num_box_height,
-        category_box_width,
-        card_num_box_height,
-        fill=1,
-        stroke=0
+    # Draw category box (top right), drawn last so it covers overlong names
+    draw_form(
+        c, form_name("Cat", category_code, category_color.hexval()),
+        lambda form: draw_category_box(form, category_code, category_color),
+        x, y
     )
-
-    # Draw category code centered in box (accounting for padding)
-    c.setFont("Helvetica-Bold", 14)
-    card_id = f"{character.type or 'X'}"
-    card_id_width = c.stringWidth(card_id, "Helvetica-Bold", 14)
-
-    # Center horizontally in the available space (box width minus padding) and vertically in box
-    available_width = category_box_width - (2 * category_box_padding)
-    card_id_x = x + CARD_WIDTH - category_box_width + category_box_padding + (available_width - card_id_width) / 2
-    card_id_y = y + CARD_HEIGHT - card_num_box_height / 2 - 5
-
-    # Draw with outline
-    draw_text_with_outline(c, card_id, card_id_x, card_id_y, "Helvetica-Bold", 14)
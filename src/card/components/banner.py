@@ -5,6 +5,7 @@ from reportlab.pdfgen import canvas
 from reportlab.lib.colors import HexColor
 from src.config import CARD_WIDTH, BANNER_HEIGHT, MARGIN
 from src.card.utils import wrap_text, draw_text_with_outline
+from src.card.text import text_width
 
 
 def draw_banner(c: canvas.Canvas, name: str, x: float, y: float, category_color: HexColor):
@@ -44,8 +45,8 @@ def draw_banner(c: canvas.Canvas, name: str, x: float, y: float, category_color:
     text_y_offset = banner_y + BANNER_HEIGHT / 2 - (len(name_lines) * font_size) / 2 + 2
 
     for line in name_lines[:2]:  # Max 2 lines
-        text_width = c.stringWidth(line, "Helvetica-Bold", font_size)
-        text_x = x + (CARD_WIDTH - text_width) / 2
+        line_width = text_width(line, "Helvetica-Bold", font_size)
+        text_x = x + (CARD_WIDTH - line_width) / 2
 
         # Draw with outline
         draw_text_with_outline(c, line, text_x, text_y_offset, "Helvetica-Bold", font_size)
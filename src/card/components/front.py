@@ -5,12 +5,35 @@ from reportlab.pdfgen import canvas
 from reportlab.lib.colors import HexColor
 from src.types.supabase_types import Character
 from src.config import CARD_WIDTH, CARD_HEIGHT, BANNER_HEIGHT, CORNER_RADIUS, get_category_color
-from src.card.image_handler import download_image_from_supabase
+from typing import Optional
+from src.card.image_handler import get_print_image, PrintImage
 from src.card.components.banner import draw_banner
 from src.card.utils import draw_rounded_rect, clip_to_rounded_rect
+from src.card.forms import draw_form, form_name
 
 
-def draw_card_front_image(c: canvas.Canvas, character: Character, x: float, y: float, supabase_client):
+# Default of the `image` arguments: the portrait was not prepared ahead of drawing
+# (unlike None, which means it was prepared and there is none)
+NOT_PREPARED = object()
+
+
+def draw_card_front_background(c: canvas.Canvas, corner_radius: float):
+    """Draw the grey rounded card background at the origin."""
+    c.setFillColor(HexColor('#cccccc'))
+    c.setStrokeColor(HexColor('#cccccc'))  # Match stroke to fill to hide border
+    c.setLineWidth(0)  # Remove border
+    draw_rounded_rect(c, 0, 0, CARD_WIDTH, CARD_HEIGHT, corner_radius, fill=1, stroke=0)
+
+
+def get_card_front_image(character: Character, supabase_client, scale: float = 1.0) -> Optional[PrintImage]:
+    """Get the pre-rotated portrait for a card front, downsampled to print resolution for the printed card size."""
+    if not character.image_link:
+        return None
+    return get_print_image(supabase_client, character.image_link, CARD_WIDTH * scale, CARD_HEIGHT * scale)
+
+
+def draw_card_front_image(c: canvas.Canvas, character: Character, x: float, y: float, supabase_client, scale: float = 1.0,
+                          image: Optional[PrintImage] = NOT_PREPARED):
     """
     Draw the portrait image on the card front.
 
@@ -24,19 +47,21 @@ def draw_card_front_image(c: canvas.Canvas, character: Character, x: float, y: f
         character: Character data (contains image_link)
         x: X position of card bottom-left corner
         y: Y position of card bottom-left corner
-        supabase_client: Supabase client for downloading images
+        supabase_client: Supabase client for downloading images (None = local image cache only)
+        scale: Scale factor of the card, used to size the print-resolution image
+        image: Portrait prepared ahead of drawing (see get_card_front_image; None if there is none);
+               fetched here if not given
     """
-    if not character.image_link or not supabase_client:
+    if not character.image_link:
         return
 
-    img = download_image_from_supabase(supabase_client, character.image_link)
+    img = get_card_front_image(character, supabase_client, scale) if image is NOT_PREPARED else image
     if not img:
         return
 
     try:
-        # Get original image dimensions
-        img_obj = img._image  # Access the PIL Image object
-        orig_width, orig_height = img_obj.size
+        # Get image dimensions (from the JPEG header, no decoding needed)
+        orig_width, orig_height = img.width, img.height
         orig_aspect = orig_width / orig_height
 
         # Fit image within card while preserving aspect ratio
@@ -73,21 +98,23 @@ def draw_card_front_image(c: canvas.Canvas, character: Character, x: float, y: f
             # Image is landscape or matches target - center between card top and banner top
             img_y = banner_top_y + (available_height - final_height) / 2
 
+        # JPEG paths are embedded as is; JPEGs have no alpha channel, so no mask is needed
         c.drawImage(
-            img,
+            img.source,
             img_x,
             img_y,
             width=final_width,
             height=final_height,
             preserveAspectRatio=True,
-            mask='auto'
+            mask=None if img.passthrough else 'auto'
         )
     except Exception as e:
         print(f"Failed to draw image for {character.name}: {e}")
 
 
 def draw_card_front_content(c: canvas.Canvas, character: Character, x: float, y: float,
-                           category_color: HexColor, supabase_client=None, corner_radius: float = None):
+                           category_color: HexColor, supabase_client=None, corner_radius: float = None,
+                           scale: float = 1.0, image: Optional[PrintImage] = NOT_PREPARED):
     """
     Draw the complete card front: background, image, and banner.
 
@@ -99,23 +126,25 @@ def draw_card_front_content(c: canvas.Canvas, character: Character, x: float, y:
         category_color: Color for the banner
         supabase_client: Supabase client for downloading images (optional)
         corner_radius: Corner radius for rounded edges (default: CORNER_RADIUS from config)
+        scale: Scale factor the card is drawn at (only used to size the portrait)
+        image: Portrait prepared ahead of drawing (optional, None if there is none; fetched on demand otherwise)
     """
     if corner_radius is None:
         corner_radius = CORNER_RADIUS
 
-    # Draw card background with rounded corners
-    c.setFillColor(HexColor('#cccccc'))
-    c.setStrokeColor(HexColor('#cccccc'))  # Match stroke to fill to hide border
-    c.setLineWidth(0)  # Remove border
-    draw_rounded_rect(c, x, y, CARD_WIDTH, CARD_HEIGHT, corner_radius, fill=1, stroke=0)
+    # Draw card background with rounded corners (one shared form per corner radius)
+    draw_form(
+        c, form_name("Front", corner_radius),
+        lambda form: draw_card_front_background(form, corner_radius),
+        x, y
+    )
 
     # Set clipping path to rounded rectangle so image and banner respect the rounded corners
     c.saveState()
     clip_to_rounded_rect(c, x, y, CARD_WIDTH, CARD_HEIGHT, corner_radius)
 
-    # Draw portrait image
-    if supabase_client:
-        draw_card_front_image(c, character, x, y, supabase_client)
+    # Draw portrait image (from the local cache only when there is no client)
+    draw_card_front_image(c, character, x, y, supabase_client, scale, image)
 
     # Draw banner with name
     draw_banner(c, character.name, x, y, category_color)
@@ -0,0 +1,47 @@
+"""
+Reusable PDF form XObjects for static card elements.
+
+Elements that look the same on many cards (rounded backgrounds, the back
+header boxes per category, crop marks) are drawn once per document as a
+form XObject and then placed with doForm, so each page's content stream only
+holds a reference to them.
+"""
+from typing import Callable, Tuple
+from reportlab.pdfgen import canvas
+from src.config import CARD_WIDTH, CARD_HEIGHT
+
+
+def form_name(*parts) -> str:
+    """Build a form name from its parameters (floats rounded to 1/100 point)."""
+    return "_".join(f"{part:.2f}" if isinstance(part, float) else str(part) for part in parts)
+
+
+def draw_form(c: canvas.Canvas, name: str, draw: Callable[[canvas.Canvas], None], x: float = 0, y: float = 0,
+              bbox: Tuple[float, float, float, float] = (0, 0, CARD_WIDTH, CARD_HEIGHT)):
+    """
+    Draw a static element through a named form XObject.
+
+    The form is defined the first time its name is used in a document; later
+    calls only place it. The name must therefore capture everything the
+    drawing depends on (category, corner radius, scale, ...).
+
+    Args:
+        c: ReportLab canvas
+        name: Unique form name (see form_name)
+        draw: Callable drawing the element relative to the origin
+        x: X position of the element origin
+        y: Y position of the element origin
+        bbox: Form bounding box (lower x, lower y, upper x, upper y) relative to the origin
+    """
+    if not c.hasForm(name):
+        c.beginForm(name, *bbox)
+        draw(c)
+        c.endForm()
+
+    if x or y:
+        c.saveState()
+        c.translate(x, y)
+        c.doForm(name)
+        c.restoreState()
+    else:
+        c.doForm(name)
@@ -4,9 +4,240 @@ Image downloading and caching for card generation.
 import os
 import io
 import json
+import hashlib
+import threading
+from dataclasses import dataclass
 from PIL import Image
 from reportlab.lib.utils import ImageReader
-from typing import Optional
+from reportlab.pdfbase.pdfutils import readJPEGInfo
+from typing import Dict, Optional, Tuple, Union
+from src.config import IMAGE_DPI
+
+
+# Cache directory at project root
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'image_cache')
+
+# Print-resolution derivatives of the cached originals
+PRINT_CACHE_DIR = os.path.join(CACHE_DIR, 'print')
+
+# JSON metadata (orientation etc.) of the cached originals
+METADATA_CACHE_DIR = os.path.join(CACHE_DIR, 'metadata')
+
+# Storage bucket holding the portraits and their metadata
+BUCKET_NAME = 'character_images'
+
+# Validators (ETag or updated_at) of the bucket objects from the last listing
+BUCKET_INDEX_NAME = 'bucket_index.json'
+
+# JPEG quality for derivatives
+DERIVATIVE_JPEG_QUALITY = 90
+
+# Source hashes by (path, mtime, size), so each original is hashed once per process
+_source_hashes: Dict[Tuple[str, float, int], str] = {}
+
+# Last loaded bucket index by (path, mtime), so it is parsed once per process
+_bucket_indexes: Dict[Tuple[str, float], Dict[str, str]] = {}
+
+
+@dataclass
+class PrintImage:
+    """A portrait ready to draw: a JPEG file path (embedded as is) or a decoded image."""
+    source: Union[str, ImageReader]
+    width: int
+    height: int
+
+    @property
+    def passthrough(self) -> bool:
+        """True if the JPEG data is embedded directly, without decoding."""
+        return isinstance(self.source, str)
+
+
+def read_jpeg_info(path: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Read (width, height, components) from a JPEG's SOF header without decoding it.
+
+    Returns None if the file is not a JPEG that can be embedded directly.
+    """
+    if os.path.splitext(path)[1].lower() not in ('.jpg', '.jpeg'):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            width, height, components, _ = readJPEGInfo(f)
+        return width, height, components
+    except Exception:
+        return None
+
+
+def metadata_filename(filename: str) -> str:
+    """Name of the JSON metadata file stored next to an image in the bucket."""
+    return os.path.splitext(filename)[0] + '.json'
+
+
+def _write_atomic(path: str, data: bytes):
+    """Write a file under a temporary name first so concurrent readers never see a partial file."""
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def store_metadata(filename: str, metadata_data: bytes) -> dict:
+    """Validate downloaded metadata and save it to the local metadata cache."""
+    metadata = json.loads(metadata_data.decode('utf-8'))
+    os.makedirs(METADATA_CACHE_DIR, exist_ok=True)
+    _write_atomic(os.path.join(METADATA_CACHE_DIR, metadata_filename(filename)), metadata_data)
+    return metadata
+
+
+def store_original(filename: str, image_data: bytes) -> str:
+    """
+    Decode a downloaded image and save it to the cache as an RGB original.
+
+    Decoding the whole image validates the download; truncated or corrupt
+    files raise instead of being cached.
+
+    Returns:
+        Cache path of the original
+    """
+    img = Image.open(io.BytesIO(image_data))
+    img.load()
+
+    # Convert to RGB if needed
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+
+    # Save the ORIGINAL image to cache (before any mutations)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    cache_path = os.path.join(CACHE_DIR, filename)
+    buffer = io.BytesIO()
+    img.save(buffer, format=Image.registered_extensions().get(os.path.splitext(filename)[1].lower(), 'JPEG'))
+    _write_atomic(cache_path, buffer.getvalue())
+    return cache_path
+
+
+def bucket_index_path() -> str:
+    return os.path.join(CACHE_DIR, BUCKET_INDEX_NAME)
+
+
+def load_bucket_index() -> Optional[Dict[str, str]]:
+    """
+    Get the validator of every bucket object as of the last listing.
+
+    Returns:
+        Dict of object name to validator, or None if the bucket was never listed
+    """
+    path = bucket_index_path()
+    try:
+        key = (path, os.stat(path).st_mtime)
+    except OSError:
+        return None
+
+    if key not in _bucket_indexes:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                objects = json.load(f)['objects']
+        except (OSError, ValueError, KeyError):
+            return None
+        _bucket_indexes.clear()
+        _bucket_indexes[key] = objects
+
+    return _bucket_indexes[key]
+
+
+def save_bucket_index(objects: Dict[str, str], listed_at: str):
+    """Save the validators from a bucket listing."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    data = json.dumps({'listed_at': listed_at, 'objects': objects}, indent=1, sort_keys=True)
+    _write_atomic(bucket_index_path(), data.encode('utf-8'))
+
+
+def _download_metadata(supabase_client, filename: str) -> Optional[dict]:
+    """
+    Get the JSON metadata (orientation etc.) of an image, from the local cache or the bucket.
+
+    With a client, the cached copy is only used if the last bucket listing
+    validated it (see cache_warmer.refresh_bucket_index); otherwise it is
+    downloaded again, so metadata edited in the bucket is picked up.
+    """
+    name = metadata_filename(filename)
+    index = load_bucket_index()
+    cached_path = os.path.join(METADATA_CACHE_DIR, name)
+    if os.path.exists(cached_path) and (supabase_client is None or (index is not None and name in index)):
+        try:
+            with open(cached_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass  # Damaged cache entry, download it again
+
+    if supabase_client is None:
+        return None
+
+    # The last listing tells which images have no metadata, saving a request each
+    if index is not None and name not in index:
+        return None
+
+    try:
+        bucket = supabase_client.storage.from_(BUCKET_NAME)
+        return store_metadata(filename, bucket.download(name))
+    except Exception as e:
+        print(f"Could not download metadata for {filename}: {e}")
+        return None
+
+
+def _ensure_cached(supabase_client, filename: str) -> Optional[str]:
+    """Return the cache path of an original image, downloading it first if needed."""
+    cache_path = os.path.join(CACHE_DIR, filename)
+
+    # Check if image exists in cache
+    if not os.path.exists(cache_path):
+        if supabase_client is None:
+            print(f"Image not in local cache: {filename}")
+            return None
+
+        # Image not in cache - download from Supabase
+        bucket = supabase_client.storage.from_(BUCKET_NAME)
+        store_original(filename, bucket.download(filename))
+        print(f"Cached original image: {filename}")
+
+    return cache_path
+
+
+def _source_hash(path: str) -> str:
+    """Return the SHA-1 of a cached original (memoized while the file is unchanged)."""
+    stat = os.stat(path)
+    key = (path, stat.st_mtime, stat.st_size)
+
+    if key not in _source_hashes:
+        sha1 = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha1.update(chunk)
+        _source_hashes[key] = sha1.hexdigest()
+
+    return _source_hashes[key]
+
+
+def _rotation(metadata: Optional[dict]) -> int:
+    """Clockwise rotation in degrees for an image, from its metadata."""
+    return 90 if metadata and metadata.get('orientation') == 'landscape' else 0
+
+
+def image_fingerprint(image_path: Optional[str]) -> str:
+    """
+    Identify the cached portrait a card would be drawn with, without any download.
+
+    Returns:
+        Content hash and rotation of the cached original, 'none' without an
+        image link, or 'missing' if the original is not cached
+    """
+    filename = os.path.basename(image_path.strip()) if image_path else ''
+    if not filename:
+        return 'none'
+
+    cache_path = os.path.join(CACHE_DIR, filename)
+    if not os.path.exists(cache_path):
+        return 'missing'
+    return f"{_source_hash(cache_path)}_r{_rotation(_download_metadata(None, filename))}"
 
 
 def download_image_from_supabase(supabase_client, image_path: Optional[str]) -> Optional[ImageReader]:
@@ -14,7 +245,7 @@ def download_image_from_supabase(supabase_client, image_path: Optional[str]) ->
     Download image from Supabase storage bucket with local caching.
 
     Args:
-        supabase_client: Supabase client instance
+        supabase_client: Supabase client instance, or None to use only the local cache
         image_path: Path from image_link column (e.g., 'data/images/washington.jpg' or 'Newton.jpg')
 
     Returns:
@@ -24,6 +255,9 @@ def download_image_from_supabase(supabase_client, image_path: Optional[str]) ->
         - The function extracts the filename from the path, ignoring any directory structure
         - Images are cached in 'image_cache/' directory at project root
         - Cached images are used on subsequent calls to avoid re-downloading
+        - Without a client (offline snapshot builds) only cached images and
+          cached orientation metadata are used
+        - Returns the full-resolution image; card rendering uses get_print_image instead
     """
     if not image_path:
         return None
@@ -37,39 +271,12 @@ def download_image_from_supabase(supabase_client, image_path: Optional[str]) ->
         if not filename:
             return None
 
-        # Setup cache directory at project root
-        cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'image_cache')
-        os.makedirs(cache_dir, exist_ok=True)
-
-        cache_path = os.path.join(cache_dir, filename)
-
         # Download and check metadata for orientation
-        metadata = None
-        metadata_filename = os.path.splitext(filename)[0] + '.json'
-
-        try:
-            bucket = supabase_client.storage.from_('character_images')
-            metadata_data = bucket.download(metadata_filename)
-            metadata = json.loads(metadata_data.decode('utf-8'))
-        except Exception as e:
-            print(f"Could not download metadata for {filename}: {e}")
-
-        # Check if image exists in cache
-        if not os.path.exists(cache_path):
-            # Image not in cache - download from Supabase
-            bucket = supabase_client.storage.from_('character_images')
-            image_data = bucket.download(filename)
-
-            # Convert bytes to PIL Image
-            img = Image.open(io.BytesIO(image_data))
-
-            # Convert to RGB if needed
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
+        metadata = _download_metadata(supabase_client, filename)
 
-            # Save the ORIGINAL image to cache (before any mutations)
-            img.save(cache_path)
-            print(f"Cached original image: {filename}")
+        cache_path = _ensure_cached(supabase_client, filename)
+        if not cache_path:
+            return None
 
         # Load the original image from cache
         img = Image.open(cache_path)
@@ -80,7 +287,7 @@ def download_image_from_supabase(supabase_client, image_path: Optional[str]) ->
 
         # Apply rotation if metadata indicates landscape orientation
         # This mutation is applied AFTER caching, so the original is preserved
-        if metadata and metadata.get('orientation') == 'landscape':
+        if _rotation(metadata):
             img = img.rotate(-90, expand=True)
 
         return ImageReader(img)
@@ -88,3 +295,98 @@ def download_image_from_supabase(supabase_client, image_path: Optional[str]) ->
     except Exception as e:
         print(f"Failed to download image '{image_path}' (filename: '{filename}'): {e}")
         return None
+
+
+def get_print_image(supabase_client, image_path: Optional[str], box_width: float, box_height: float,
+                    dpi: int = IMAGE_DPI) -> Optional[PrintImage]:
+    """
+    Get a portrait at print resolution, pre-rotated, from the derivative cache.
+
+    Derivatives are stored as JPEGs in 'image_cache/print/', keyed by the hash of
+    the cached original, the target size, the DPI and the rotation, so they are
+    rebuilt automatically when any of these change. Images are only ever
+    downsampled; an original that needs no rotation or downsampling is used as is.
+
+    JPEGs (derivatives and originals) are returned as file paths with their size
+    read from the SOF header, so ReportLab embeds the DCT data without decoding.
+
+    Args:
+        supabase_client: Supabase client instance, or None to use only the local cache
+        image_path: Path from image_link column
+        box_width: Printed width of the area the image must fit in (points)
+        box_height: Printed height of the area the image must fit in (points)
+        dpi: Target resolution
+
+    Returns:
+        PrintImage or None if the image is unavailable
+    """
+    if not image_path:
+        return None
+
+    filename = os.path.basename(image_path.strip())
+    if not filename:
+        return None
+
+    try:
+        metadata = _download_metadata(supabase_client, filename)
+        cache_path = _ensure_cached(supabase_client, filename)
+        if not cache_path:
+            return None
+
+        rotation = _rotation(metadata)
+        box_px = (round(box_width / 72 * dpi), round(box_height / 72 * dpi))
+
+        jpeg_info = read_jpeg_info(cache_path)
+        if jpeg_info:
+            width, height, components = jpeg_info
+        else:
+            width, height = Image.open(cache_path).size  # Reads the header only
+            components = None
+        rotated_width, rotated_height = (height, width) if rotation else (width, height)
+
+        # Fit within the box at the target DPI, never upsampling
+        factor = min(1.0, box_px[0] / rotated_width, box_px[1] / rotated_height)
+        if factor == 1.0 and not rotation:
+            # Grayscale and RGB JPEGs can be embedded as is (CMYK needs converting)
+            if components in (1, 3):
+                return PrintImage(cache_path, width, height)
+
+            img = Image.open(cache_path)
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            return PrintImage(ImageReader(img), width, height)
+
+        derived_name = (
+            f"{os.path.splitext(filename)[0]}_{_source_hash(cache_path)[:16]}"
+            f"_{box_px[0]}x{box_px[1]}_{dpi}dpi_r{rotation}.jpg"
+        )
+        derived_path = os.path.join(PRINT_CACHE_DIR, derived_name)
+
+        derived_info = read_jpeg_info(derived_path) if os.path.exists(derived_path) else None
+        if derived_info:
+            return PrintImage(derived_path, derived_info[0], derived_info[1])
+
+        target_size = (max(1, round(width * factor)), max(1, round(height * factor)))
+
+        # Let the JPEG decoder downscale while decoding to keep peak memory low
+        img = Image.open(cache_path)
+        img.draft('RGB', target_size)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+
+        if img.size != target_size:
+            img = img.resize(target_size, Image.LANCZOS)
+        if rotation:
+            img = img.rotate(-rotation, expand=True)
+
+        os.makedirs(PRINT_CACHE_DIR, exist_ok=True)
+        # Write to a temporary name first so parallel renders never read a partial file
+        temp_path = f"{derived_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        img.save(temp_path, 'JPEG', quality=DERIVATIVE_JPEG_QUALITY, optimize=True)
+        os.replace(temp_path, derived_path)
+
+        return PrintImage(derived_path, img.width, img.height)
+
+    except Exception as e:
+        print(f"Failed to prepare image '{image_path}' (filename: '{filename}'): {e}")
+        return None
@@ -4,20 +4,30 @@ Main card rendering functions - public API for drawing cards.
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import mm
 from reportlab.lib import colors
+from typing import Optional
 from src.types.supabase_types import CardData
 from src.config import (
     CARD_WIDTH, CARD_HEIGHT, HEADER_HEIGHT, CORNER_RADIUS,
     get_category_color
 )
-from src.card.components.front import draw_card_front_content
+from src.card.components.front import draw_card_front_content, get_card_front_image, NOT_PREPARED
+from src.card.image_handler import PrintImage
 from src.card.components.banner import draw_banner
 from src.card.components.back.header import draw_back_header
 from src.card.components.back.connections import draw_connections_table
 from src.card.components.back.towns import draw_towns_grid
 from src.card.utils import draw_rounded_rect, clip_to_rounded_rect
+from src.card.forms import draw_form, form_name
 
 
-def draw_card_front(c: canvas.Canvas, card_data: CardData, x: float, y: float, scale: float = 1.0, supabase_client=None, corner_radius: float = None):
+def draw_card_back_background(c: canvas.Canvas, corner_radius: float):
+    """Draw the white rounded card back background at the origin."""
+    c.setFillColor(colors.white)
+    c.setStrokeColor(colors.white)
+    draw_rounded_rect(c, 0, 0, CARD_WIDTH, CARD_HEIGHT, corner_radius, fill=1, stroke=0)
+
+
+def draw_card_front(c: canvas.Canvas, card_data: CardData, x: float, y: float, scale: float = 1.0, supabase_client=None, corner_radius: float = None, image: Optional[PrintImage] = NOT_PREPARED):
     """
     Draw the front of a character card.
 
@@ -29,6 +39,7 @@ def draw_card_front(c: canvas.Canvas, card_data: CardData, x: float, y: float, s
         scale: Scale factor for the card (default: 1.0 = original size 69mm)
         supabase_client: Supabase client for downloading images (optional)
         corner_radius: Corner radius for rounded edges (default: CORNER_RADIUS from config)
+        image: Portrait prepared ahead of drawing with prepare_card_front (optional, may be None)
     """
     if corner_radius is None:
         corner_radius = CORNER_RADIUS
@@ -42,12 +53,29 @@ def draw_card_front(c: canvas.Canvas, card_data: CardData, x: float, y: float, s
     c.scale(scale, scale)  # Apply uniform scaling
 
     # Draw at origin (0, 0) since we've translated
-    draw_card_front_content(c, character, 0, 0, category_color, supabase_client, corner_radius)
+    draw_card_front_content(c, character, 0, 0, category_color, supabase_client, corner_radius, scale, image)
 
     # Restore canvas state
     c.restoreState()
 
 
+def prepare_card_front(card_data: CardData, scale: float = 1.0, supabase_client=None) -> Optional[PrintImage]:
+    """
+    Fetch and prepare the portrait of a card front ahead of drawing it.
+
+    Safe to call from a background thread while other cards are drawn.
+
+    Args:
+        card_data: Card data to prepare
+        scale: Scale factor the card will be drawn at
+        supabase_client: Supabase client for downloading images (optional)
+
+    Returns:
+        Prepared portrait for draw_card_front, or None if there is none
+    """
+    return get_card_front_image(card_data.character, supabase_client, scale)
+
+
 def draw_card_back(c: canvas.Canvas, card_data: CardData, x: float, y: float, card_number: int, scale: float = 1.0, supabase_client=None, corner_radius: float = None):
     """
     Draw the back of a character card with details and connections.
@@ -73,10 +101,8 @@ def draw_card_back(c: canvas.Canvas, card_data: CardData, x: float, y: float, ca
     c.translate(x, y)  # Move origin to card position
     c.scale(scale, scale)  # Apply uniform scaling
 
-    # Draw white background for card back with rounded corners
-    c.setFillColor(colors.white)
-    c.setStrokeColor(colors.white)
-    draw_rounded_rect(c, 0, 0, CARD_WIDTH, CARD_HEIGHT, corner_radius, fill=1, stroke=0)
+    # Draw white background for card back with rounded corners (one shared form per corner radius)
+    draw_form(c, form_name("Back", corner_radius), lambda form: draw_card_back_background(form, corner_radius))
 
     # Set clipping path to rounded rectangle so all content respects the rounded corners
     c.saveState()
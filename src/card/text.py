@@ -0,0 +1,154 @@
+"""
+Text measurement and wrapping with cached glyph widths.
+
+Widths are kept per font as glyph widths in 1/1000 em, so a string is measured
+by summing the widths of its characters without going through ReportLab's
+encoding step. Each word is measured once; wrapping adds up running sums and
+truncation points are found by binary search. Results match
+canvas.stringWidth exactly for the standard Type 1 fonts used on the cards.
+"""
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, Tuple
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+
+# Glyph widths (1/1000 em) per font, filled in as characters are seen
+_glyph_widths: Dict[str, Dict[str, float]] = {}
+
+# Number of wrapped layouts kept in memory
+WRAP_CACHE_SIZE = 4096
+
+ELLIPSIS = "..."
+
+
+def text_units(text: str, font_name: str) -> float:
+    """Width of a string in 1/1000 em."""
+    widths = _glyph_widths.setdefault(font_name, {})
+    units = 0
+    for ch in text:
+        width = widths.get(ch)
+        if width is None:
+            # Rounded so sums of integer glyph widths stay exact
+            width = widths[ch] = round(stringWidth(ch, font_name, 1000), 3)
+        units += width
+    return units
+
+
+def text_width(text: str, font_name: str, font_size: float) -> float:
+    """Width of a string in points (same result as canvas.stringWidth)."""
+    return text_units(text, font_name) * 0.001 * font_size
+
+
+@lru_cache(maxsize=WRAP_CACHE_SIZE)
+def wrap_lines(text: str, font_name: str, font_size: float, max_width: float) -> Tuple[str, ...]:
+    """
+    Greedily wrap text into lines no wider than max_width.
+
+    A word that is too long on its own is put on a line by itself.
+    Layouts are memoized per (text, font, size, width).
+
+    Returns:
+        Tuple of lines
+    """
+    space = text_units(" ", font_name)
+    lines = []
+    current_line = []
+    current_units = 0
+
+    for word in text.split():
+        units = text_units(word, font_name)
+        line_units = current_units + space + units if current_line else units
+
+        if line_units * 0.001 * font_size <= max_width:
+            current_line.append(word)
+            current_units = line_units
+        elif current_line:
+            lines.append(" ".join(current_line))
+            current_line = [word]
+            current_units = units
+        else:
+            # Single word is too long, add it anyway
+            lines.append(word)
+
+    if current_line:
+        lines.append(" ".join(current_line))
+
+    return tuple(lines)
+
+
+def _first_fitting(widths: List[float], max_width: float) -> int:
+    """Index of the first width that fits in a non-increasing list, or len(widths) if none fit."""
+    low, high = 0, len(widths)
+    while low < high:
+        middle = (low + high) // 2
+        if widths[middle] <= max_width:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def fit_length(text: str, font_name: str, font_size: float, max_width: float,
+               prefix: str = "", min_length: int = 0) -> int:
+    """
+    Find how many characters of text fit after a prefix.
+
+    Args:
+        text: Text to truncate
+        font_name: Font name
+        font_size: Font size
+        max_width: Maximum width of prefix + text[:length]
+        prefix: Text drawn before the truncated part
+        min_length: Never truncate below this many characters
+
+    Returns:
+        Largest length (at least min_length) for which the text fits
+    """
+    prefix_units = text_units(prefix, font_name)
+    cumulative = list(accumulate((text_units(ch, font_name) for ch in text), initial=0))
+
+    # Widths of the longest candidates first, down to min_length characters
+    lengths = range(len(text), min(min_length, len(text)) - 1, -1)
+    widths = [(prefix_units + cumulative[length]) * 0.001 * font_size for length in lengths]
+
+    index = _first_fitting(widths, max_width)
+    return lengths[min(index, len(lengths) - 1)]
+
+
+def fit_with_ellipsis(line: str, font_name: str, font_size: float, max_width: float,
+                      ellipsis: str = ELLIPSIS) -> str:
+    """
+    Shorten a line so it fits with an ellipsis appended.
+
+    Whole words are dropped from the end first; if a single word is left,
+    characters are dropped from it instead.
+
+    Returns:
+        The shortened line, ending with the ellipsis
+    """
+    space = text_units(" ", font_name)
+    ellipsis_units = text_units(ellipsis, font_name)
+    words = line.split()
+    if not words:
+        return ellipsis
+
+    # Candidates from longest to shortest: (words kept, characters of the
+    # first word kept, width), dropping words first, then characters
+    word_sums = list(accumulate(text_units(word, font_name) for word in words))
+    candidates = [(count, None, word_sums[count - 1] + space * (count - 1))
+                  for count in range(len(words), 0, -1)]
+    first_word = list(accumulate((text_units(ch, font_name) for ch in words[0]), initial=0))
+    candidates += [(1, length, first_word[length]) for length in range(len(words[0]) - 1, -1, -1)]
+
+    widths = [(units + ellipsis_units) * 0.001 * font_size for _, _, units in candidates]
+    index = min(_first_fitting(widths, max_width), len(candidates) - 1)
+
+    count, length, _ = candidates[index]
+    if length is not None:
+        kept = words[0][:length]
+    elif count == len(words):
+        kept = line
+    else:
+        kept = " ".join(words[:count])
+    return kept + ellipsis
@@ -4,6 +4,7 @@ Text rendering utilities for card generation.
 from reportlab.pdfgen import canvas
 from reportlab.lib import colors
 from typing import Optional
+from src.card.text import wrap_lines, fit_with_ellipsis
 
 
 def create_rounded_rect_path(c: canvas.Canvas, x: float, y: float, width: float, height: float, radius: float):
@@ -92,6 +93,9 @@ def wrap_text(c: canvas.Canvas, text: str, max_width: float, font_name: str, fon
     """
     Wrap text to fit within a maximum width.
 
+    Words are measured once with cached glyph widths and the layout is
+    memoized, so repeated texts are wrapped only once.
+
     Args:
         c: ReportLab canvas
         text: Text to wrap
@@ -102,28 +106,7 @@ def wrap_text(c: canvas.Canvas, text: str, max_width: float, font_name: str, fon
     Returns:
         List of text lines that fit within max_width
     """
-    words = text.split()
-    lines = []
-    current_line = []
-
-    for word in words:
-        test_line = ' '.join(current_line + [word])
-        width = c.stringWidth(test_line, font_name, font_size)
-
-        if width <= max_width:
-            current_line.append(word)
-        else:
-            if current_line:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-            else:
-                # Single word is too long, add it anyway
-                lines.append(word)
-
-    if current_line:
-        lines.append(' '.join(current_line))
-
-    return lines
+    return list(wrap_lines(text, font_name, font_size, max_width))
 
 
 def draw_wrapped_text(c: canvas.Canvas, text: str, x: float, y: float, max_width: float,
@@ -148,7 +131,7 @@ def draw_wrapped_text(c: canvas.Canvas, text: str, x: float, y: float, max_width
         Final y position after drawing text
     """
     c.setFont(font_name, font_size)
-    lines = wrap_text(c, text, max_width, font_name, font_size)
+    lines = wrap_lines(text, font_name, font_size, max_width)
 
     was_truncated = False
     if max_lines and len(lines) > max_lines:
@@ -159,19 +142,8 @@ def draw_wrapped_text(c: canvas.Canvas, text: str, x: float, y: float, max_width
     for i, line in enumerate(lines):
         # Add ellipsis to last line if truncated
         if truncate_with_ellipsis and was_truncated and i == len(lines) - 1:
-            # Try to fit ellipsis, remove words if needed
-            ellipsis = "..."
-            test_line = line + ellipsis
-            while c.stringWidth(test_line, font_name, font_size) > max_width and line:
-                # Remove last word
-                words = line.split()
-                if len(words) > 1:
-                    words = words[:-1]
-                    line = ' '.join(words)
-                else:
-                    line = line[:-1]  # Remove last character
-                test_line = line + ellipsis
-            line = test_line
+            # Fit the ellipsis, removing words (then characters) if needed
+            line = fit_with_ellipsis(line, font_name, font_size, max_width)
 
         c.drawString(x, current_y, line)
         current_y -= line_height
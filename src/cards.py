@@ -2,14 +2,23 @@
 PDF generation for Millennium cards.
 Creates printable sheets with multiple cards per page.
 """
+import os
+import tempfile
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from reportlab import rl_config
 from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
+from reportlab.lib.pagesizes import A4, LETTER
 from reportlab.lib.units import mm
 from reportlab.lib import colors
-from typing import List, Optional
+from typing import Callable, Iterable, List, Optional, Tuple
+from pypdf import PdfWriter
 from src.types.supabase_types import CardData
-from src.card import draw_card_front, draw_card_back, CARD_WIDTH, CARD_HEIGHT
+from src.supabase_client import get_supabase_client
+from src.card import draw_card_front, draw_card_back, prepare_card_front, NOT_PREPARED, CARD_WIDTH, CARD_HEIGHT
+from src.card.forms import draw_form, form_name
 from src.config import BLEED, CROP_MARK_LENGTH
+from src.pipeline import prefetch, PREFETCH_DEPTH
 
 
 # A4 page dimensions
@@ -24,6 +33,29 @@ CARDS_PER_ROW = 3
 CARDS_PER_COL = 3
 CARDS_PER_PAGE = CARDS_PER_ROW * CARDS_PER_COL
 
+# Sheet sizes available for imposition
+PAPER_SIZES = {
+    'a4': A4,
+    'letter': LETTER,
+}
+
+
+@contextmanager
+def binary_streams():
+    """
+    Write the PDF streams of canvases drawn and saved inside this block as binary.
+
+    ASCII85 (reportlab's default) makes embedded JPEGs 25% larger and is encoded
+    in pure Python, which dominates the cost of embedding a portrait. The setting
+    is global in reportlab, so it is restored afterwards. Also usable as a decorator.
+    """
+    previous = rl_config.useA85
+    rl_config.useA85 = 0
+    try:
+        yield
+    finally:
+        rl_config.useA85 = previous
+
 
 def calculate_layout(card_width: float):
     """Calculate card layout based on desired card width."""
@@ -42,6 +74,30 @@ def draw_crop_marks_and_bleed(c: canvas.Canvas, x: float, y: float, card_width:
     """
     Draw crop marks and bleed area around a card for professional printing.
 
+    The marks are identical for every card of a deck, so they are drawn once as
+    a form and placed at each card.
+
+    Args:
+        c: ReportLab canvas
+        x: X position of card bottom-left corner (without bleed)
+        y: Y position of card bottom-left corner (without bleed)
+        card_width: Card width (without bleed)
+        card_height: Card height (without bleed)
+        scale: Scale factor applied to the card
+    """
+    extent = max(BLEED, CROP_MARK_LENGTH) * scale + 1
+    draw_form(
+        c, form_name("Crop", card_width, card_height, scale),
+        lambda form: _draw_crop_marks_and_bleed(form, 0, 0, card_width, card_height, scale),
+        x, y,
+        bbox=(-extent, -extent, card_width + extent, card_height + extent)
+    )
+
+
+def _draw_crop_marks_and_bleed(c: canvas.Canvas, x: float, y: float, card_width: float, card_height: float, scale: float = 1.0):
+    """
+    Draw the bleed area and corner crop marks of a single card.
+
     Args:
         c: ReportLab canvas
         x: X position of card bottom-left corner (without bleed)
@@ -126,24 +182,193 @@ def draw_crop_marks_and_bleed(c: canvas.Canvas, x: float, y: float, card_width:
     c.restoreState()
 
 
-def generate_cards_pdf(card_data_list: List[CardData], output_path: str, fronts_only: bool = False, separate_pages: bool = True, card_width: Optional[float] = None, crop_marks: bool = False, corner_radius: Optional[float] = None, supabase_client=None):
+def fit_card_width(columns: int, rows: int, paper: Tuple[float, float], crop_marks: bool) -> float:
     """
-    Generate PDF with all character cards.
-    Each card is completed (front and back) before moving to the next card.
-    Each card appears on its own page(s).
+    Largest card width (at most the base width) for which a columns x rows grid fits on the paper.
+
+    With crop marks, the grid needs room for the bleed and crop marks around it
+    (both scale with the card).
+    """
+    paper_width, paper_height = paper
+    border = max(BLEED, CROP_MARK_LENGTH) if crop_marks else 0
+
+    scale = min(
+        1.0,
+        paper_width / (columns * BASE_CARD_WIDTH + 2 * border),
+        paper_height / (rows * BASE_CARD_HEIGHT + 2 * border),
+    )
+    return BASE_CARD_WIDTH * scale
+
+
+def draw_sheet_crop_marks(c: canvas.Canvas, x: float, y: float, columns: int, rows: int, card_width: float, card_height: float, scale: float = 1.0):
+    """
+    Draw one bleed area and shared crop marks around a grid of cards.
+
+    Neighbouring cards share their cut lines, so each cut line gets a single
+    pair of marks in the sheet margin instead of marks at every card corner.
+    The marks are the same on every sheet and are placed as a form.
+
+    Args:
+        c: ReportLab canvas
+        x: X position of the grid bottom-left corner (without bleed)
+        y: Y position of the grid bottom-left corner (without bleed)
+        columns: Number of card columns
+        rows: Number of card rows
+        card_width: Card width (without bleed)
+        card_height: Card height (without bleed)
+        scale: Scale factor applied to the cards
+    """
+    extent = max(BLEED, CROP_MARK_LENGTH) * scale + 1
+    draw_form(
+        c, form_name("Sheet", columns, rows, card_width, card_height, scale),
+        lambda form: _draw_sheet_crop_marks(form, columns, rows, card_width, card_height, scale),
+        x, y,
+        bbox=(-extent, -extent, columns * card_width + extent, rows * card_height + extent)
+    )
+
+
+def _draw_sheet_crop_marks(c: canvas.Canvas, columns: int, rows: int, card_width: float, card_height: float, scale: float = 1.0):
+    """Draw the grid bleed area and shared crop marks relative to the grid origin."""
+    x = y = 0
+    scaled_bleed = BLEED * scale
+    scaled_crop_length = CROP_MARK_LENGTH * scale
+    grid_width = columns * card_width
+    grid_height = rows * card_height
+
+    # Draw bleed area around the whole grid (light gray rectangle)
+    c.saveState()
+    c.setFillColor(colors.Color(0.95, 0.95, 0.95))  # Very light gray
+    c.setStrokeColor(colors.Color(0.8, 0.8, 0.8))  # Light gray border
+    c.setLineWidth(0.25)
+    c.rect(
+        x - scaled_bleed,
+        y - scaled_bleed,
+        grid_width + 2 * scaled_bleed,
+        grid_height + 2 * scaled_bleed,
+        fill=1,
+        stroke=1
+    )
+    c.restoreState()
+
+    # Draw crop marks (black lines extending outward from each cut line)
+    c.saveState()
+    c.setStrokeColor(colors.black)
+    c.setLineWidth(0.5)
+
+    # Vertical cut lines: marks below and above the grid
+    for column in range(columns + 1):
+        cut_x = x + column * card_width
+        c.line(cut_x, y, cut_x, y - scaled_crop_length)
+        c.line(cut_x, y + grid_height, cut_x, y + grid_height + scaled_crop_length)
+
+    # Horizontal cut lines: marks left and right of the grid
+    for row in range(rows + 1):
+        cut_y = y + row * card_height
+        c.line(x, cut_y, x - scaled_crop_length, cut_y)
+        c.line(x + grid_width, cut_y, x + grid_width + scaled_crop_length, cut_y)
+
+    c.restoreState()
+
+
+@binary_streams()
+def generate_imposed_pdf(card_data_list: List[CardData], output_path: str, columns: int = CARDS_PER_ROW, rows: int = CARDS_PER_COL, paper: Tuple[float, float] = A4, fronts_only: bool = False, card_width: Optional[float] = None, crop_marks: bool = False, corner_radius: Optional[float] = None, supabase_client=None, first_card_number: int = 1):
+    """
+    Generate PDF with cards imposed on full sheets for printing.
+
+    Fronts are packed columns x rows per sheet, with the cards butted together so
+    neighbouring cards share cut lines. Each front sheet is followed by a back
+    sheet with the columns mirrored, so backs line up when printed duplex
+    (flip on long edge).
 
     Args:
         card_data_list: List of card data to render
         output_path: Path to save the PDF file
-        fronts_only: If True, only render card fronts; if False, render fronts and backs
-        separate_pages: If True, render front and back on separate pages (default); if False, render side by side
-        card_width: Desired card width in mm (default: None = use original 69mm)
-        crop_marks: If True, add crop marks and bleed area for professional printing
+        columns: Number of cards per row
+        rows: Number of cards per column
+        paper: Sheet size in points (e.g. PAPER_SIZES['a4'])
+        fronts_only: If True, only render front sheets
+        card_width: Desired card width in points (default: None = largest that fits, at most 69mm)
+        crop_marks: If True, add a bleed area and shared crop marks around the grid
         corner_radius: Corner radius for rounded edges (default: None = use CORNER_RADIUS from config)
         supabase_client: Supabase client for downloading images (optional)
+        first_card_number: Card number of the first card (for rendering part of a deck)
+
+    Raises:
+        ValueError: If the grid does not fit on the paper
     """
     total_cards = len(card_data_list)
+    cards_per_sheet = columns * rows
+    page_width, page_height = paper
 
+    if card_width is None:
+        card_width = fit_card_width(columns, rows, paper, crop_marks)
+    scale, scaled_height, _, _ = calculate_layout(card_width)
+
+    # Center the grid on the sheet (centering keeps mirrored backs aligned)
+    border = max(BLEED, CROP_MARK_LENGTH) * scale if crop_marks else 0
+    grid_width = columns * card_width
+    grid_height = rows * scaled_height
+    if grid_width + 2 * border > page_width + 0.01 or grid_height + 2 * border > page_height + 0.01:
+        max_width = fit_card_width(columns, rows, paper, crop_marks)
+        raise ValueError(
+            f"A {columns}x{rows} grid of {card_width / mm:.1f}mm cards does not fit on "
+            f"{page_width / mm:.0f}mm × {page_height / mm:.0f}mm paper (maximum card width: {max_width / mm:.1f}mm)"
+        )
+    grid_x = (page_width - grid_width) / 2
+    grid_y = (page_height - grid_height) / 2
+
+    def cell_position(slot: int, mirrored: bool) -> Tuple[float, float]:
+        row, column = divmod(slot, columns)
+        if mirrored:
+            column = columns - 1 - column
+        # Row 0 is the top row
+        return grid_x + column * card_width, grid_y + (rows - 1 - row) * scaled_height
+
+    c = canvas.Canvas(output_path, pagesize=paper)
+
+    num_sheets = (total_cards + cards_per_sheet - 1) // cards_per_sheet
+    print(f"Generating PDF with {total_cards} cards...")
+    print(f"Card size: {card_width / mm:.1f}mm × {scaled_height / mm:.1f}mm (scale: {scale:.2f}x)")
+    print(f"Page size: {page_width / mm:.1f}mm × {page_height / mm:.1f}mm")
+    print(f"Rendering cards ({columns}x{rows} per sheet, {num_sheets} sheets)...")
+
+    for sheet_start in range(0, total_cards, cards_per_sheet):
+        sheet_cards = card_data_list[sheet_start:sheet_start + cards_per_sheet]
+
+        # Front sheet
+        if crop_marks:
+            draw_sheet_crop_marks(c, grid_x, grid_y, columns, rows, card_width, scaled_height, scale)
+        for slot, card_data in enumerate(sheet_cards):
+            x_front, y_front = cell_position(slot, mirrored=False)
+            draw_card_front(c, card_data, x_front, y_front, scale, supabase_client, corner_radius)
+        c.showPage()
+
+        # Back sheet, mirrored left to right for duplex printing
+        if not fronts_only:
+            if crop_marks:
+                draw_sheet_crop_marks(c, grid_x, grid_y, columns, rows, card_width, scaled_height, scale)
+            for slot, card_data in enumerate(sheet_cards):
+                card_number = first_card_number + sheet_start + slot
+                x_back, y_back = cell_position(slot, mirrored=True)
+                draw_card_back(c, card_data, x_back, y_back, card_number, scale, supabase_client, corner_radius)
+            c.showPage()
+
+    c.save()
+    print(f"PDF saved to {output_path}")
+
+
+def card_page_layout(card_width: Optional[float] = None, separate_pages: bool = True, crop_marks: bool = False) -> Tuple[float, float, float, float, float]:
+    """
+    Calculate the card scale and page size for one-card-per-page output.
+
+    Args:
+        card_width: Desired card width in points (default: None = use original 69mm)
+        separate_pages: If True, front and back get a page each; if False, they share a page
+        crop_marks: If True, pages include the bleed area
+
+    Returns:
+        (card_width, scale, scaled_height, page_width, page_height)
+    """
     # Calculate scaling based on desired width
     if card_width is None:
         card_width = BASE_CARD_WIDTH
@@ -171,79 +396,194 @@ def generate_cards_pdf(card_data_list: List[CardData], output_path: str, fronts_
             page_width = 2 * card_width
             page_height = scaled_height
 
-    c = canvas.Canvas(output_path, pagesize=(page_width, page_height))
+    return card_width, scale, scaled_height, page_width, page_height
 
-    print(f"Generating PDF with {total_cards} cards...")
-    print(f"Card size: {card_width / mm:.1f}mm × {scaled_height / mm:.1f}mm (scale: {scale:.2f}x)")
-    print(f"Page size: {page_width / mm:.1f}mm × {page_height / mm:.1f}mm")
-    print("Rendering cards (one card per page)...")
 
-    # Generate cards one at a time
-    for i, card_data in enumerate(card_data_list):
-        card_number = i + 1
+def draw_card_pages(c: canvas.Canvas, card_data: CardData, card_number: int, card_width: float, scaled_height: float, scale: float, fronts_only: bool = False, separate_pages: bool = True, crop_marks: bool = False, corner_radius: Optional[float] = None, supabase_client=None, image=NOT_PREPARED):
+    """
+    Draw the page(s) of one card: front and back, on separate pages or side by side.
 
-        if separate_pages:
-            # Front on its own page
+    Args:
+        c: ReportLab canvas sized with card_page_layout
+        card_data: Card to draw
+        card_number: Card number shown on the back
+        card_width: Card width in points
+        scaled_height: Card height in points
+        scale: Scale factor applied to the card
+        fronts_only: If True, only draw the front
+        separate_pages: If True, front and back get a page each
+        crop_marks: If True, add crop marks and bleed area
+        corner_radius: Corner radius for rounded edges
+        supabase_client: Supabase client for downloading images (optional)
+        image: Portrait prepared with prepare_card_front (optional, may be None)
+    """
+    if separate_pages:
+        # Front on its own page
+        if crop_marks:
+            # Position card in center of bleed area
+            scaled_bleed = BLEED * scale
+            x_front = scaled_bleed
+            y_front = scaled_bleed
+            draw_crop_marks_and_bleed(c, x_front, y_front, card_width, scaled_height, scale)
+        else:
+            # No bleed, card fills page
+            x_front = 0
+            y_front = 0
+
+        draw_card_front(c, card_data, x_front, y_front, scale, supabase_client, corner_radius, image)
+        c.showPage()
+
+        # Back on its own page
+        if not fronts_only:
             if crop_marks:
-                # Position card in center of bleed area
                 scaled_bleed = BLEED * scale
-                x_front = scaled_bleed
-                y_front = scaled_bleed
-                draw_crop_marks_and_bleed(c, x_front, y_front, card_width, scaled_height, scale)
+                x_back = scaled_bleed
+                y_back = scaled_bleed
+                draw_crop_marks_and_bleed(c, x_back, y_back, card_width, scaled_height, scale)
             else:
-                # No bleed, card fills page
-                x_front = 0
-                y_front = 0
+                x_back = 0
+                y_back = 0
 
-            draw_card_front(c, card_data, x_front, y_front, scale, supabase_client, corner_radius)
+            draw_card_back(c, card_data, x_back, y_back, card_number, scale, supabase_client, corner_radius)
             c.showPage()
+    else:
+        # Front and back side by side on same page
+        if crop_marks:
+            scaled_bleed = BLEED * scale
+            # Front on left with bleed
+            x_front = scaled_bleed
+            y_front = scaled_bleed
+            draw_crop_marks_and_bleed(c, x_front, y_front, card_width, scaled_height, scale)
+        else:
+            x_front = 0
+            y_front = 0
 
-            # Back on its own page
-            if not fronts_only:
-                if crop_marks:
-                    scaled_bleed = BLEED * scale
-                    x_back = scaled_bleed
-                    y_back = scaled_bleed
-                    draw_crop_marks_and_bleed(c, x_back, y_back, card_width, scaled_height, scale)
-                else:
-                    x_back = 0
-                    y_back = 0
+        draw_card_front(c, card_data, x_front, y_front, scale, supabase_client, corner_radius, image)
 
-                draw_card_back(c, card_data, x_back, y_back, card_number, scale, supabase_client, corner_radius)
-                c.showPage()
-        else:
-            # Front and back side by side on same page
+        # Back on right side
+        if not fronts_only:
             if crop_marks:
                 scaled_bleed = BLEED * scale
-                # Front on left with bleed
-                x_front = scaled_bleed
-                y_front = scaled_bleed
-                draw_crop_marks_and_bleed(c, x_front, y_front, card_width, scaled_height, scale)
+                x_back = card_width + 3 * scaled_bleed  # Skip front card + 2 bleeds between
+                y_back = scaled_bleed
+                draw_crop_marks_and_bleed(c, x_back, y_back, card_width, scaled_height, scale)
             else:
-                x_front = 0
-                y_front = 0
+                x_back = card_width
+                y_back = 0
 
-            draw_card_front(c, card_data, x_front, y_front, scale, supabase_client, corner_radius)
+            draw_card_back(c, card_data, x_back, y_back, card_number, scale, supabase_client, corner_radius)
 
-            # Back on right side
-            if not fronts_only:
-                if crop_marks:
-                    scaled_bleed = BLEED * scale
-                    x_back = card_width + 3 * scaled_bleed  # Skip front card + 2 bleeds between
-                    y_back = scaled_bleed
-                    draw_crop_marks_and_bleed(c, x_back, y_back, card_width, scaled_height, scale)
-                else:
-                    x_back = card_width
-                    y_back = 0
+        c.showPage()
 
-                draw_card_back(c, card_data, x_back, y_back, card_number, scale, supabase_client, corner_radius)
 
-            c.showPage()
+@binary_streams()
+def generate_cards_pdf(card_data_list: Iterable[CardData], output_path: str, fronts_only: bool = False, separate_pages: bool = True, card_width: Optional[float] = None, crop_marks: bool = False, corner_radius: Optional[float] = None, supabase_client=None, first_card_number: int = 1, prefetch_depth: int = PREFETCH_DEPTH):
+    """
+    Generate PDF with all character cards.
+    Each card is completed (front and back) before moving to the next card.
+    Each card appears on its own page(s).
+
+    Cards are consumed as a stream: a background thread pulls the next cards
+    from the iterable and prepares their portraits while the current card is
+    drawn, staying at most prefetch_depth cards ahead.
+
+    Args:
+        card_data_list: Card data to render (a list, or any iterable such as iter_card_data)
+        output_path: Path to save the PDF file
+        fronts_only: If True, only render card fronts; if False, render fronts and backs
+        separate_pages: If True, render front and back on separate pages (default); if False, render side by side
+        card_width: Desired card width in mm (default: None = use original 69mm)
+        crop_marks: If True, add crop marks and bleed area for professional printing
+        corner_radius: Corner radius for rounded edges (default: None = use CORNER_RADIUS from config)
+        supabase_client: Supabase client for downloading images (optional)
+        first_card_number: Card number of the first card (for rendering part of a deck)
+        prefetch_depth: Number of cards prepared ahead of drawing (0 = prepare each card when drawn)
+    """
+    total_cards = len(card_data_list) if hasattr(card_data_list, '__len__') else None
+
+    card_width, scale, scaled_height, page_width, page_height = card_page_layout(card_width, separate_pages, crop_marks)
+
+    c = canvas.Canvas(output_path, pagesize=(page_width, page_height))
+
+    print(f"Generating PDF with {total_cards} cards..." if total_cards is not None else "Generating PDF...")
+    print(f"Card size: {card_width / mm:.1f}mm × {scaled_height / mm:.1f}mm (scale: {scale:.2f}x)")
+    print(f"Page size: {page_width / mm:.1f}mm × {page_height / mm:.1f}mm")
+    print("Rendering cards (one card per page)...")
+
+    # Portraits are fetched and prepared a few cards ahead of drawing
+    prepared_cards = prefetch(
+        card_data_list,
+        lambda card_data: prepare_card_front(card_data, scale, supabase_client),
+        prefetch_depth
+    )
+
+    # Generate cards one at a time
+    for i, (card_data, image) in enumerate(prepared_cards):
+        draw_card_pages(
+            c, card_data, first_card_number + i, card_width, scaled_height, scale,
+            fronts_only, separate_pages, crop_marks, corner_radius, supabase_client, image
+        )
 
     c.save()
     print(f"PDF saved to {output_path}")
 
 
+def _render_part(render: Callable, card_data_list: List[CardData], output_path: str, first_card_number: int, use_supabase: bool, options: dict) -> str:
+    """Render one contiguous part of a deck in a worker process."""
+    # Clients can't be pickled; forked workers start with an empty client
+    # registry (see supabase_client), so each opens its own connection pool
+    supabase_client = get_supabase_client() if use_supabase else None
+    render(card_data_list, output_path, supabase_client=supabase_client, first_card_number=first_card_number, **options)
+    return output_path
+
+
+def render_parallel(render: Callable, card_data_list: List[CardData], output_path: str, workers: int, supabase_client=None, chunk_multiple: int = 1, **options):
+    """
+    Render a deck in a pool of worker processes and merge the parts in card order.
+
+    The deck is split into contiguous chunks (one per worker), each chunk is
+    rendered to a temporary PDF with the same page settings and card numbering
+    it would get in a serial build, and the parts are concatenated.
+
+    Args:
+        render: Deck renderer, generate_cards_pdf or generate_imposed_pdf
+        card_data_list: List of card data to render
+        output_path: Path to save the merged PDF file
+        workers: Number of worker processes
+        supabase_client: Supabase client; if given, each worker opens its own
+        chunk_multiple: Chunk sizes are rounded up to a multiple of this
+            (cards per sheet for imposition, so no sheet is split between parts)
+        **options: Remaining keyword arguments for render
+    """
+    total_cards = len(card_data_list)
+    chunk_size = -(-total_cards // workers)
+    chunk_size = -(-chunk_size // chunk_multiple) * chunk_multiple
+
+    print(f"Rendering {total_cards} cards in {-(-total_cards // chunk_size)} parts with {workers} workers...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _render_part, render,
+                    card_data_list[start:start + chunk_size],
+                    os.path.join(temp_dir, f"part_{start:06d}.pdf"),
+                    start + 1, supabase_client is not None, options
+                )
+                for start in range(0, total_cards, chunk_size)
+            ]
+            part_paths = [future.result() for future in futures]
+
+        writer = PdfWriter()
+        for part_path in part_paths:
+            writer.append(part_path)
+        with open(output_path, 'wb') as f:
+            writer.write(f)
+
+    print(f"Merged {len(part_paths)} parts into {output_path}")
+
+
+@binary_streams()
 def generate_single_card_pdf(card_data: CardData, output_path: str, card_number: int = 1, separate_pages: bool = True, card_width: Optional[float] = None, crop_marks: bool = False, corner_radius: Optional[float] = None, supabase_client=None):
     """
     Generate PDF with a single card.
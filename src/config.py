@@ -28,6 +28,9 @@ BLEED = 3 * mm  # Standard bleed for professional printing
 CROP_MARK_LENGTH = 5 * mm  # Length of crop marks extending into bleed area
 CORNER_RADIUS = 5 * mm  # Default corner radius for rounded edges
 
+# Portrait resolution in the PDF (images are downsampled to this, never upsampled)
+IMAGE_DPI = 300
+
 # Category color mapping
 CATEGORY_COLORS = {
     'R': HexColor('#DC143C'),  # Royalty - red
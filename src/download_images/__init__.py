@@ -8,6 +8,9 @@ from .downloader import CharacterImageDownloader, DownloadSummaryPrinter
 from .wikimedia_api import WikimediaAPIClient
 from .query_builder import QueryBuilder
 from .file_manager import FileManager
+from .http_session import WikimediaSession, TokenBucket
+from .sourcing_engine import SourcingEngine
+from .response_cache import ResponseCache
 from .image_scorer import ImageScorer
 
 # Models
@@ -26,6 +29,10 @@ __all__ = [
     'WikimediaAPIClient',
     'QueryBuilder',
     'FileManager',
+    'WikimediaSession',
+    'TokenBucket',
+    'SourcingEngine',
+    'ResponseCache',
     'ImageScorer',
 
     # Models
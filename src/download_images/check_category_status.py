@@ -22,16 +22,13 @@ from PIL import Image
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.download_images.models import Character, CATEGORIES
-from src.supabase_client import get_supabase_client
+from src.supabase_client import get_supabase_client, stream_table
 
 
 def get_all_characters():
-    """Fetch all characters from Supabase."""
+    """Fetch all characters from Supabase (only the columns used in the report)."""
     client = get_supabase_client()
-    response = client.table('character').select('*').execute()
-
-    characters = [Character.from_dict(row) for row in response.data]
-    return characters
+    return list(stream_table(client, 'character', 'id,name,type,first_names', Character.from_dict))
 
 
 def get_downloaded_character_images():
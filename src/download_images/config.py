@@ -2,6 +2,7 @@
 Configuration constants for image downloading.
 Single Responsibility: Centralize all configuration values.
 """
+import os
 import math
 
 
@@ -11,12 +12,28 @@ class WikimediaConfig:
     HEADERS = {
         'User-Agent': 'MillenniumCardGame/1.0 (Educational card game project; contact via GitHub)'
     }
-    API_DELAY_SECONDS = 1.0
-    SEARCH_DELAY_SECONDS = 0.2
     REQUEST_TIMEOUT_SECONDS = 30
     DOWNLOAD_TIMEOUT_SECONDS = 60
     SEARCH_LIMIT = 15
 
+    # Adaptive pacing per host (requests per second)
+    REQUESTS_PER_SECOND = 2.0      # Starting rate
+    MIN_REQUESTS_PER_SECOND = 0.2
+    MAX_REQUESTS_PER_SECOND = 5.0
+    RATE_INCREASE = 0.2            # Added after each success; throttling halves the rate
+
+    # Retries of 429/5xx responses, maxlag errors and connection failures
+    MAX_RETRIES = 4
+    RETRY_BACKOFF_SECONDS = 1.0    # Doubled per retry unless the server sends Retry-After
+    MAXLAG_SECONDS = 5             # Ask the API to refuse requests while replicas lag more than this
+
+    POOL_SIZE = 10                 # Keep-alive connections per host
+
+    # Persistent response cache (project root)
+    CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'wikimedia_cache.db')
+    CACHE_TTL_DAYS = 30
+    NEGATIVE_CACHE_TTL_DAYS = 7    # Searches that found nothing usable
+
 
 class ImageRequirements:
     """Requirements for image quality and dimensions."""
@@ -40,3 +57,6 @@ class DownloadConfig:
     # Query limits
     MAX_QUERIES_PER_CHARACTER = 10
     STOP_AFTER_CANDIDATES = 9  # (max_alternatives + 1) * 3
+
+    # Characters sourced at the same time by the batch engine
+    SOURCING_CONCURRENCY = 4
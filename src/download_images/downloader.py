@@ -6,10 +6,11 @@ Open/Closed: Easy to extend with new components without modification.
 from pathlib import Path
 from typing import List, Optional
 from .models import ImageInfo
-from .config import DownloadConfig, WikimediaConfig
+from .config import DownloadConfig, WikimediaConfig, ImageRequirements
 from .query_builder import QueryBuilder
 from .wikimedia_api import WikimediaAPIClient
 from .file_manager import FileManager
+from .sourcing_engine import SourcingEngine
 
 
 class CharacterImageDownloader:
@@ -162,7 +163,8 @@ class CharacterImageDownloader:
     def download_batch(
         self,
         characters: List,
-        output_dir: Optional[Path] = None
+        output_dir: Optional[Path] = None,
+        concurrency: int = 1
     ) -> tuple[int, int]:
         """
         Download images for multiple characters.
@@ -170,10 +172,22 @@ class CharacterImageDownloader:
         Args:
             characters: List of character objects
             output_dir: Output directory (uses default if None)
+            concurrency: Characters sourced at the same time (1 = one after another)
 
         Returns:
             Tuple of (success_count, total_count)
         """
+        if concurrency > 1:
+            engine = SourcingEngine(
+                concurrency,
+                query_builder=self.query_builder,
+                file_manager=self.file_manager,
+                session=self.api_client.session,
+                config=self.config,
+                cache=self.api_client.cache
+            )
+            return engine.download_batch(characters, output_dir)
+
         # Ensure output directory exists
         output_dir = self.file_manager.ensure_output_dir(output_dir)
 
@@ -202,8 +216,8 @@ class DownloadSummaryPrinter:
         print("Improved Wikimedia Commons Image Downloader")
         print("=" * 80)
         print("\nUsing: first_names, biography, birth_date, death_date for smart searches")
-        print(f"Target Aspect Ratio: 1:{WikimediaAPIClient().scorer.config.TARGET_ASPECT_RATIO:.3f} (A4 portrait)")
-        print(f"Minimum Resolution: {WikimediaAPIClient().scorer.config.MIN_HEIGHT}px height\n")
+        print(f"Target Aspect Ratio: 1:{ImageRequirements.TARGET_ASPECT_RATIO:.3f} (A4 portrait)")
+        print(f"Minimum Resolution: {ImageRequirements.MIN_HEIGHT}px height\n")
 
     @staticmethod
     def print_summary(success_count: int, total_count: int, output_dir: Path):
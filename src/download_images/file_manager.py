@@ -3,12 +3,12 @@ File operations for downloading and saving images.
 Single Responsibility: Handle all file I/O operations.
 """
 import json
-import requests
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Tuple
 from .models import ImageInfo, DownloadMetadata
-from .config import WikimediaConfig, DownloadConfig
+from .config import DownloadConfig
+from .http_session import WikimediaSession, get_session
 
 
 class FileManager:
@@ -16,15 +16,18 @@ class FileManager:
     Manages file operations for image downloads and metadata.
     """
 
-    def __init__(self, config: DownloadConfig = None, similarity_threshold: int = 20):
+    def __init__(self, config: DownloadConfig = None, similarity_threshold: int = 20,
+                 session: WikimediaSession = None):
         """
         Initialize file manager.
 
         Args:
             config: Download configuration (uses default if None)
             similarity_threshold: Deprecated parameter, kept for backwards compatibility
+            session: HTTP session pacing the downloads (uses the shared session if None)
         """
         self.config = config or DownloadConfig()
+        self.session = session or get_session()
 
         # Image format magic bytes
         self.IMAGE_SIGNATURES = {
@@ -112,10 +115,9 @@ class FileManager:
             - actual_extension: The actual image format ('jpg' or 'png'), or None if failed
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 url,
-                headers=WikimediaConfig.HEADERS,
-                timeout=WikimediaConfig.DOWNLOAD_TIMEOUT_SECONDS,
+                timeout=self.session.config.DOWNLOAD_TIMEOUT_SECONDS,
                 stream=True
             )
             response.raise_for_status()
@@ -0,0 +1,256 @@
+"""
+Shared HTTP session for Wikimedia requests.
+Single Responsibility: Connection reuse, retries and request pacing.
+
+All API queries and image downloads go through one requests.Session with a
+pooled, keep-alive adapter. Requests to each host are paced by a token
+bucket whose rate adapts to the responses: every success raises it a
+little, every throttling response (429, 5xx, MediaWiki maxlag) halves it
+and pauses the host for the Retry-After time, so the client settles at the
+highest rate the server tolerates instead of sleeping a fixed delay.
+"""
+import time
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import WikimediaConfig
+
+
+# Responses that mean "try again later"
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with an adjustable rate.
+
+    reserve() takes a token and returns how long the caller must wait before
+    using it, so blocking and asyncio callers can share one bucket.
+    """
+
+    def __init__(self, rate: float, min_rate: float, max_rate: float, capacity: float = 1.0):
+        """
+        Initialize bucket (full).
+
+        Args:
+            rate: Initial requests per second
+            min_rate: Lowest rate after repeated throttling
+            max_rate: Highest rate reached by speeding up
+            capacity: Largest burst of requests without waiting
+        """
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        # Tokens owed (negative) are paid back before the bucket fills up again
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token; return the seconds to wait before sending the request."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            start = max(now, self._updated)  # Later than now while paused
+            return start - now + max(0.0, -self._tokens) / self.rate
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def speed_up(self, increase: float):
+        """Raise the rate after a successful response."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + increase)
+
+    def slow_down(self, pause_seconds: float = 0.0):
+        """Halve the rate and send nothing for pause_seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate / 2)
+            if pause_seconds > 0:
+                # No tokens accumulate during the pause
+                self._tokens = min(self._tokens, 1.0)
+                self._updated = max(self._updated, now + pause_seconds)
+
+
+def retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """
+    Parse the Retry-After header (seconds or HTTP date).
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_maxlag_error(response: requests.Response) -> bool:
+    """True if the API refused the request because its database replicas lag behind."""
+    # MediaWiki answers maxlag with HTTP 200, a Retry-After header and an error code
+    if response.status_code != 200 or 'Retry-After' not in response.headers:
+        return False
+    try:
+        return response.json().get('error', {}).get('code') == 'maxlag'
+    except ValueError:
+        return False
+
+
+class WikimediaSession:
+    """
+    Pooled, retrying and adaptively paced HTTP session.
+    """
+
+    def __init__(self, config: WikimediaConfig = None):
+        """
+        Initialize session.
+
+        Args:
+            config: Wikimedia configuration (uses default if None)
+        """
+        self.config = config or WikimediaConfig()
+        self.session = requests.Session()
+        self.session.headers.update(self.config.HEADERS)
+        adapter = HTTPAdapter(pool_connections=self.config.POOL_SIZE, pool_maxsize=self.config.POOL_SIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+
+    def bucket(self, url: str) -> TokenBucket:
+        """Token bucket pacing requests to the host of url."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(
+                    self.config.REQUESTS_PER_SECOND,
+                    self.config.MIN_REQUESTS_PER_SECOND,
+                    self.config.MAX_REQUESTS_PER_SECOND
+                )
+            return self._buckets[host]
+
+    def get(self, url: str, params: dict = None, timeout: float = None, stream: bool = False,
+            check_maxlag: bool = False) -> requests.Response:
+        """
+        GET a URL, retrying throttled requests and connection errors with exponential backoff.
+
+        Args:
+            url: URL to fetch
+            params: Query parameters
+            timeout: Request timeout in seconds (default: REQUEST_TIMEOUT_SECONDS)
+            stream: If True, do not read the body before returning
+            check_maxlag: If True, retry MediaWiki maxlag errors
+
+        Returns:
+            The last response; callers check its status as before
+
+        Raises:
+            requests.RequestException: If the last attempt failed to connect
+        """
+        bucket = self.bucket(url)
+        attempts = self.config.MAX_RETRIES + 1
+        for attempt in range(attempts):
+            bucket.acquire()
+            with self._lock:
+                self.requests += 1
+
+            try:
+                response = self.session.get(
+                    url, params=params, stream=stream,
+                    timeout=timeout or self.config.REQUEST_TIMEOUT_SECONDS
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == attempts - 1:
+                    raise
+                bucket.slow_down(self.config.RETRY_BACKOFF_SECONDS * 2 ** attempt)
+                with self._lock:
+                    self.retries += 1
+                continue
+
+            throttled = response.status_code in RETRY_STATUS_CODES or (check_maxlag and is_maxlag_error(response))
+            if not throttled:
+                bucket.speed_up(self.config.RATE_INCREASE)
+                return response
+
+            with self._lock:
+                self.throttled += 1
+            if attempt == attempts - 1:
+                return response
+
+            retry_after = retry_after_seconds(response)
+            backoff = self.config.RETRY_BACKOFF_SECONDS * 2 ** attempt
+            bucket.slow_down(backoff if retry_after is None else retry_after)
+            response.close()  # Return the connection to the pool
+            with self._lock:
+                self.retries += 1
+
+        return response
+
+    def api_get(self, params: dict) -> requests.Response:
+        """
+        Query the MediaWiki API with maxlag set.
+
+        Args:
+            params: API parameters
+
+        Returns:
+            The API response
+        """
+        params = {'format': 'json', 'maxlag': self.config.MAXLAG_SECONDS, **params}
+        return self.get(self.config.API_URL, params=params, check_maxlag=True)
+
+
+_shared_session: Optional[WikimediaSession] = None
+_shared_lock = threading.Lock()
+
+
+def get_session(config: WikimediaConfig = None) -> WikimediaSession:
+    """
+    Session shared by every API client and file manager in the process.
+
+    Args:
+        config: Custom Wikimedia configuration; gets a session of its own (API URL,
+            timeouts, retries and pacing from config) instead of the shared one
+
+    Returns:
+        The shared session, or a new session for config
+    """
+    if config is not None:
+        return WikimediaSession(config)
+
+    global _shared_session
+    with _shared_lock:
+        if _shared_session is None:
+            _shared_session = WikimediaSession()
+        return _shared_session
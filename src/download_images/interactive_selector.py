@@ -100,40 +100,8 @@ class InteractiveImageSelector:
         # Download candidates to temp directory
         candidates = []
         for idx, image_info in enumerate(results[:max_candidates], 1):
-            # Generate temp filename
-            filename = f"{character.id}_{character.type}_{character.name}_temp{idx}.jpg"
-            filepath = self.temp_dir / filename
-
-            # Prepare metadata
-            metadata = {
-                'character_id': character.id,
-                'character_name': character.name,
-                'category': character.type,
-                'first_names': character.first_names,
-                'birth_date': character.birth_date,
-                'death_date': character.death_date,
-                'wikimedia_title': image_info.title,
-                'wikimedia_url': image_info.url,
-                'page_url': f"https://commons.wikimedia.org/wiki/{image_info.title.replace(' ', '_')}",
-                'width': image_info.width,
-                'height': image_info.height,
-                'aspect_ratio': image_info.aspect_ratio,
-                'score': image_info.score,
-                'candidate_rank': idx
-            }
-
-            # Download with metadata
-            success, actual_extension = self.file_manager.download_image(
-                image_info.url,
-                filepath,
-                save_metadata=True,
-                metadata=metadata
-            )
-            if success:
-                # Update filepath with actual extension if different
-                if actual_extension and actual_extension != 'jpg':
-                    actual_filename = f"{character.id}_{character.type}_{character.name}_temp{idx}.{actual_extension}"
-                    filepath = self.temp_dir / actual_filename
+            filepath = self.download_candidate(character, image_info, idx)
+            if filepath:
                 candidates.append((image_info, filepath))
                 print(f"    [{idx}/{max_candidates}] ✅ Downloaded")
             else:
@@ -142,6 +110,56 @@ class InteractiveImageSelector:
         print(f"\n  📦 Downloaded {len(candidates)} candidates")
         return candidates
 
+    def download_candidate(self, character: Character, image_info, idx: int) -> Optional[Path]:
+        """
+        Download one candidate image and its metadata to the temp directory.
+
+        Args:
+            character: Character object
+            image_info: ImageInfo of the candidate
+            idx: Candidate rank (1-based)
+
+        Returns:
+            Path of the downloaded image, or None if the download failed
+        """
+        # Generate temp filename
+        filename = f"{character.id}_{character.type}_{character.name}_temp{idx}.jpg"
+        filepath = self.temp_dir / filename
+
+        # Prepare metadata
+        metadata = {
+            'character_id': character.id,
+            'character_name': character.name,
+            'category': character.type,
+            'first_names': character.first_names,
+            'birth_date': character.birth_date,
+            'death_date': character.death_date,
+            'wikimedia_title': image_info.title,
+            'wikimedia_url': image_info.url,
+            'page_url': f"https://commons.wikimedia.org/wiki/{image_info.title.replace(' ', '_')}",
+            'width': image_info.width,
+            'height': image_info.height,
+            'aspect_ratio': image_info.aspect_ratio,
+            'score': image_info.score,
+            'candidate_rank': idx
+        }
+
+        # Download with metadata
+        success, actual_extension = self.file_manager.download_image(
+            image_info.url,
+            filepath,
+            save_metadata=True,
+            metadata=metadata
+        )
+        if not success:
+            return None
+
+        # Update filepath with actual extension if different
+        if actual_extension and actual_extension != 'jpg':
+            actual_filename = f"{character.id}_{character.type}_{character.name}_temp{idx}.{actual_extension}"
+            filepath = self.temp_dir / actual_filename
+        return filepath
+
     def filter_by_similarity(
         self,
         character: Character,
@@ -16,14 +16,19 @@ Metadata includes:
 - Aspect ratio
 - Quality scores (ratio, resolution, overall)
 
+Characters for all images without metadata are fetched up front in a few
+bulk queries (or read from a local snapshot) rather than one query per image.
+
 Usage:
-    python -m src.download_images.manage_metadata [--dry-run] [--update]
+    python -m src.download_images.manage_metadata [--dry-run] [--update] [--snapshot PATH]
 
     --dry-run: Preview actions without making changes
     --update: Recalculate scores on existing metadata files
+    --snapshot PATH: Read character data from a snapshot (see `src/main.py snapshot`) instead of Supabase
 """
 import sys
 import json
+import dataclasses
 from pathlib import Path
 from datetime import datetime
 from PIL import Image
@@ -31,11 +36,16 @@ from PIL import Image
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.supabase_client import get_supabase_client
-from src.download_images.models import Character
+from src.supabase_client import get_supabase_client, stream_table_pages
+from src.snapshot import load_snapshot
+from src.download_images.models import Character, CHARACTER_COLUMNS
 from src.download_images.image_scorer import ImageScorer
 
 
+# IDs per in_() query, keeping request URLs well below server limits
+ID_CHUNK_SIZE = 500
+
+
 def parse_filename(filename: str) -> tuple[int, str, str] | None:
     """
     Parse character info from filename.
@@ -98,6 +108,65 @@ def get_character_from_db(client, char_id: int) -> Character | None:
         return None
 
 
+def prefetch_characters_from_db(client, char_ids: list[int]) -> tuple[dict[int, Character], int]:
+    """
+    Fetch many characters from Supabase with bulk in_() queries.
+
+    Args:
+        client: Supabase client
+        char_ids: Character IDs to fetch
+
+    Returns:
+        Tuple of (characters by ID, number of requests sent)
+    """
+    unique_ids = sorted(set(char_ids))
+    characters = {}
+    query_count = 0
+
+    for start in range(0, len(unique_ids), ID_CHUNK_SIZE):
+        chunk = unique_ids[start:start + ID_CHUNK_SIZE]
+        for page in stream_table_pages(
+            client, 'character', CHARACTER_COLUMNS, Character.from_dict,
+            filters=lambda query: query.in_('id', chunk)
+        ):
+            query_count += 1
+            for character in page:
+                characters[character.id] = character
+
+    return characters, query_count
+
+
+def load_characters_from_snapshot(snapshot_path: str, char_ids: list[int]) -> dict[int, Character]:
+    """
+    Read characters from a local snapshot file.
+
+    Args:
+        snapshot_path: Snapshot file path
+        char_ids: Character IDs to keep
+
+    Returns:
+        Dictionary of characters by ID
+    """
+    wanted = set(char_ids)
+    characters, _ = load_snapshot(snapshot_path)
+    return {
+        char.id: Character.from_dict(dataclasses.asdict(char))
+        for char in characters
+        if char.id in wanted
+    }
+
+
+def get_snapshot_argument() -> str | None:
+    """Return the value of --snapshot from the command line, if given."""
+    if '--snapshot' not in sys.argv:
+        return None
+    idx = sys.argv.index('--snapshot')
+    if idx + 1 >= len(sys.argv):
+        print("❌ --snapshot requires a file path")
+        sys.exit(1)
+    return sys.argv[idx + 1]
+
+
 def get_image_dimensions(image_path: Path) -> tuple[int, int] | None:
     """
     Get image dimensions using PIL.
@@ -442,14 +511,34 @@ def main():
 
     # Process missing metadata
     if len(missing) > 0:
-        # Connect to Supabase
-        print("Connecting to Supabase...")
-        try:
-            client = get_supabase_client()
-            print("✅ Connected\n")
-        except Exception as e:
-            print(f"❌ Failed to connect: {e}")
-            sys.exit(1)
+        # Parse all filenames first so characters can be fetched in bulk
+        parsed_images = {image_path: parse_filename(image_path.name) for image_path in missing}
+        char_ids = [parsed[0] for parsed in parsed_images.values() if parsed]
+
+        snapshot_path = get_snapshot_argument()
+        if snapshot_path:
+            print(f"Loading characters from snapshot: {snapshot_path}")
+            characters_by_id = load_characters_from_snapshot(snapshot_path, char_ids)
+            print(f"✅ Loaded {len(characters_by_id)} character(s)\n")
+        else:
+            # Connect to Supabase
+            print("Connecting to Supabase...")
+            try:
+                client = get_supabase_client()
+                print("✅ Connected\n")
+            except Exception as e:
+                print(f"❌ Failed to connect: {e}")
+                sys.exit(1)
+
+            print(f"Fetching {len(set(char_ids))} character(s)...")
+            try:
+                characters_by_id, query_count = prefetch_characters_from_db(client, char_ids)
+            except Exception as e:
+                print(f"❌ Database error: {e}")
+                sys.exit(1)
+            saved_queries = len(char_ids) - query_count
+            print(f"✅ Fetched {len(characters_by_id)} character(s) in {query_count} quer{'y' if query_count == 1 else 'ies'}"
+                  f" ({max(saved_queries, 0)} DB round trip(s) saved)\n")
 
         # Initialize scorer
         scorer = ImageScorer()
@@ -464,7 +553,7 @@ def main():
             print(f"[{idx}/{len(missing)}] {image_path.name}")
 
             # Parse filename
-            parsed = parse_filename(image_path.name)
+            parsed = parsed_images[image_path]
             if not parsed:
                 print(f"  ❌ Could not parse filename")
                 error_count += 1
@@ -473,8 +562,8 @@ def main():
             char_id, category, name = parsed
             print(f"  Parsed: ID={char_id}, Category={category}, Name={name}")
 
-            # Get character from database
-            character = get_character_from_db(client, char_id)
+            # Look up the prefetched character
+            character = characters_by_id.get(char_id)
             if not character:
                 print(f"  ❌ Character not found in database")
                 error_count += 1
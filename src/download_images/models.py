@@ -22,6 +22,10 @@ CATEGORIES = (
 )
 
 
+# Columns read by Character.from_dict (used as a Supabase column projection)
+CHARACTER_COLUMNS = "id,name,type,first_names,biography,birth_date,death_date"
+
+
 @dataclass
 class Character:
     """Character data from Supabase."""
@@ -56,6 +60,7 @@ class ImageInfo:
     height: int
     aspect_ratio: float
     score: float
+    sha1: Optional[str] = None  # File content hash reported by the API
 
     def is_valid_portrait(self) -> bool:
         """Check if image is in portrait orientation."""
@@ -0,0 +1,176 @@
+"""
+Persistent cache of Wikimedia API responses.
+Single Responsibility: Store and look up API responses by request.
+
+Responses are kept in a SQLite file keyed by a hash of the normalized request
+parameters, so re-running a batch, reviewing a rejected batch again or
+searching for the same thing for several characters (e.g. the Bayeux
+tapestry queries in custom_searches) is served locally. Raw responses are
+stored, so cached searches are still scored for the current character's
+category.
+
+Entries expire after CACHE_TTL_DAYS. Searches that found nothing, or nothing
+that passed the scorer, are stored as negative entries that expire after
+NEGATIVE_CACHE_TTL_DAYS, since new uploads can turn them into hits.
+"""
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Optional
+
+from .config import WikimediaConfig
+
+
+# Bump when the SQLite layout or key normalization changes
+SCHEMA_VERSION = 1
+
+# Parameters that do not change the result
+IGNORED_PARAMS = frozenset({'format', 'maxlag'})
+
+# Free-text parameters (search is case-insensitive)
+TEXT_PARAMS = frozenset({'gsrsearch', 'srsearch'})
+
+
+def normalize_params(params: dict) -> str:
+    """
+    Canonical form of API parameters: sorted, whitespace collapsed, search text lowercased.
+
+    Args:
+        params: API parameters
+
+    Returns:
+        JSON string identifying the request
+    """
+    normalized = {}
+    for name, value in params.items():
+        if name in IGNORED_PARAMS:
+            continue
+        value = ' '.join(str(value).split())
+        normalized[name] = value.lower() if name in TEXT_PARAMS else value
+    return json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of API responses with TTL and negative entries.
+    """
+
+    def __init__(self, path: str = None, ttl_days: float = None, negative_ttl_days: float = None,
+                 refresh: bool = False):
+        """
+        Open (or create) a cache file.
+
+        Args:
+            path: SQLite file (default: WikimediaConfig.CACHE_PATH; ':memory:' for a throwaway cache)
+            ttl_days: Days a response is served from the cache (default: CACHE_TTL_DAYS)
+            negative_ttl_days: Days an empty or rejected result is served (default: NEGATIVE_CACHE_TTL_DAYS)
+            refresh: If True, ignore cached entries and store fresh responses
+        """
+        self.path = path or WikimediaConfig.CACHE_PATH
+        self.ttl_seconds = (WikimediaConfig.CACHE_TTL_DAYS if ttl_days is None else ttl_days) * 86400
+        self.negative_ttl_seconds = (
+            WikimediaConfig.NEGATIVE_CACHE_TTL_DAYS if negative_ttl_days is None else negative_ttl_days
+        ) * 86400
+        self.refresh = refresh
+
+        # Statistics
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.stored = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row and row[0] != str(SCHEMA_VERSION):
+                self._conn.execute("DROP TABLE IF EXISTS responses")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),)
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, params TEXT NOT NULL, data TEXT NOT NULL, "
+                "negative INTEGER NOT NULL, fetched_at REAL NOT NULL)"
+            )
+            # Drop entries that can no longer be served
+            self._conn.execute(
+                "DELETE FROM responses WHERE fetched_at < ?",
+                (time.time() - max(self.ttl_seconds, self.negative_ttl_seconds),)
+            )
+
+    @staticmethod
+    def key(params: dict) -> str:
+        """Cache key of a request."""
+        return hashlib.sha256(normalize_params(params).encode()).hexdigest()
+
+    def get(self, params: dict) -> Optional[dict]:
+        """
+        Look up a response.
+
+        Args:
+            params: API parameters
+
+        Returns:
+            The cached response, or None if missing, expired or refreshing
+        """
+        with self._lock:
+            row = None
+            if not self.refresh:
+                row = self._conn.execute(
+                    "SELECT data, negative, fetched_at FROM responses WHERE key = ?", (self.key(params),)
+                ).fetchone()
+            if row:
+                data, negative, fetched_at = row
+                ttl = self.negative_ttl_seconds if negative else self.ttl_seconds
+                if time.time() - fetched_at < ttl:
+                    self.hits += 1
+                    self.negative_hits += negative
+                    return json.loads(data)
+            self.misses += 1
+            return None
+
+    def put(self, params: dict, data: dict, negative: bool = False):
+        """
+        Store a response.
+
+        Args:
+            params: API parameters
+            data: Parsed JSON response
+            negative: True if the response yielded no usable images
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, params, data, negative, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (self.key(params), normalize_params(params), json.dumps(data), int(negative), time.time())
+            )
+            self.stored += 1
+
+    def summary(self) -> str:
+        """One-line hit/miss statistics."""
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups * 100 if lookups else 0.0
+        return (
+            f"Wikimedia cache: {self.hits} hits ({self.negative_hits} negative), {self.misses} misses"
+            f"{' (refresh)' if self.refresh else ''}, {rate:.0f}% hit rate, {self.stored} stored"
+        )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_shared_cache: Optional[ResponseCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_cache() -> ResponseCache:
+    """Cache shared by every API client in the process (at WikimediaConfig.CACHE_PATH)."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = ResponseCache()
+        return _shared_cache
@@ -4,11 +4,17 @@ Save user-selected images to final directory.
 import sys
 import argparse
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Tuple
 
-from .models import Character, ImageInfo
+from .models import Character, ImageInfo, CHARACTER_COLUMNS
 from .file_manager import FileManager
-from src.supabase_client import get_supabase_client
+from src.supabase_client import get_supabase_client, stream_table
+
+
+# Worker threads used for copying images and rewriting metadata
+DEFAULT_WORKERS = 8
 
 
 def parse_selections(selection_text: str) -> dict:
@@ -35,6 +41,32 @@ def get_character_by_name(name: str) -> Character:
     return Character.from_dict(response.data[0])
 
 
+def get_characters_by_names(names: List[str]) -> Dict[str, Character]:
+    """
+    Fetch all named characters from Supabase in a single query.
+
+    Args:
+        names: Character names (case-insensitive)
+
+    Returns:
+        Dictionary mapping each upper-cased name that was found to its Character
+    """
+    upper_names = sorted({name.upper() for name in names})
+    if not upper_names:
+        return {}
+
+    client = get_supabase_client()
+    characters = {}
+    for character in stream_table(
+        client, 'character', CHARACTER_COLUMNS, Character.from_dict,
+        filters=lambda query: query.in_('name', upper_names)
+    ):
+        # Keep the first match, as get_character_by_name does
+        characters.setdefault(character.name, character)
+
+    return characters
+
+
 def save_selection(character: Character, image_number: int, review_dir: Path, output_dir: Path):
     """
     Save the selected image from review directory to final output.
@@ -45,6 +77,23 @@ def save_selection(character: Character, image_number: int, review_dir: Path, ou
         review_dir: Path to review directory
         output_dir: Path to output directory
     """
+    final_path, metadata_source = _copy_selection(character, image_number, review_dir, output_dir)
+
+    if metadata_source == 'copied':
+        print(f"  📋 Copied metadata from temp_candidates")
+    else:
+        print(f"  ⚠️  No metadata in temp_candidates, generating basic metadata")
+
+    return final_path
+
+
+def _copy_selection(character: Character, image_number: int, review_dir: Path, output_dir: Path) -> Tuple[Path, str]:
+    """
+    Copy the selected image and write its metadata without printing.
+
+    Returns:
+        Tuple of (final_path, metadata_source) where metadata_source is 'copied' or 'generated'
+    """
     import json
     from datetime import datetime
 
@@ -87,7 +136,7 @@ def save_selection(character: Character, image_number: int, review_dir: Path, ou
     if source_metadata.exists():
         # Copy existing metadata from temp_candidates
         shutil.copy2(source_metadata, metadata_path)
-        print(f"  📋 Copied metadata from temp_candidates")
+        metadata_source = 'copied'
 
         # Update rank and selection metadata in the copied file
         with open(metadata_path, 'r') as f:
@@ -101,7 +150,7 @@ def save_selection(character: Character, image_number: int, review_dir: Path, ou
             json.dump(metadata, f, indent=2)
     else:
         # Generate basic metadata as fallback
-        print(f"  ⚠️  No metadata in temp_candidates, generating basic metadata")
+        metadata_source = 'generated'
         basic_metadata = {
             'character_name': character.name,
             'character_id': character.id,
@@ -119,7 +168,54 @@ def save_selection(character: Character, image_number: int, review_dir: Path, ou
         with open(metadata_path, 'w') as f:
             json.dump(basic_metadata, f, indent=2)
 
-    return final_path
+    return final_path, metadata_source
+
+
+def save_selections_batch(
+    selections: Dict[str, int],
+    review_dir: Path,
+    output_dir: Path,
+    workers: int = DEFAULT_WORKERS
+) -> List[Tuple[str, int, bool, str]]:
+    """
+    Save many selections: one lookup query, then copies in a bounded worker pool.
+
+    Args:
+        selections: Mapping of character name to selected image number
+        review_dir: Path to review directory
+        output_dir: Path to output directory
+        workers: Maximum number of concurrent copy/metadata jobs
+
+    Returns:
+        List of (name, image_number, success, detail) in selection order, where detail
+        is the saved filename and metadata source, or the error message
+    """
+    characters = get_characters_by_names(list(selections))
+
+    def save_one(item: Tuple[str, int]) -> Tuple[str, int, bool, str]:
+        name, image_number = item
+        character = characters.get(name.upper())
+        if character is None:
+            return name, image_number, False, f"Character not found: {name}"
+        try:
+            final_path, metadata_source = _copy_selection(character, image_number, review_dir, output_dir)
+            return name, image_number, True, f"{final_path.name} (metadata {metadata_source})"
+        except Exception as e:
+            return name, image_number, False, str(e)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return list(executor.map(save_one, selections.items()))
+
+
+def print_results_table(results: List[Tuple[str, int, bool, str]]):
+    """Print one row per character with its selection outcome."""
+    name_width = max([len('Character')] + [len(name) for name, _, _, _ in results])
+
+    print(f"\n{'Character':<{name_width}}  {'Image':>5}  Result")
+    print("-" * 80)
+    for name, image_number, success, detail in results:
+        status = "✅" if success else "❌"
+        print(f"{name:<{name_width}}  {image_number:>5}  {status} {detail}")
 
 
 def main():
@@ -136,6 +232,12 @@ def main():
         help='Batch directory name (e.g., M_batch1, M_batch2). If not specified, uses sourced_images/review',
         default=None
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Number of concurrent copy jobs (default: {DEFAULT_WORKERS})'
+    )
 
     args = parser.parse_args()
     selection_text = args.selections
@@ -162,23 +264,10 @@ def main():
     output_dir = Path("sourced_images/wikimedia/by_character_id")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Process each selection
-    saved_count = 0
-    for char_name, image_num in selections.items():
-        print(f"\n[{char_name}] → Image #{image_num}")
-
-        try:
-            # Get character from database
-            character = get_character_by_name(char_name)
-
-            # Save selected image
-            final_path = save_selection(character, image_num, review_dir, output_dir)
-
-            print(f"  ✅ Saved: {final_path.name}")
-            saved_count += 1
-
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
+    # Resolve all names in one query, then copy files concurrently
+    results = save_selections_batch(selections, review_dir, output_dir, args.workers)
+    print_results_table(results)
+    saved_count = sum(1 for _, _, success, _ in results if success)
 
     print(f"\n{'='*80}")
     print(f"✅ Saved {saved_count}/{len(selections)} images")
@@ -9,6 +9,7 @@ from typing import List, Tuple
 from .interactive_selector import InteractiveImageSelector
 from .models import Character
 from .file_manager import FileManager
+from .sourcing_engine import SourcingEngine
 
 
 class SimpleReviewGenerator:
@@ -611,20 +612,37 @@ class SimpleReviewGenerator:
         with open(index_file, 'w') as f:
             f.write(html)
 
-    def process_batch(self, characters: List[Character], batch_size: int = 5, start_idx: int = 0):
-        """Process a batch of characters."""
+    def process_batch(self, characters: List[Character], batch_size: int = 5, start_idx: int = 0,
+                      concurrency: int = 1):
+        """Process a batch of characters (sourcing `concurrency` characters at a time)."""
         print(f"\nGenerating review pages for {batch_size} characters starting from #{start_idx + 1}...")
 
         # Slice to the batch we want
         batch_characters = characters[start_idx:start_idx + batch_size]
         actual_count = len(batch_characters)
 
+        # Download every character's candidates up front, several at a time
+        sourced = None
+        if concurrency > 1:
+            print(f"Sourcing {actual_count} characters, {concurrency} at a time...")
+            engine = SourcingEngine(
+                concurrency,
+                query_builder=self.selector.downloader.query_builder,
+                file_manager=self.selector.file_manager,
+                session=self.selector.downloader.api_client.session,
+                cache=self.selector.downloader.api_client.cache
+            )
+            sourced = engine.source_candidates(batch_characters, self.selector, max_candidates=15)
+
         for idx in range(actual_count):
             character = batch_characters[idx]
             print(f"\n[{idx + 1}/{actual_count}] {character.name}")
 
             # Download candidates
-            candidates = self.selector.download_candidates(character, max_candidates=15)
+            if sourced is not None:
+                candidates = sourced[idx]
+            else:
+                candidates = self.selector.download_candidates(character, max_candidates=15)
             if not candidates:
                 print(f"  ⚠️  No candidates - skipping")
                 continue
@@ -0,0 +1,166 @@
+"""
+Concurrent image sourcing for batches of characters.
+Single Responsibility: Schedule per-character searches and downloads concurrently.
+
+CharacterImageDownloader.download_batch and SimpleReviewGenerator.process_batch
+source one character after another, so a batch mostly waits on Wikimedia.
+The engine runs up to `concurrency` characters at once on an asyncio event
+loop. Each character gets its own WikimediaAPIClient and ImageScorer for its
+category, all on one WikimediaSession, whose per-host token buckets pace
+every request of the batch as one global rate limiter. The blocking HTTP
+calls run in a worker thread pool; files and metadata are written exactly as
+the sequential paths write them.
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from .models import ImageInfo
+from .config import DownloadConfig
+from .query_builder import QueryBuilder
+from .image_scorer import ImageScorer
+from .wikimedia_api import WikimediaAPIClient
+from .file_manager import FileManager
+from .http_session import WikimediaSession, get_session
+from .response_cache import ResponseCache, get_cache
+
+
+class SourcingEngine:
+    """
+    Sources images for several characters concurrently.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = None,
+        query_builder: Optional[QueryBuilder] = None,
+        file_manager: Optional[FileManager] = None,
+        session: Optional[WikimediaSession] = None,
+        config: Optional[DownloadConfig] = None,
+        cache: Optional[ResponseCache] = None
+    ):
+        """
+        Initialize engine with dependencies.
+
+        Args:
+            concurrency: Characters sourced at the same time (default: SOURCING_CONCURRENCY)
+            query_builder: Query builder for generating search queries
+            file_manager: File manager for saving files
+            session: HTTP session shared by all characters (uses the shared session if None)
+            config: Download configuration
+            cache: Response cache shared by all characters (uses the shared cache file if None)
+        """
+        self.config = config or DownloadConfig()
+        self.concurrency = max(1, concurrency or self.config.SOURCING_CONCURRENCY)
+        self.query_builder = query_builder or QueryBuilder()
+        self.session = session or get_session()
+        self.file_manager = file_manager or FileManager(session=self.session)
+        self.cache = cache or get_cache()
+
+    async def _search(self, executor: ThreadPoolExecutor, character) -> List[ImageInfo]:
+        """Search for one character's images with a category-specific scorer."""
+        queries = self.query_builder.build_queries(character)
+        if not queries:
+            return []
+        api_client = WikimediaAPIClient(
+            scorer=ImageScorer(category=character.type),
+            category=character.type,
+            session=self.session,
+            cache=self.cache
+        )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            lambda: api_client.search_with_queries(queries, max_results=self.config.STOP_AFTER_CANDIDATES)
+        )
+
+    async def _run(self, characters: List, source: Callable) -> list:
+        """
+        Run source(executor, character) for every character, at most `concurrency` at a time.
+
+        source returns (result, progress summary); results are returned in input order.
+        """
+        total = len(characters)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        # Searches and the downloads of each character run in parallel threads
+        executor = ThreadPoolExecutor(max_workers=self.concurrency * 2, thread_name_prefix="sourcing")
+
+        async def run_one(idx: int, character):
+            async with semaphore:
+                label = f"[{idx}/{total}] [{character.type}] {(character.name or '').strip()}"
+                print(f"  {label}: searching...")
+                start = time.perf_counter()
+                try:
+                    result, summary = await source(executor, character)
+                except Exception as e:
+                    result, summary = None, f"❌ {e}"
+                print(f"  {label}: {summary} ({time.perf_counter() - start:.1f}s)")
+                return result
+
+        try:
+            return await asyncio.gather(*(run_one(idx, character) for idx, character in enumerate(characters, 1)))
+        finally:
+            executor.shutdown(wait=True)
+
+    def download_batch(self, characters: List, output_dir: Optional[Path] = None) -> tuple[int, int]:
+        """
+        Download primary and alternative images for multiple characters.
+
+        Same files and metadata JSON as CharacterImageDownloader.download_batch.
+
+        Args:
+            characters: List of character objects
+            output_dir: Output directory (uses default if None)
+
+        Returns:
+            Tuple of (success_count, total_count)
+        """
+        output_dir = self.file_manager.ensure_output_dir(output_dir)
+        max_downloads = self.config.MAX_ALTERNATIVES + 1
+
+        async def source(executor: ThreadPoolExecutor, character):
+            results = await self._search(executor, character)
+            if not results:
+                return 0, "❌ No suitable images found"
+            loop = asyncio.get_running_loop()
+            downloaded = await asyncio.gather(*(
+                loop.run_in_executor(
+                    executor, self.file_manager.download_with_metadata, character, image_info, output_dir, rank
+                )
+                for rank, image_info in enumerate(results[:max_downloads], 1)
+            ))
+            count = sum(downloaded)
+            return count, f"{len(results)} candidates, 📊 downloaded {count} image(s)"
+
+        counts = asyncio.run(self._run(characters, source))
+        return sum(1 for count in counts if count), len(characters)
+
+    def source_candidates(self, characters: List, selector, max_candidates: int = 15) -> List[List[tuple]]:
+        """
+        Download review candidates for multiple characters.
+
+        Same temp files and metadata as InteractiveImageSelector.download_candidates.
+
+        Args:
+            characters: List of Character objects
+            selector: InteractiveImageSelector that stores the candidates
+            max_candidates: Maximum number of candidates per character
+
+        Returns:
+            List of (ImageInfo, filepath) tuples per character, in input order
+        """
+        async def source(executor: ThreadPoolExecutor, character):
+            results = await self._search(executor, character)
+            if not results:
+                return [], "❌ No suitable images found"
+            loop = asyncio.get_running_loop()
+            paths = await asyncio.gather(*(
+                loop.run_in_executor(executor, selector.download_candidate, character, image_info, idx)
+                for idx, image_info in enumerate(results[:max_candidates], 1)
+            ))
+            candidates = [(image_info, path) for image_info, path in zip(results, paths) if path]
+            return candidates, f"📦 Downloaded {len(candidates)}/{len(paths)} candidates"
+
+        return [candidates or [] for candidates in asyncio.run(self._run(characters, source))]
@@ -9,10 +9,16 @@ Usage:
   python -m src.download_images.web_main --ids ID1,ID2,ID3,...
   python -m src.download_images.web_main --ids ID1 ID2 ID3 ...
 
+Options:
+  --concurrency N   Characters sourced at the same time (default: 4, 1 = one after another)
+  --refresh         Ignore cached Wikimedia responses (fresh responses are still cached)
+
 Examples:
   python -m src.download_images.web_main I 5 0
   python -m src.download_images.web_main --ids 172,250,266,269,272,276
   python -m src.download_images.web_main --ids 172 250 266
+  python -m src.download_images.web_main --concurrency 8 I 20 0
+  python -m src.download_images.web_main --refresh --ids 172
 """
 import sys
 import os
@@ -23,9 +29,11 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.download_images.simple_review import SimpleReviewGenerator
-from src.download_images.models import Character
+from src.download_images.models import Character, CHARACTER_COLUMNS
+from src.download_images.config import DownloadConfig
+from src.download_images.response_cache import get_cache
 from src.download_images.port_manager import PortManager
-from src.supabase_client import get_supabase_client
+from src.supabase_client import get_supabase_client, stream_table
 
 
 def start_http_server(port: int, directory: Path) -> int:
@@ -49,6 +57,33 @@ def start_http_server(port: int, directory: Path) -> int:
     return process.pid
 
 
+def parse_concurrency(args) -> int:
+    """
+    Remove --concurrency N from the command line arguments.
+
+    Args:
+        args: Command line arguments (modified in place)
+
+    Returns:
+        Concurrency level (DownloadConfig.SOURCING_CONCURRENCY if not given)
+    """
+    if '--concurrency' not in args:
+        return DownloadConfig.SOURCING_CONCURRENCY
+
+    position = args.index('--concurrency')
+    try:
+        concurrency = int(args[position + 1])
+    except (IndexError, ValueError):
+        print("Error: --concurrency requires a number")
+        sys.exit(1)
+    if concurrency < 1:
+        print("Error: --concurrency must be at least 1")
+        sys.exit(1)
+
+    del args[position:position + 2]
+    return concurrency
+
+
 def parse_character_ids(args):
     """
     Parse character IDs from command line arguments.
@@ -90,6 +125,12 @@ def parse_character_ids(args):
 
 def main():
     """Main entry point."""
+    concurrency = parse_concurrency(sys.argv)
+    cache = get_cache()
+    if '--refresh' in sys.argv:
+        sys.argv.remove('--refresh')
+        cache.refresh = True
+
     # Check if using --ids mode
     char_ids = parse_character_ids(sys.argv)
 
@@ -111,8 +152,10 @@ def main():
         client = get_supabase_client()
 
         # Fetch characters by ID
-        response = client.table('character').select('*').in_('id', char_ids).execute()
-        characters = [Character.from_dict(row) for row in response.data]
+        characters = list(stream_table(
+            client, 'character', CHARACTER_COLUMNS, Character.from_dict,
+            filters=lambda query: query.in_('id', char_ids)
+        ))
 
         # Sort by ID to match the order given
         id_to_char = {char.id: char for char in characters}
@@ -154,13 +197,11 @@ def main():
         client = get_supabase_client()
 
         # Fetch characters
-        query = client.table('character').select('*')
-        if category_filter:
-            query = query.eq('type', category_filter)
-        query = query.order('type').order('name')
-
-        response = query.execute()
-        characters = [Character.from_dict(row) for row in response.data]
+        characters = list(stream_table(
+            client, 'character', CHARACTER_COLUMNS, Character.from_dict,
+            filters=(lambda query: query.eq('type', category_filter)) if category_filter else None,
+            order_by=('type', 'name')
+        ))
 
         print(f"Total characters: {len(characters)}")
 
@@ -171,7 +212,8 @@ def main():
     print(f"Batch ID: {batch_id}")
 
     generator = SimpleReviewGenerator(batch_id=batch_id)
-    generator.process_batch(characters, batch_size, start_idx)
+    generator.process_batch(characters, batch_size, start_idx, concurrency)
+    print(cache.summary())
 
     # Find available port and start HTTP server
     port_manager = PortManager()
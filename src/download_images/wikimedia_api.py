@@ -3,12 +3,16 @@ Wikimedia Commons API client.
 Single Responsibility: Handle all API interactions with Wikimedia.
 Interface Segregation: Clear, focused interface for API operations.
 """
-import time
-import requests
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from .models import ImageInfo
 from .config import WikimediaConfig
 from .image_scorer import ImageScorer
+from .http_session import WikimediaSession, get_session
+from .response_cache import ResponseCache, get_cache
+
+
+# Image properties requested with every imageinfo query
+IMAGEINFO_PROPS = 'url|size|mime|sha1'
 
 
 class WikimediaAPIClient:
@@ -17,7 +21,8 @@ class WikimediaAPIClient:
     Handles searching and fetching image information.
     """
 
-    def __init__(self, config: WikimediaConfig = None, scorer: ImageScorer = None, category: str = None):
+    def __init__(self, config: WikimediaConfig = None, scorer: ImageScorer = None, category: str = None,
+                 session: WikimediaSession = None, cache: ResponseCache = None):
         """
         Initialize API client.
 
@@ -25,10 +30,75 @@ class WikimediaAPIClient:
             config: Wikimedia configuration (uses default if None)
             scorer: Image scorer for evaluating results (uses default if None)
             category: Character category code for category-specific scoring
+            session: HTTP session pacing the requests (if None: the shared session, or a
+                session of its own built from config if one is given)
+            cache: Response cache (uses the shared cache file if None)
         """
         self.config = config or WikimediaConfig()
         self.category = category
         self.scorer = scorer or ImageScorer(category=category)
+        self.session = session or get_session(config)
+        self.cache = cache or get_cache()
+
+    def _query(self, params: dict) -> Tuple[dict, bool]:
+        """
+        Run an API query, from the response cache if possible.
+
+        Returns:
+            Tuple of (parsed response, True if it came from the cache)
+        """
+        data = self.cache.get(params)
+        if data is not None:
+            return data, True
+
+        response = self.session.api_get(params)
+        response.raise_for_status()
+        return response.json(), False
+
+    def _remember(self, params: dict, data: dict, cached: bool, negative: bool):
+        """Store a fresh response; negative if it yielded no usable image."""
+        # API errors (e.g. maxlag after every retry) are not cached
+        if not cached and 'error' not in data:
+            self.cache.put(params, data, negative)
+
+    def _create_image_info(self, title: str, info: dict, log_rejections: bool = False) -> Optional[ImageInfo]:
+        """
+        Validate and score one imageinfo entry from the API.
+
+        Args:
+            title: Wikimedia image title (e.g., "File:Portrait.jpg")
+            info: First entry of the page's imageinfo list
+            log_rejections: If True, print rejection reasons
+
+        Returns:
+            ImageInfo object if image is valid, None otherwise
+        """
+        width = info.get('width', 0)
+        height = info.get('height', 0)
+        url = info.get('url', '')
+        mime = info.get('mime', '')
+
+        # Filter for supported image formats (JPEG and PNG)
+        if mime not in ['image/jpeg', 'image/png']:
+            if log_rejections:
+                print(f"        ❌ {title[:50]}... - Unsupported format: {mime}")
+                print(f"           URL: {url[:80]}...")
+            return None
+
+        # Use scorer to validate and create ImageInfo
+        image_info = self.scorer.create_image_info(url, title, width, height)
+
+        if image_info is None:
+            if log_rejections:
+                # Get validation details for logging
+                validation_errors = self.scorer.is_valid_image(width, height)
+                if validation_errors:
+                    print(f"        ❌ {title[:50]}... - {', '.join(validation_errors)}")
+                    print(f"           Size: {width}x{height}, URL: {url[:60]}...")
+            return None
+
+        image_info.sha1 = info.get('sha1')
+        return image_info
 
     def get_image_info(self, title: str, log_rejections: bool = False) -> Optional[ImageInfo]:
         """
@@ -44,50 +114,21 @@ class WikimediaAPIClient:
         try:
             params = {
                 'action': 'query',
-                'format': 'json',
                 'titles': title,
                 'prop': 'imageinfo',
-                'iiprop': 'url|size|mime',
+                'iiprop': IMAGEINFO_PROPS,
             }
 
-            response = requests.get(
-                self.config.API_URL,
-                params=params,
-                headers=self.config.HEADERS,
-                timeout=self.config.REQUEST_TIMEOUT_SECONDS
-            )
-            response.raise_for_status()
-            data = response.json()
+            data, cached = self._query(params)
 
             pages = data.get('query', {}).get('pages', {})
             for page_id, page_data in pages.items():
                 if 'imageinfo' in page_data and len(page_data['imageinfo']) > 0:
-                    info = page_data['imageinfo'][0]
-
-                    width = info.get('width', 0)
-                    height = info.get('height', 0)
-                    url = info.get('url', '')
-                    mime = info.get('mime', '')
-
-                    # Filter for supported image formats (JPEG and PNG)
-                    if mime not in ['image/jpeg', 'image/png']:
-                        if log_rejections:
-                            print(f"        ❌ {title[:50]}... - Unsupported format: {mime}")
-                            print(f"           URL: {url[:80]}...")
-                        return None
-
-                    # Use scorer to validate and create ImageInfo
-                    image_info = self.scorer.create_image_info(url, title, width, height)
-
-                    if image_info is None and log_rejections:
-                        # Get validation details for logging
-                        validation_errors = self.scorer.is_valid_image(width, height)
-                        if validation_errors:
-                            print(f"        ❌ {title[:50]}... - {', '.join(validation_errors)}")
-                            print(f"           Size: {width}x{height}, URL: {url[:60]}...")
-
+                    image_info = self._create_image_info(title, page_data['imageinfo'][0], log_rejections)
+                    self._remember(params, data, cached, negative=image_info is None)
                     return image_info
 
+            self._remember(params, data, cached, negative=True)
             if log_rejections:
                 print(f"        ❌ {title[:50]}... - No image info available")
             return None
@@ -101,6 +142,9 @@ class WikimediaAPIClient:
         """
         Search Wikimedia Commons for images.
 
+        Uses the search as a generator for prop=imageinfo, so the hits and
+        their URL, size, MIME type and SHA-1 come back in a single request.
+
         Args:
             query: Search query string
             limit: Maximum number of results to fetch
@@ -115,30 +159,26 @@ class WikimediaAPIClient:
         try:
             params = {
                 'action': 'query',
-                'format': 'json',
-                'list': 'search',
-                'srsearch': query,
-                'srnamespace': '6',  # File namespace
-                'srlimit': limit,
+                'generator': 'search',
+                'gsrsearch': query,
+                'gsrnamespace': '6',  # File namespace
+                'gsrlimit': limit,
+                'prop': 'imageinfo',
+                'iiprop': IMAGEINFO_PROPS,
             }
 
-            response = requests.get(
-                self.config.API_URL,
-                params=params,
-                headers=self.config.HEADERS,
-                timeout=self.config.REQUEST_TIMEOUT_SECONDS
-            )
-            response.raise_for_status()
-            data = response.json()
+            data, cached = self._query(params)
 
-            if 'query' not in data or 'search' not in data['query']:
+            if 'query' not in data or 'pages' not in data['query']:
+                self._remember(params, data, cached, negative=True)
                 if verbose:
                     print(f"      📊 Query: '{query[:60]}...'")
                     print(f"         Found: 0 images, Accepted: 0")
                 return []
 
-            search_results = data['query']['search']
-            found_count = len(search_results)
+            # Pages are keyed by page ID; 'index' is the search rank
+            pages = sorted(data['query']['pages'].values(), key=lambda page: page.get('index', 0))
+            found_count = len(pages)
             accepted_count = 0
             rejected_count = 0
 
@@ -147,9 +187,14 @@ class WikimediaAPIClient:
                 print(f"         Found: {found_count} images from API")
 
             results = []
-            for search_result in search_results:
-                title = search_result['title']
-                image_info = self.get_image_info(title, log_rejections=verbose)
+            for page in pages:
+                title = page['title']
+                if page.get('imageinfo'):
+                    image_info = self._create_image_info(title, page['imageinfo'][0], log_rejections=verbose)
+                else:
+                    image_info = None
+                    if verbose:
+                        print(f"        ❌ {title[:50]}... - No image info available")
                 if image_info:
                     results.append(image_info)
                     accepted_count += 1
@@ -158,8 +203,8 @@ class WikimediaAPIClient:
                         print(f"           Size: {image_info.width}x{image_info.height}, Ratio: {image_info.aspect_ratio:.3f}")
                 else:
                     rejected_count += 1
-                time.sleep(self.config.SEARCH_DELAY_SECONDS)
 
+            self._remember(params, data, cached, negative=accepted_count == 0)
             if verbose:
                 print(f"         Accepted: {accepted_count}, Rejected: {rejected_count}")
 
@@ -186,6 +231,7 @@ class WikimediaAPIClient:
         """
         all_results = []
         seen_urls = set()
+        seen_hashes = set()  # The same file is sometimes uploaded under several titles
 
         if verbose:
             print(f"\n    🔍 Searching with {len(queries)} queries (max results: {max_results or 'unlimited'})")
@@ -202,8 +248,10 @@ class WikimediaAPIClient:
 
             # Add unique results
             for result in results:
-                if result.url not in seen_urls:
+                if result.url not in seen_urls and (result.sha1 is None or result.sha1 not in seen_hashes):
                     seen_urls.add(result.url)
+                    if result.sha1:
+                        seen_hashes.add(result.sha1)
                     all_results.append(result)
                     unique_count += 1
                 else:
@@ -213,9 +261,6 @@ class WikimediaAPIClient:
                 print(f"         New unique: {unique_count}, Duplicates: {duplicate_count}")
                 print(f"         Total candidates so far: {len(all_results)}")
 
-            # Add delay between queries
-            time.sleep(self.config.API_DELAY_SECONDS)
-
             # Stop if we have enough candidates
             if max_results and len(all_results) >= max_results:
                 if verbose:
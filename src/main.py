@@ -11,11 +11,79 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import click
 from reportlab.lib.units import mm
-from src.supabase_client import get_supabase_client, fetch_all_card_data, fetch_single_card_data
-from src.cards import generate_cards_pdf, generate_single_card_pdf
+from src.supabase_client import (
+    get_supabase_client, fetch_single_card_data,
+    build_single_card_data, iter_card_data, count_connections,
+    fetch_all_characters, fetch_all_connections,
+    CHARACTER_LIST_COLUMNS, CONNECTION_LINK_COLUMNS
+)
+from src.snapshot import create_snapshot, refresh_snapshot, load_snapshot, DEFAULT_SNAPSHOT_PATH, WATERMARK_COLUMN
+from src.page_library import generate_cards_pdf_incremental
+from src.cards import generate_cards_pdf, generate_single_card_pdf, generate_imposed_pdf, render_parallel, PAPER_SIZES
+from src.card.cache_warmer import warm_image_cache, refresh_bucket_index, revalidate_image, missing_images, WARM_WORKERS
 from src.config import CORNER_RADIUS
 
 
+def parse_imposition(ctx, param, value):
+    """Parse an imposition grid such as '3x3' into (columns, rows)."""
+    if value is None:
+        return None
+    try:
+        columns, rows = (int(part) for part in value.lower().split('x'))
+    except ValueError:
+        raise click.BadParameter("expected COLUMNSxROWS, e.g. 3x3")
+    if columns < 1 or rows < 1:
+        raise click.BadParameter("columns and rows must be at least 1")
+    return columns, rows
+
+
+def prepare_image_cache(client, image_links: list, offline: bool, download_workers: int = 0):
+    """
+    Validate the image cache against the bucket and fetch missing portraits.
+
+    Returns:
+        The client to download images with, or None to use only the local cache
+    """
+    if client is None or offline:
+        missing = missing_images(image_links)
+        if missing:
+            click.echo(f"Warning: {len(missing)} portraits are not in the image cache and will be left out "
+                       f"(run 'python manage_cache.py warm' while online)", err=True)
+        return None
+
+    try:
+        objects, stale = refresh_bucket_index(client)
+        click.echo(f"Image bucket: {objects} files, {stale} cached files changed")
+    except Exception as e:
+        click.echo(f"Warning: could not list the image bucket, cached images are not validated: {e}", err=True)
+
+    if download_workers:
+        click.echo("Warming image cache...")
+        result = warm_image_cache(client, image_links, workers=download_workers)
+        click.echo(result.summary())
+        for filename, error in result.failed:
+            click.echo(f"  Failed: {filename}: {error}", err=True)
+
+    return client
+
+
+def prepare_single_image(client, image_link: str, offline: bool):
+    """
+    Validate the cached portrait of one card by downloading it and its metadata again.
+
+    Returns:
+        The client to download images with, or None to use only the local cache
+    """
+    if client is None or offline:
+        return prepare_image_cache(client, [image_link], offline)
+
+    failed = revalidate_image(client, image_link)
+    for filename, error in failed:
+        click.echo(f"Warning: could not download {filename}, using the cached copy if any: {error}", err=True)
+    # The portrait is freshly cached unless a download failed
+    return client if failed else None
+
+
 @click.group()
 def cli():
     """Millennium Card Producer - Generate printable character cards."""
@@ -59,31 +127,131 @@ def cli():
     default=None,
     help='Corner radius in mm for rounded edges (default: from config.py)'
 )
-def generate_all(output: str, fronts_only: bool, separate_pages: bool, width: float, crop_marks: bool, corner_radius: float):
+@click.option(
+    '--snapshot',
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help='Read characters and connections from a local snapshot instead of Supabase'
+)
+@click.option(
+    '--imposition',
+    callback=parse_imposition,
+    default=None,
+    metavar='COLSxROWS',
+    help='Pack cards onto full sheets in a grid (e.g. 3x3), backs mirrored for duplex printing'
+)
+@click.option(
+    '--paper',
+    type=click.Choice(sorted(PAPER_SIZES), case_sensitive=False),
+    default='a4',
+    help='Sheet size for --imposition (default: a4)'
+)
+@click.option(
+    '--workers',
+    '-j',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Render the deck in N parallel processes (default: 1)'
+)
+@click.option(
+    '--download-workers',
+    type=click.IntRange(min=0),
+    default=WARM_WORKERS,
+    help=f'Download missing portraits with N concurrent requests before rendering, 0 to fetch them lazily (default: {WARM_WORKERS})'
+)
+@click.option(
+    '--offline',
+    is_flag=True,
+    help='Use only the local image cache and never contact the storage bucket'
+)
+@click.option(
+    '--incremental',
+    is_flag=True,
+    help='Reuse unchanged cards from the page library (page_cache/) and render only changed ones'
+)
+def generate_all(output: str, fronts_only: bool, separate_pages: bool, width: float, crop_marks: bool, corner_radius: float, snapshot: str, imposition: tuple, paper: str, workers: int, download_workers: int, offline: bool, incremental: bool):
     """
     Generate PDF with all character cards from Supabase.
 
     This command fetches all characters and their connections from Supabase,
     denormalizes the data, and generates a printable PDF with card fronts
     and backs arranged for double-sided printing.
-    """
-    try:
-        click.echo("Connecting to Supabase...")
-        client = get_supabase_client()
 
-        click.echo("Fetching character data...")
-        card_data_list = fetch_all_card_data(client)
+    With --snapshot, data is read from a local snapshot file and no connection
+    to Supabase is made (portraits are taken from the local image cache).
+
+    With --imposition, cards are packed onto A4/Letter sheets instead of one
+    card per page; each front sheet is followed by its mirrored back sheet.
+    Without --width, cards are sized to the largest width that fits the sheet.
+
+    With --workers N, the deck is split into N contiguous parts rendered in
+    parallel processes and merged in card order.
+
+    Before rendering, the local image cache is validated against one listing
+    of the storage bucket and missing portraits and their metadata are
+    downloaded concurrently (--download-workers). With --offline (implied by
+    --snapshot), only the local image cache is used.
 
-        if not card_data_list:
+    With --incremental, each card's pages are kept in a page library keyed by
+    a hash of the card's data, portrait and render options; only cards whose
+    hash changed are rendered and the PDF is assembled from the library.
+
+    Examples:
+        python src/main.py generate-all --imposition 3x3 --crop-marks
+        python src/main.py generate-all --imposition 3x3 --paper letter
+        python src/main.py generate-all --workers 8
+        python src/main.py generate-all --incremental
+    """
+    if incremental and (imposition or workers > 1):
+        raise click.UsageError("--incremental cannot be combined with --imposition or --workers")
+
+    try:
+        if snapshot:
+            click.echo(f"Loading snapshot: {snapshot}")
+            client = None
+            characters, connections = load_snapshot(snapshot)
+        else:
+            click.echo("Connecting to Supabase...")
+            client = get_supabase_client()
+
+            click.echo("Fetching character data...")
+            characters = fetch_all_characters(client)
+            connections = fetch_all_connections(client)
+
+        if not characters:
             click.echo("No characters found in database.", err=True)
             return
 
-        click.echo(f"Found {len(card_data_list)} characters")
+        click.echo(f"Found {len(characters)} characters")
+
+        image_client = prepare_image_cache(client, [c.image_link for c in characters], offline, download_workers)
 
         click.echo(f"Generating PDF: {output}")
         card_width_mm = width * mm if width is not None else None
         corner_radius_mm = corner_radius * mm if corner_radius is not None else CORNER_RADIUS
-        generate_cards_pdf(card_data_list, output, fronts_only=fronts_only, separate_pages=separate_pages, card_width=card_width_mm, crop_marks=crop_marks, corner_radius=corner_radius_mm, supabase_client=client)
+        options = dict(fronts_only=fronts_only, card_width=card_width_mm, crop_marks=crop_marks, corner_radius=corner_radius_mm)
+        if imposition:
+            columns, rows = imposition
+            render = generate_imposed_pdf
+            options.update(columns=columns, rows=rows, paper=PAPER_SIZES[paper.lower()])
+            chunk_multiple = columns * rows
+        else:
+            render = generate_cards_pdf
+            options.update(separate_pages=separate_pages)
+            chunk_multiple = 1
+
+        # Card data is built lazily and streamed into single-process per-card renders;
+        # parallel and imposed renders split the deck, so they need all of it at once
+        card_data = iter_card_data(characters, connections)
+        if workers > 1:
+            render_parallel(render, list(card_data), output, workers, supabase_client=image_client, chunk_multiple=chunk_multiple, **options)
+        elif imposition:
+            render(list(card_data), output, supabase_client=image_client, **options)
+        elif incremental:
+            rendered, reused = generate_cards_pdf_incremental(card_data, output, supabase_client=image_client, **options)
+            click.echo(f"Rendered {rendered} changed cards, reused {reused} from the page library")
+        else:
+            render(card_data, output, supabase_client=image_client, **options)
 
         click.echo(click.style("✓ Cards generated successfully!", fg='green'))
 
@@ -125,7 +293,18 @@ def generate_all(output: str, fronts_only: bool, separate_pages: bool, width: fl
     default=None,
     help='Corner radius in mm for rounded edges (default: from config.py)'
 )
-def generate_single(character_name: str, output: str, separate_pages: bool, width: float, crop_marks: bool, corner_radius: float):
+@click.option(
+    '--snapshot',
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help='Read characters and connections from a local snapshot instead of Supabase'
+)
+@click.option(
+    '--offline',
+    is_flag=True,
+    help='Use only the local image cache and never contact the storage bucket'
+)
+def generate_single(character_name: str, output: str, separate_pages: bool, width: float, crop_marks: bool, corner_radius: float, snapshot: str, offline: bool):
     """
     Generate a preview PDF for a single character card.
 
@@ -141,11 +320,17 @@ def generate_single(character_name: str, output: str, separate_pages: bool, widt
         python src/main.py generate-single newton -o newton_card.pdf
     """
     try:
-        click.echo(f"Connecting to Supabase...")
-        client = get_supabase_client()
-
-        click.echo(f"Fetching character data...")
-        card_data, partial_matches, card_number = fetch_single_card_data(client, character_name)
+        if snapshot:
+            click.echo(f"Loading snapshot: {snapshot}")
+            client = None
+            characters, connections = load_snapshot(snapshot)
+            card_data, partial_matches, card_number = build_single_card_data(characters, connections, character_name)
+        else:
+            click.echo(f"Connecting to Supabase...")
+            client = get_supabase_client()
+
+            click.echo(f"Fetching character data...")
+            card_data, partial_matches, card_number = fetch_single_card_data(client, character_name)
 
         if not card_data:
             if partial_matches:
@@ -160,7 +345,8 @@ def generate_single(character_name: str, output: str, separate_pages: bool, widt
         click.echo(f"Generating preview PDF for {card_data.character.name}: {output}")
         card_width_mm = width * mm if width is not None else None
         corner_radius_mm = corner_radius * mm if corner_radius is not None else CORNER_RADIUS
-        generate_single_card_pdf(card_data, output, card_number, separate_pages=separate_pages, card_width=card_width_mm, crop_marks=crop_marks, corner_radius=corner_radius_mm, supabase_client=client)
+        image_client = prepare_single_image(client, card_data.character.image_link, offline)
+        generate_single_card_pdf(card_data, output, card_number, separate_pages=separate_pages, card_width=card_width_mm, crop_marks=crop_marks, corner_radius=corner_radius_mm, supabase_client=image_client)
 
         click.echo(click.style("✓ Card preview generated successfully!", fg='green'))
 
@@ -190,7 +376,13 @@ def generate_single(character_name: str, output: str, separate_pages: bool, widt
     is_flag=True,
     help='Reverse sort order (descending)'
 )
-def list_characters(sort_by: str, sort_by_2: str, reverse: bool):
+@click.option(
+    '--snapshot',
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help='Read characters and connections from a local snapshot instead of Supabase'
+)
+def list_characters(sort_by: str, sort_by_2: str, reverse: bool, snapshot: str):
     """
     List all characters in the database.
 
@@ -205,19 +397,27 @@ def list_characters(sort_by: str, sort_by_2: str, reverse: bool):
         $ python src/main.py list-characters -s birth_date
     """
     try:
-        click.echo("Connecting to Supabase...")
-        client = get_supabase_client()
-
-        click.echo("Fetching characters...")
-        card_data_list = fetch_all_card_data(client)
-
-        if not card_data_list:
+        if snapshot:
+            click.echo(f"Loading snapshot: {snapshot}")
+            characters, connections = load_snapshot(snapshot)
+        else:
+            click.echo("Connecting to Supabase...")
+            client = get_supabase_client()
+
+            click.echo("Fetching characters...")
+            # Only the listed columns are needed, so skip biographies and connection texts
+            characters = fetch_all_characters(client, CHARACTER_LIST_COLUMNS)
+            connections = fetch_all_connections(client, CONNECTION_LINK_COLUMNS)
+
+        if not characters:
             click.echo("No characters found in database.")
             return
 
+        # Count connections per character without building full card data
+        connection_counts = count_connections(characters, connections)
+
         # Create sorting key function
-        def get_sort_key(data):
-            char = data.character
+        def get_sort_key(char):
             keys = []
 
             for field in [sort_by, sort_by_2]:
@@ -235,12 +435,12 @@ def list_characters(sort_by: str, sort_by_2: str, reverse: bool):
                 elif field == 'death_date':
                     keys.append(char.death_date or "")
                 elif field == 'connections':
-                    keys.append(len(data.connections))
+                    keys.append(connection_counts[char.id])
 
             return tuple(keys)
 
         # Sort the data
-        sorted_data = sorted(card_data_list, key=get_sort_key, reverse=reverse)
+        sorted_characters = sorted(characters, key=get_sort_key, reverse=reverse)
 
         # Display sort information
         sort_info = f"Sorted by: {sort_by}"
@@ -249,20 +449,19 @@ def list_characters(sort_by: str, sort_by_2: str, reverse: bool):
         if reverse:
             sort_info += " (descending)"
 
-        click.echo(f"\nFound {len(sorted_data)} characters")
+        click.echo(f"\nFound {len(sorted_characters)} characters")
         click.echo(f"{sort_info}\n")
 
-        for idx, data in enumerate(sorted_data, 1):
-            char = data.character
+        for idx, char in enumerate(sorted_characters, 1):
             category = char.type or "?"
             name = char.name or "Unknown"
             first_names = f" ({char.first_names})" if char.first_names else ""
             full_display = f"{name}{first_names}"
             dates = f"{char.birth_date or '?'}-{char.death_date or '?'}"
-            connections = len(data.connections)
+            num_connections = connection_counts[char.id]
 
             click.echo(
-                f"{idx:3d}. [{category}] {full_display:40s} ({dates}) - {connections} connections"
+                f"{idx:3d}. [{category}] {full_display:40s} ({dates}) - {num_connections} connections"
             )
 
     except Exception as e:
@@ -270,5 +469,56 @@ def list_characters(sort_by: str, sort_by_2: str, reverse: bool):
         raise click.Abort()
 
 
+@cli.command()
+@click.option(
+    '--output',
+    '-o',
+    default=DEFAULT_SNAPSHOT_PATH,
+    help=f'Snapshot file path (default: {DEFAULT_SNAPSHOT_PATH})'
+)
+@click.option(
+    '--refresh',
+    is_flag=True,
+    help='Only pull rows changed since the snapshot was last saved (tables without updated_at are reloaded in full)'
+)
+def snapshot(output: str, refresh: bool):
+    """
+    Save the character and connection tables to a local SQLite snapshot.
+
+    The snapshot can then be passed to generate-all, generate-single and
+    list-characters with --snapshot to work without network access.
+
+    Examples:
+        $ python src/main.py snapshot
+        $ python src/main.py snapshot --refresh
+        $ python src/main.py generate-all --snapshot millennium_snapshot.db
+    """
+    try:
+        click.echo("Connecting to Supabase...")
+        client = get_supabase_client()
+
+        if refresh:
+            click.echo(f"Refreshing snapshot: {output}")
+            stats = refresh_snapshot(client, output)
+            for table in ('character', 'connection'):
+                updated, deleted = stats[table]
+                if table in stats['reloaded']:
+                    click.echo(f"  {table}: no {WATERMARK_COLUMN} column, reloaded in full "
+                               f"({updated} rows, {deleted} deleted)")
+                else:
+                    click.echo(f"  {table}: {updated} updated, {deleted} deleted")
+        else:
+            click.echo(f"Saving snapshot: {output}")
+            stats = create_snapshot(client, output)
+            for table in ('character', 'connection'):
+                click.echo(f"  {table}: {stats[table]} rows")
+
+        click.echo(click.style(f"✓ Snapshot version {stats['version']} saved", fg='green'))
+
+    except Exception as e:
+        click.echo(click.style(f"Error: {str(e)}", fg='red'), err=True)
+        raise click.Abort()
+
+
 if __name__ == '__main__':
     cli()
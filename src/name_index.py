@@ -0,0 +1,122 @@
+"""
+Normalized character-name index for ranked "did you mean" suggestions.
+
+Names are normalized (accents stripped, upper case, punctuation collapsed) and
+split into trigrams, so misspelled or partial names can be matched without
+scanning and comparing every character. The rows behind the index are small
+(id, name, first_names) and are cached in a local JSON file between runs.
+"""
+import json
+import os
+import re
+import time
+import unicodedata
+from typing import Dict, List, Optional, Set
+from src.types.supabase_types import Character
+
+
+# Columns needed to build the index
+NAME_INDEX_COLUMNS = "id,name,first_names"
+
+# Cache file at project root
+DEFAULT_NAME_INDEX_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'name_index_cache.json')
+
+# Rebuild the cached index after one day
+NAME_INDEX_MAX_AGE_SECONDS = 24 * 60 * 60
+
+# Minimum trigram similarity (0-1) for a fuzzy suggestion
+MIN_SIMILARITY = 0.3
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """Upper-case a name, strip accents and collapse punctuation to single spaces."""
+    decomposed = unicodedata.normalize("NFKD", name or "")
+    without_accents = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return re.sub(r"[^0-9A-Z]+", " ", without_accents.upper()).strip()
+
+
+def trigrams(normalized: str) -> Set[str]:
+    """Return the trigrams of each word, padded like pg_trgm ("  WO", " WOR", ..., "RD ")."""
+    grams = set()
+    for word in normalized.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class NameIndex:
+    """Trigram index over character names."""
+
+    def __init__(self, characters: List[Character]):
+        self.characters = characters
+        self.normalized = [normalize_name(char.name) for char in characters]
+        self.trigram_counts = []
+        self.postings: Dict[str, List[int]] = {}
+
+        for position, normalized in enumerate(self.normalized):
+            grams = trigrams(normalized)
+            self.trigram_counts.append(len(grams))
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(position)
+
+    def suggest(self, query: str, limit: int = 10, min_similarity: float = MIN_SIMILARITY) -> List[Character]:
+        """
+        Rank characters whose name resembles the query.
+
+        Names containing the query come first (in index order), followed by the
+        remaining names ranked by trigram similarity.
+
+        Args:
+            query: Name typed by the user
+            limit: Maximum number of suggestions
+            min_similarity: Minimum trigram similarity for fuzzy matches
+
+        Returns:
+            Suggested characters, best first
+        """
+        normalized_query = normalize_name(query)
+        if not normalized_query:
+            return []
+
+        query_grams = trigrams(normalized_query)
+
+        # Count shared trigrams using the postings lists only
+        shared: Dict[int, int] = {}
+        for gram in query_grams:
+            for position in self.postings.get(gram, []):
+                shared[position] = shared.get(position, 0) + 1
+
+        # Very short queries can sit inside a word without sharing a trigram
+        if len(normalized_query) < 3:
+            for position in range(len(self.normalized)):
+                shared.setdefault(position, 0)
+
+        substring_matches = []
+        fuzzy_matches = []
+        for position, common in shared.items():
+            if normalized_query in self.normalized[position]:
+                substring_matches.append(position)
+                continue
+            similarity = common / (len(query_grams) + self.trigram_counts[position] - common)
+            if similarity >= min_similarity:
+                fuzzy_matches.append((-similarity, position))
+
+        ranked = sorted(substring_matches) + [position for _, position in sorted(fuzzy_matches)]
+        return [self.characters[position] for position in ranked[:limit]]
+
+
+def load_cached_rows(path: str = DEFAULT_NAME_INDEX_PATH, max_age: float = NAME_INDEX_MAX_AGE_SECONDS) -> Optional[List[dict]]:
+    """Return the cached index rows, or None if the cache is missing or older than max_age seconds."""
+    try:
+        if time.time() - os.path.getmtime(path) > max_age:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)['characters']
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_cached_rows(rows: List[dict], path: str = DEFAULT_NAME_INDEX_PATH):
+    """Write the index rows to the cache file."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'characters': rows}, f, ensure_ascii=False)
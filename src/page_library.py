@@ -0,0 +1,169 @@
+"""
+Incremental deck builds from a library of rendered card pages.
+
+Each card's page(s) are rendered to a small PDF fragment stored under a hash
+of everything the pages depend on: the character row, the connections shown
+on the back (with the other characters' names and categories), the portrait
+(content hash and rotation of the cached original; portraits not cached yet
+are fetched before the card is keyed), the card number, the
+render options and the rendering code itself. A rebuild renders only the
+cards whose hash is not in the library and joins the fragments in deck order
+with pdf_concat, so a small data edit costs a few card renders plus the join.
+
+Fragments not used for PAGE_LIBRARY_MAX_AGE_DAYS are removed after a build.
+"""
+import os
+import time
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+from reportlab import Version as REPORTLAB_VERSION
+from reportlab.pdfgen import canvas
+from pypdf import PdfWriter
+from src.types.supabase_types import CardData
+from src.card import prepare_card_front, NOT_PREPARED
+from src.card.image_handler import image_fingerprint
+from src.cards import binary_streams, card_page_layout, draw_card_pages
+from src.pdf_concat import concatenate_pdfs, PDFFormatError
+from src.pipeline import prefetch, PREFETCH_DEPTH
+
+
+# Library location (project root)
+PAGE_LIBRARY_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'page_cache')
+
+# Fragments unused for this long are pruned
+PAGE_LIBRARY_MAX_AGE_DAYS = 30
+
+# Source files whose changes can alter rendered pages
+_RENDERER_SOURCES = ('card', 'cards.py', 'config.py', 'page_library.py')
+
+
+@lru_cache(maxsize=1)
+def renderer_digest() -> str:
+    """Hash of the rendering code and ReportLab version, so code changes invalidate the library."""
+    sha = hashlib.sha256(REPORTLAB_VERSION.encode())
+    src_dir = Path(__file__).parent
+    for source in _RENDERER_SOURCES:
+        path = src_dir / source
+        for file in sorted(path.rglob('*.py')) if path.is_dir() else [path]:
+            sha.update(str(file.relative_to(src_dir)).encode())
+            sha.update(file.read_bytes())
+    return sha.hexdigest()
+
+
+def card_key(card_data: CardData, card_number: Optional[int], options: tuple) -> str:
+    """
+    Hash everything the pages of a card depend on.
+
+    The portrait is identified by its cached original, so portraits not in
+    the image cache must be fetched first or the card is keyed without one.
+
+    Args:
+        card_data: Card to render
+        card_number: Number printed on the back, or None when backs are not rendered
+        options: Render options (width, sides, crop marks, corner radius)
+
+    Returns:
+        Hex digest naming the card's fragment
+    """
+    character = card_data.character
+    content = (
+        renderer_digest(),
+        options,
+        card_number,
+        tuple(getattr(character, name) for name in character.__slots__),
+        tuple((conn.other.name, conn.other.type, conn.value, conn.why, conn.why_short)
+              for conn in card_data.connections),
+        image_fingerprint(character.image_link),
+    )
+    return hashlib.sha256(repr(content).encode()).hexdigest()
+
+
+def _prune(library_dir: str, max_age_days: float) -> int:
+    """Remove fragments not used for max_age_days; return how many were removed."""
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for entry in os.scandir(library_dir):
+        if entry.name.endswith('.pdf') and entry.stat().st_mtime < cutoff:
+            os.remove(entry.path)
+            removed += 1
+    return removed
+
+
+@binary_streams()
+def generate_cards_pdf_incremental(card_data_list: Iterable[CardData], output_path: str, fronts_only: bool = False, separate_pages: bool = True, card_width: Optional[float] = None, crop_marks: bool = False, corner_radius: Optional[float] = None, supabase_client=None, library_dir: str = PAGE_LIBRARY_DIR, prefetch_depth: int = PREFETCH_DEPTH) -> Tuple[int, int]:
+    """
+    Generate the same PDF as generate_cards_pdf, rendering only cards missing from the page library.
+
+    Args:
+        card_data_list: Card data to render, in deck order
+        output_path: Path to save the PDF file
+        fronts_only: If True, only render card fronts
+        separate_pages: If True, front and back on separate pages; if False, side by side
+        card_width: Desired card width in points (default: None = use original 69mm)
+        crop_marks: If True, add crop marks and bleed area
+        corner_radius: Corner radius for rounded edges (default: None = use CORNER_RADIUS from config)
+        supabase_client: Supabase client for downloading images (optional)
+        library_dir: Directory of the page library
+        prefetch_depth: Number of changed cards prepared ahead of drawing
+
+    Returns:
+        (cards rendered, cards reused from the library)
+    """
+    card_width, scale, scaled_height, page_width, page_height = card_page_layout(card_width, separate_pages, crop_marks)
+    options = (round(card_width, 4), fronts_only, separate_pages, crop_marks, corner_radius)
+    os.makedirs(library_dir, exist_ok=True)
+
+    def fetch_missing(card_data: CardData):
+        """Fetch a portrait that is not in the image cache yet, so the card is keyed on what it is drawn with."""
+        if image_fingerprint(card_data.character.image_link) != 'missing':
+            return NOT_PREPARED
+        return prepare_card_front(card_data, scale, supabase_client)
+
+    start = time.perf_counter()
+    fragment_paths: List[str] = []
+    to_render: List[Tuple[CardData, int, str, object]] = []
+    queued = set()
+    for card_number, (card_data, image) in enumerate(prefetch(card_data_list, fetch_missing, prefetch_depth), start=1):
+        key = card_key(card_data, None if fronts_only else card_number, options)
+        path = os.path.join(library_dir, f"{key}.pdf")
+        fragment_paths.append(path)
+        if os.path.exists(path):
+            os.utime(path)  # Mark as used for pruning
+        elif path not in queued:
+            queued.add(path)
+            to_render.append((card_data, card_number, path, image))
+
+    print(f"Page library: {len(fragment_paths) - len(to_render)} cards unchanged, {len(to_render)} to render")
+
+    # Portraits of the changed cards are prepared ahead of drawing (unless fetched while keying)
+    prepared_cards = prefetch(
+        to_render,
+        lambda item: prepare_card_front(item[0], scale, supabase_client) if item[3] is NOT_PREPARED else item[3],
+        prefetch_depth
+    )
+    for (card_data, card_number, path, _), image in prepared_cards:
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        c = canvas.Canvas(temp_path, pagesize=(page_width, page_height))
+        draw_card_pages(
+            c, card_data, card_number, card_width, scaled_height, scale,
+            fronts_only, separate_pages, crop_marks, corner_radius, supabase_client, image
+        )
+        c.save()
+        os.replace(temp_path, path)
+
+    try:
+        concatenate_pdfs(fragment_paths, output_path)
+    except PDFFormatError as e:
+        print(f"Joining fragments with pypdf ({e})")
+        writer = PdfWriter()
+        for path in fragment_paths:
+            writer.append(path)
+        with open(output_path, 'wb') as f:
+            writer.write(f)
+
+    removed = _prune(library_dir, PAGE_LIBRARY_MAX_AGE_DAYS)
+    print(f"PDF saved to {output_path} in {time.perf_counter() - start:.2f}s"
+          + (f" (pruned {removed} unused fragments)" if removed else ""))
+    return len(to_render), len(fragment_paths) - len(to_render)
@@ -0,0 +1,198 @@
+"""
+Fast concatenation of ReportLab PDFs.
+
+ReportLab writes every object uncompressed at the top level with a classic
+xref table, so documents can be joined by copying object bytes and
+renumbering the references in their dictionaries; streams are copied
+untouched. Objects are resolved depth first, so resources that come out
+byte-identical after renumbering (fonts, form XObjects, resource
+dictionaries repeated in every part) are written once.
+
+This is much faster than a general PDF library for the many small parts of a
+page library. Anything that does not look like ReportLab output raises
+PDFFormatError, so callers can fall back to pypdf.
+"""
+import re
+from typing import Dict, List, Sequence, Tuple
+
+
+_REF = re.compile(rb'(\d+) 0 R\b')
+_OBJ_HEADER = re.compile(rb'(\d+) 0 obj\n')
+_PAGE_TYPE = re.compile(rb'/Type /Page\b(?!s)')
+_PAGES_TYPE = re.compile(rb'/Type /Pages\b')
+
+# Global numbers of the objects every output starts with
+_CATALOG = 1
+_PAGES = 2
+
+# Marks an object whose references are being resolved
+_RESOLVING = -1
+
+
+class PDFFormatError(ValueError):
+    """The file is not a PDF this module can join (e.g. not written by ReportLab)."""
+
+
+def _read_objects(data: bytes) -> Tuple[Dict[int, bytes], int]:
+    """
+    Split a PDF into its objects.
+
+    Returns:
+        ({object number: body between 'N 0 obj' and 'endobj'}, catalog object number)
+    """
+    try:
+        startxref = data.rindex(b'startxref')
+        xref_offset = int(data[startxref + 9:].split()[0])
+        trailer = data.index(b'trailer', xref_offset)
+    except ValueError:
+        raise PDFFormatError("no xref table")
+    if data[xref_offset:xref_offset + 4] != b'xref':
+        raise PDFFormatError("xref streams are not supported")
+
+    lines = data[xref_offset:trailer].split(b'\n')[1:]
+    first, count = (int(part) for part in lines[0].split())
+    if first != 0 or len(lines) < count + 1:
+        raise PDFFormatError("xref table with several sections")
+    offsets = sorted(
+        (int(line[:10]), number)
+        for number, line in enumerate(lines[1:count + 1])
+        if line[17:18] == b'n'
+    )
+
+    objects = {}
+    for index, (offset, number) in enumerate(offsets):
+        end = offsets[index + 1][0] if index + 1 < len(offsets) else xref_offset
+        header = _OBJ_HEADER.match(data, offset)
+        body = data[offset:end].rstrip()
+        if not header or int(header[1]) != number or not body.endswith(b'endobj'):
+            raise PDFFormatError(f"unexpected layout of object {number}")
+        objects[number] = body[header.end() - offset:-len(b'endobj')]
+
+    root = re.search(rb'/Root (\d+) 0 R', data[trailer:])
+    if not root:
+        raise PDFFormatError("no document catalog")
+    return objects, int(root[1])
+
+
+def _split_stream(body: bytes) -> Tuple[bytes, bytes]:
+    """Split an object body into its dictionary text and its (untouched) stream part."""
+    index = body.find(b'>>\nstream\n')
+    if index < 0 and b'stream' in body:
+        raise PDFFormatError("unexpected stream layout")
+    dictionary, stream = (body, b'') if index < 0 else (body[:index + 3], body[index + 3:])
+    # References are renumbered by pattern, which is only safe outside string literals
+    if b'(' in dictionary:
+        raise PDFFormatError("string literal in a dictionary")
+    return dictionary, stream
+
+
+def _page_tree(objects: Dict[int, bytes], root: int) -> Tuple[List[int], List[int]]:
+    """Return (page object numbers in order, page tree node numbers) of a document."""
+    pages_ref = re.search(rb'/Pages (\d+) 0 R', objects[root])
+    if not pages_ref:
+        raise PDFFormatError("catalog without page tree")
+
+    pages, nodes = [], []
+
+    def walk(number: int):
+        body = objects[number]
+        if _PAGES_TYPE.search(body):
+            nodes.append(number)
+            kids = re.search(rb'/Kids \[([^\]]*)\]', body)
+            for kid in _REF.findall(kids[1] if kids else b''):
+                walk(int(kid))
+        elif _PAGE_TYPE.search(body):
+            pages.append(number)
+        else:
+            raise PDFFormatError(f"unexpected object {number} in page tree")
+
+    walk(int(pages_ref[1]))
+    return pages, nodes
+
+
+def concatenate_pdfs(paths: Sequence[str], output_path: str) -> int:
+    """
+    Join ReportLab PDFs into one document, in order.
+
+    Args:
+        paths: Input PDF files
+        output_path: Path to save the joined PDF
+
+    Returns:
+        Number of pages written
+
+    Raises:
+        PDFFormatError: If an input is not in the layout ReportLab writes
+    """
+    version = b'%PDF-1.4'
+    chunks: List[bytes] = []
+    offsets: List[int] = []   # Byte offset of object n + 1
+    position = 0
+    shared: Dict[bytes, int] = {}
+    kids: List[int] = []
+
+    def emit(data: bytes):
+        nonlocal position
+        chunks.append(data)
+        position += len(data)
+
+    def write_object(body: bytes) -> int:
+        offsets.append(position)
+        number = len(offsets)
+        emit(b'%d 0 obj\n' % number + body + b'endobj\n')
+        return number
+
+    emit(version + b'\n%\x93\x8c\x8b\x9e\n')
+    # Catalog and page tree are written last but numbered first
+    offsets += [0, 0]
+
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+        version = max(version, data[:8])
+        objects, root = _read_objects(data)
+        pages, nodes = _page_tree(objects, root)
+        mapping = dict.fromkeys(nodes, _PAGES)
+
+        def resolve(number: int) -> int:
+            target = mapping.get(number)
+            if target == _RESOLVING:
+                raise PDFFormatError(f"reference cycle through object {number}")
+            if target is not None:
+                return target
+            if number not in objects:
+                raise PDFFormatError(f"missing object {number}")
+
+            mapping[number] = _RESOLVING
+            dictionary, stream = _split_stream(objects[number])
+            body = _REF.sub(lambda m: b'%d 0 R' % resolve(int(m[1])), dictionary) + stream
+
+            # Pages stay distinct even if they look the same
+            if _PAGE_TYPE.search(dictionary):
+                mapping[number] = write_object(body)
+            elif body in shared:
+                mapping[number] = shared[body]
+            else:
+                mapping[number] = shared[body] = write_object(body)
+            return mapping[number]
+
+        kids += [resolve(page) for page in pages]
+
+    catalog = b'\n<<\n/PageMode /UseNone /Pages %d 0 R /Type /Catalog\n>>\n' % _PAGES
+    offsets[_CATALOG - 1] = position
+    emit(b'%d 0 obj' % _CATALOG + catalog + b'endobj\n')
+
+    page_tree = b'\n<<\n/Count %d /Kids [ %s ] /Type /Pages\n>>\n' % (
+        len(kids), b' '.join(b'%d 0 R' % kid for kid in kids))
+    offsets[_PAGES - 1] = position
+    emit(b'%d 0 obj' % _PAGES + page_tree + b'endobj\n')
+
+    xref_offset = position
+    emit(b'xref\n0 %d\n0000000000 65535 f \n' % (len(offsets) + 1))
+    emit(b''.join(b'%010d 00000 n \n' % offset for offset in offsets))
+    emit(b'trailer\n<<\n/Root %d 0 R /Size %d\n>>\nstartxref\n%d\n%%%%EOF\n' % (_CATALOG, len(offsets) + 1, xref_offset))
+
+    chunks[0] = version + chunks[0][8:]
+    with open(output_path, 'wb') as f:
+        f.writelines(chunks)
+    return len(kids)
@@ -0,0 +1,82 @@
+"""
+Bounded look-ahead stage for streaming card rendering.
+
+A producer thread pulls cards from an iterator (so card data can be built
+lazily) and prepares their portraits a few cards ahead of the drawing loop.
+The queue between the two stages is bounded, so memory stays flat however
+large the deck is, while downloads, image decoding and drawing overlap.
+"""
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, Tuple, TypeVar
+
+
+# Cards prepared ahead of the drawing loop
+PREFETCH_DEPTH = 8
+
+# Seconds between checks for a cancelled consumer while the queue is full
+_PUT_TIMEOUT = 0.1
+
+# Marks the end of the stream in the queue
+_DONE = object()
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def prefetch(items: Iterable[T], prepare: Callable[[T], R], depth: int = PREFETCH_DEPTH) -> Iterator[Tuple[T, R]]:
+    """
+    Yield (item, prepare(item)) pairs, produced by a background thread up to depth items ahead.
+
+    Exceptions raised while iterating or preparing are re-raised in the
+    consumer. Closing the generator early stops the producer.
+
+    Args:
+        items: Items to process, consumed by the producer thread
+        prepare: Function run on each item in the producer thread
+        depth: Maximum number of prepared items waiting (0 = run everything inline)
+
+    Returns:
+        Iterator of (item, prepared) pairs in input order
+    """
+    if depth <= 0:
+        for item in items:
+            yield item, prepare(item)
+        return
+
+    results = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry: tuple) -> bool:
+        """Queue an entry, giving up if the consumer has gone away."""
+        while not stop.is_set():
+            try:
+                results.put(entry, timeout=_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((item, prepare(item), None)):
+                    return
+            put((_DONE, None, None))
+        except BaseException as e:
+            put((_DONE, None, e))
+
+    producer = threading.Thread(target=produce, name="card-prefetch", daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            item, prepared, error = results.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item, prepared
+    finally:
+        stop.set()
+        producer.join()
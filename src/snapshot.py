@@ -0,0 +1,193 @@
+"""
+Offline snapshot of the character and connection tables in a local SQLite file.
+
+A snapshot lets the CLI build decks without network access. Rows are stored as
+raw JSON so the snapshot survives schema additions, and each table keeps a
+watermark (the highest value of WATERMARK_COLUMN seen) so a refresh only pulls
+rows changed since the last one.
+"""
+import json
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from supabase import Client
+from src.types.supabase_types import Character, Connection
+from src.supabase_client import character_from_row, connection_from_row, stream_table
+
+
+# Bump when the SQLite layout changes
+SCHEMA_VERSION = 1
+
+# Default snapshot file (relative to the working directory)
+DEFAULT_SNAPSHOT_PATH = "millennium_snapshot.db"
+
+# Column used to detect changed rows during a refresh
+WATERMARK_COLUMN = "updated_at"
+
+# Tables mirrored into the snapshot
+SNAPSHOT_TABLES = ("character", "connection")
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    """Open a snapshot file, creating the tables if needed."""
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+    for table in SNAPSHOT_TABLES:
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY, data TEXT NOT NULL)")
+    return conn
+
+
+def _get_meta(conn: sqlite3.Connection, key: str) -> Optional[str]:
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def _set_meta(conn: sqlite3.Connection, key: str, value: Optional[str]):
+    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+
+def _max_watermark(rows: List[dict], current: Optional[str] = None) -> Optional[str]:
+    """Return the highest watermark value among rows (ISO timestamps compare as strings)."""
+    values = [row[WATERMARK_COLUMN] for row in rows if row.get(WATERMARK_COLUMN)]
+    if current:
+        values.append(current)
+    return max(values) if values else None
+
+
+def _store_rows(conn: sqlite3.Connection, table: str, rows: List[dict]):
+    conn.executemany(
+        f"INSERT OR REPLACE INTO {table} (id, data) VALUES (?, ?)",
+        [(row['id'], json.dumps(row)) for row in rows]
+    )
+
+
+def _replace_table(client: Client, conn: sqlite3.Connection, table: str) -> int:
+    """Download a whole table and replace its snapshot copy. Returns the row count."""
+    rows = list(stream_table(client, table))
+
+    conn.execute(f"DELETE FROM {table}")
+    _store_rows(conn, table, rows)
+    _set_meta(conn, f"{table}_watermark", _max_watermark(rows))
+
+    return len(rows)
+
+
+def _refresh_table(client: Client, conn: sqlite3.Connection, table: str) -> Tuple[int, int, bool]:
+    """
+    Pull rows changed since the stored watermark and drop rows deleted remotely.
+
+    Tables without a watermark (no WATERMARK_COLUMN values, or never loaded)
+    are reloaded in full.
+
+    Returns:
+        Tuple of (rows_updated, rows_deleted, reloaded_in_full)
+    """
+    local_ids = {row[0] for row in conn.execute(f"SELECT id FROM {table}")}
+
+    watermark = _get_meta(conn, f"{table}_watermark")
+    if watermark is None:
+        updated = _replace_table(client, conn, table)
+        remaining_ids = {row[0] for row in conn.execute(f"SELECT id FROM {table}")}
+        return updated, len(local_ids - remaining_ids), True
+
+    changed = list(stream_table(client, table, filters=lambda query: query.gt(WATERMARK_COLUMN, watermark)))
+    _store_rows(conn, table, changed)
+    _set_meta(conn, f"{table}_watermark", _max_watermark(changed, watermark))
+
+    # Deletions leave no trace in the watermark column, so compare ID sets
+    remote_ids = {row['id'] for row in stream_table(client, table, columns="id")}
+    deleted_ids = local_ids - remote_ids
+    conn.executemany(f"DELETE FROM {table} WHERE id = ?", [(row_id,) for row_id in deleted_ids])
+
+    return len(changed), len(deleted_ids), False
+
+
+def _stamp(conn: sqlite3.Connection, reset: bool = False) -> int:
+    """Record the schema version, bump the snapshot version and return it."""
+    version = 1 if reset else int(_get_meta(conn, "version") or 0) + 1
+    _set_meta(conn, "schema_version", str(SCHEMA_VERSION))
+    _set_meta(conn, "version", str(version))
+    _set_meta(conn, "saved_at", datetime.now(timezone.utc).isoformat())
+    return version
+
+
+def create_snapshot(client: Client, path: str = DEFAULT_SNAPSHOT_PATH) -> Dict[str, int]:
+    """
+    Save the character and connection tables to a SQLite snapshot.
+
+    Args:
+        client: Supabase client
+        path: Snapshot file path (overwritten if it exists)
+
+    Returns:
+        Dictionary with the row count per table and the new snapshot version
+    """
+    conn = _connect(path)
+    try:
+        with conn:
+            stats = {table: _replace_table(client, conn, table) for table in SNAPSHOT_TABLES}
+            stats['version'] = _stamp(conn, reset=True)
+        return stats
+    finally:
+        conn.close()
+
+
+def refresh_snapshot(client: Client, path: str = DEFAULT_SNAPSHOT_PATH) -> Dict[str, Any]:
+    """
+    Bring an existing snapshot up to date with only the rows changed since its watermark.
+
+    Tables without a WATERMARK_COLUMN are reloaded in full instead.
+
+    Args:
+        client: Supabase client
+        path: Snapshot file path
+
+    Returns:
+        Dictionary mapping table name to (rows_updated, rows_deleted), plus the new
+        version and the list of tables that were reloaded in full ('reloaded')
+
+    Raises:
+        ValueError: If the snapshot is missing or has an incompatible schema
+    """
+    conn = _connect(path)
+    try:
+        if _get_meta(conn, "schema_version") != str(SCHEMA_VERSION):
+            raise ValueError(f"Snapshot {path} is missing or has an incompatible schema; run 'snapshot' without --refresh")
+
+        with conn:
+            stats: Dict[str, Any] = {'reloaded': []}
+            for table in SNAPSHOT_TABLES:
+                updated, deleted, reloaded = _refresh_table(client, conn, table)
+                stats[table] = (updated, deleted)
+                if reloaded:
+                    stats['reloaded'].append(table)
+            stats['version'] = _stamp(conn)
+        return stats
+    finally:
+        conn.close()
+
+
+def load_snapshot(path: str) -> Tuple[List[Character], List[Connection]]:
+    """
+    Load characters and active connections from a snapshot.
+
+    Args:
+        path: Snapshot file path
+
+    Returns:
+        Tuple of (characters, active_connections), both ordered by ID
+    """
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        characters = [
+            character_from_row(json.loads(data))
+            for (data,) in conn.execute("SELECT data FROM character ORDER BY id")
+        ]
+        connections = [
+            connection_from_row(row)
+            for row in (json.loads(data) for (data,) in conn.execute("SELECT data FROM connection ORDER BY id"))
+            if row.get('active')
+        ]
+        return characters, connections
+    finally:
+        conn.close()
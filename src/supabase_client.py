@@ -2,82 +2,351 @@
 Supabase client and data fetching functions.
 """
 import os
-from typing import List, Dict
+import sys
+import time
+import heapq
+import threading
+from typing import Any, Callable, Iterator, List, Dict, Optional, Sequence, Tuple, TypeVar
+import httpx
 from dotenv import load_dotenv
-from supabase import create_client, Client
+from postgrest.types import CountMethod
+from supabase import create_client, Client, ClientOptions
 from src.types.supabase_types import Character, Connection, DenormalizedConnection, CardData
 from src.config import CATEGORY_ORDER
+from src.name_index import (
+    NameIndex, NAME_INDEX_COLUMNS, DEFAULT_NAME_INDEX_PATH,
+    load_cached_rows, save_cached_rows
+)
 
 
 # Load environment variables
 load_dotenv()
 
+# Rows per request when paging through a table (PostgREST caps responses at 1000 rows by default)
+PAGE_SIZE = 1000
+
+# Column projections for callers that don't need the long text columns
+# (biography, joker texts, links)
+CHARACTER_LIST_COLUMNS = "id,name,first_names,birth_date,death_date,type,joker_type"
+CONNECTION_LINK_COLUMNS = "id,char1_id,char2_id,value,active"
+
+# Columns of the other characters shown on a card (names and categories, plus joker fields)
+CHARACTER_LINK_COLUMNS = "id,name,type,joker_type,joker_type_value,joker_type_why,joker_type_why_short"
+
+T = TypeVar("T")
+
+# Joker connections grouped by joker_type ("*" for wildcard).
+# Each entry is (position in character_lookup, joker character ID, pre-built connection).
+JokerIndex = Dict[str, List[Tuple[int, int, DenormalizedConnection]]]
+
+
+# HTTP settings shared by all Supabase clients
+REQUEST_TIMEOUT_SECONDS = 60
+MAX_KEEPALIVE_CONNECTIONS = 10
+
+# Process-wide clients keyed by role ("anon" or "service"), so every module
+# reuses the same keep-alive connection pool instead of a new TLS handshake per client
+_clients: Dict[str, Client] = {}
+_clients_lock = threading.Lock()
+
+
+def _forget_clients_after_fork():
+    """Drop the parent's clients in a forked child, which must not share their sockets."""
+    global _clients_lock
+    _clients.clear()
+    _clients_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_clients_after_fork)
+
+# Callables invoked after each Supabase HTTP request as hook(method, url, status_code, elapsed_seconds)
+_request_timing_hooks: List[Callable[[str, str, int, float], None]] = []
+
+
+def add_request_timing_hook(hook: Callable[[str, str, int, float], None]):
+    """
+    Register a callable that is called after every Supabase HTTP request.
+
+    Args:
+        hook: Callable receiving (method, url, status_code, elapsed_seconds)
+    """
+    _request_timing_hooks.append(hook)
+
+
+def print_request_timing(method: str, url: str, status_code: int, elapsed: float):
+    """Timing hook that prints one line per request (enabled with SUPABASE_TIMING=1)."""
+    print(f"  ⏱ {method} {url} → {status_code} ({elapsed * 1000:.0f} ms)")
+
+
+def _start_request_timer(request: httpx.Request):
+    request.extensions["start_time"] = time.perf_counter()
+
+
+def _report_request_timing(response: httpx.Response):
+    start_time = response.request.extensions.get("start_time")
+    if start_time is None:
+        return
+    elapsed = time.perf_counter() - start_time
+    url = response.request.url.copy_with(query=None)
+    for hook in _request_timing_hooks:
+        hook(response.request.method, str(url), response.status_code, elapsed)
+
+
+def _get_client(role: str, key_env: str) -> Client:
+    """Return the shared client for a role, creating it on first use."""
+    with _clients_lock:
+        if role not in _clients:
+            url = os.getenv("SUPABASE_URL")
+            key = os.getenv(key_env)
+
+            if not url or not key:
+                raise ValueError(f"SUPABASE_URL and {key_env} must be set in .env file")
+
+            http_client = httpx.Client(
+                timeout=REQUEST_TIMEOUT_SECONDS,
+                limits=httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+                event_hooks={
+                    'request': [_start_request_timer],
+                    'response': [_report_request_timing],
+                },
+            )
+            _clients[role] = create_client(url, key, options=ClientOptions(httpx_client=http_client))
+
+        return _clients[role]
+
 
 def get_supabase_client() -> Client:
-    """Create and return a Supabase client."""
-    url = os.getenv("SUPABASE_URL")
-    key = os.getenv("SUPABASE_KEY")
-
-    if not url or not key:
-        raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in .env file")
-
-    return create_client(url, key)
-
-
-def fetch_all_characters(client: Client) -> List[Character]:
-    """Fetch all characters from Supabase."""
-    response = client.table("character").select("*").execute()
-
-    characters = []
-    for row in response.data:
-        characters.append(Character(
-            id=row['id'],
-            name=row.get('name'),
-            first_names=row.get('first_names'),
-            birth_date=row.get('birth_date'),
-            death_date=row.get('death_date'),
-            biography=row.get('biography'),
-            type=row.get('type'),
-            link=row.get('link'),
-            image_link=row.get('image_link'),
-            joker_type=row.get('joker_type'),
-            joker_type_value=row.get('joker_type_value'),
-            joker_type_why=row.get('joker_type_why'),
-            joker_type_why_short=row.get('joker_type_why_short')
-        ))
+    """Return the shared Supabase client (anon key), creating it on first use."""
+    return _get_client("anon", "SUPABASE_KEY")
 
-    return characters
 
+def get_admin_supabase_client() -> Client:
+    """Return the shared Supabase client with the service role key (admin access)."""
+    return _get_client("service", "SUPABASE_SERVICE_KEY")
 
-def fetch_character_by_name(client: Client, character_name: str) -> tuple[Character | None, List[Character]]:
+
+if os.getenv("SUPABASE_TIMING"):
+    add_request_timing_hook(print_request_timing)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a repeated string (category codes, names) so every deck shares one copy."""
+    return sys.intern(value) if value is not None else None
+
+
+def character_from_row(row: dict) -> Character:
+    """Build a Character from a Supabase character row."""
+    return Character(
+        id=row['id'],
+        name=_intern(row.get('name')),
+        first_names=row.get('first_names'),
+        birth_date=row.get('birth_date'),
+        death_date=row.get('death_date'),
+        biography=row.get('biography'),
+        type=_intern(row.get('type')),
+        link=row.get('link'),
+        image_link=row.get('image_link'),
+        joker_type=_intern(row.get('joker_type')),
+        joker_type_value=row.get('joker_type_value'),
+        joker_type_why=row.get('joker_type_why'),
+        joker_type_why_short=row.get('joker_type_why_short')
+    )
+
+
+def connection_from_row(row: dict) -> Connection:
+    """Build a Connection from a Supabase connection row."""
+    return Connection(
+        id=row['id'],
+        char1_id=row.get('char1_id'),
+        char2_id=row.get('char2_id'),
+        value=row.get('value'),
+        why=row.get('why'),
+        why_short=row.get('why_short'),
+        active=row.get('active')
+    )
+
+
+def stream_table_pages(
+    client: Client,
+    table: str,
+    columns: str = "*",
+    row_factory: Optional[Callable[[dict], T]] = None,
+    filters: Optional[Callable[[Any], Any]] = None,
+    order_by: Sequence[str] = ("id",),
+    page_size: int = PAGE_SIZE
+) -> Iterator[List[T]]:
     """
-    Fetch a single character by name (case-insensitive).
+    Lazily stream a table page by page; each page is one round trip.
+
+    Rows are ordered by order_by (with "id" appended as a tie-breaker) so pages
+    are stable, and the table is never truncated by PostgREST's row cap.
+
+    Args:
+        client: Supabase client
+        table: Table name
+        columns: Comma-separated column projection (default: all columns)
+        row_factory: Optional callable converting each raw row (e.g. character_from_row)
+        filters: Optional callable applying filters to the query, e.g. lambda q: q.eq("type", "R")
+        order_by: Columns to order by
+        page_size: Number of rows requested per round trip
+
+    Yields:
+        Lists of rows as returned by row_factory, or raw row dictionaries (the last one may be empty)
+    """
+    order_columns = list(order_by)
+    if "id" not in order_columns:
+        order_columns.append("id")
+
+    start = 0
+    while True:
+        query = client.table(table).select(columns)
+        if filters:
+            query = filters(query)
+        for column in order_columns:
+            query = query.order(column)
+
+        response = query.range(start, start + page_size - 1).execute()
+        yield [row_factory(row) for row in response.data] if row_factory else response.data
+
+        # A short page means we have reached the end of the table
+        if len(response.data) < page_size:
+            return
+        start += page_size
+
+
+def stream_table(
+    client: Client,
+    table: str,
+    columns: str = "*",
+    row_factory: Optional[Callable[[dict], T]] = None,
+    filters: Optional[Callable[[Any], Any]] = None,
+    order_by: Sequence[str] = ("id",),
+    page_size: int = PAGE_SIZE
+) -> Iterator[T]:
+    """
+    Lazily stream rows of a table, one page of page_size rows per round trip.
+
+    Same arguments as stream_table_pages.
+
+    Yields:
+        Rows as returned by row_factory, or raw row dictionaries
+    """
+    for page in stream_table_pages(client, table, columns, row_factory, filters, order_by, page_size):
+        yield from page
+
+
+def fetch_all_characters(client: Client, columns: str = "*") -> List[Character]:
+    """
+    Fetch all characters from Supabase.
 
     Args:
         client: Supabase client
+        columns: Column projection (e.g. CHARACTER_LIST_COLUMNS); missing fields are None
+
+    Returns:
+        List of characters ordered by ID
+    """
+    return list(stream_table(client, "character", columns, character_from_row))
+
+
+def match_character_name(
+    characters: List[Character],
+    character_name: str
+) -> tuple[Character | None, List[Character], int]:
+    """
+    Find a character by name (case-insensitive) in a list of characters.
+
+    Args:
+        characters: Characters to search
         character_name: Name of the character to find
 
     Returns:
-        Tuple of (exact_match, partial_matches)
+        Tuple of (exact_match, partial_matches, card_number)
         - exact_match: Character object if exact match found, None otherwise
         - partial_matches: List of Character objects that partially match the name
+        - card_number: Position of the exact match in the list (1-indexed), or 0 if not found
     """
-    # Fetch all characters (needed for character_lookup in denormalization anyway)
-    all_characters = fetch_all_characters(client)
-
     search_name = character_name.upper().strip()
-    exact_match = None
     partial_matches = []
 
-    for character in all_characters:
+    for idx, character in enumerate(characters):
         char_name = (character.name or "").upper().strip()
         if char_name == search_name:
-            exact_match = character
-            break
+            return character, partial_matches, idx + 1
         elif search_name in char_name:
             partial_matches.append(character)
 
-    return exact_match, partial_matches
+    return None, partial_matches, 0
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so a name is matched literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_").replace("*", "\\*")
+
+
+def find_character_by_name(client: Client, character_name: str) -> Character | None:
+    """
+    Look up a character by exact name (case-insensitive) with a single server-side query.
+
+    Args:
+        client: Supabase client
+        character_name: Name of the character to find
+
+    Returns:
+        The matching character with the lowest ID, or None
+    """
+    response = (
+        client.table("character")
+        .select("*")
+        .ilike("name", _escape_like(character_name.strip()))
+        .order("id")
+        .limit(1)
+        .execute()
+    )
+    return character_from_row(response.data[0]) if response.data else None
+
+
+def load_name_index(client: Client, path: str = DEFAULT_NAME_INDEX_PATH, refresh: bool = False) -> NameIndex:
+    """
+    Load the fuzzy name index, rebuilding the local cache when it is missing or stale.
+
+    Args:
+        client: Supabase client
+        path: Cache file path
+        refresh: Ignore the cache and fetch the names again
+
+    Returns:
+        NameIndex over all character names
+    """
+    rows = None if refresh else load_cached_rows(path)
+    if rows is None:
+        rows = list(stream_table(client, "character", NAME_INDEX_COLUMNS))
+        try:
+            save_cached_rows(rows, path)
+        except OSError as e:
+            print(f"Warning: could not write name index cache {path}: {e}")
+
+    return NameIndex([character_from_row(row) for row in rows])
+
+
+def fetch_character_by_name(client: Client, character_name: str) -> tuple[Character | None, List[Character]]:
+    """
+    Fetch a single character by name (case-insensitive).
+
+    Args:
+        client: Supabase client
+        character_name: Name of the character to find
+
+    Returns:
+        Tuple of (exact_match, partial_matches)
+        - exact_match: Character object if exact match found, None otherwise
+        - partial_matches: Ranked name suggestions when there is no exact match
+    """
+    exact_match = find_character_by_name(client, character_name)
+    if exact_match:
+        return exact_match, []
+
+    return None, load_name_index(client).suggest(character_name)
 
 
 def fetch_connections_for_character(client: Client, character_id: int) -> List[Connection]:
@@ -88,26 +357,146 @@ def fetch_connections_for_character(client: Client, character_id: int) -> List[C
     # Fetch connections where character is char2 and active=true
     response2 = client.table("connection").select("*").eq("char2_id", character_id).eq("active", True).execute()
 
-    connections = []
-    for row in response1.data + response2.data:
-        connections.append(Connection(
-            id=row['id'],
-            char1_id=row.get('char1_id'),
-            char2_id=row.get('char2_id'),
-            value=row.get('value'),
-            why=row.get('why'),
-            why_short=row.get('why_short'),
-            active=row.get('active')
+    return [connection_from_row(row) for row in response1.data + response2.data]
+
+
+def fetch_all_connections(client: Client, columns: str = "*", page_size: int = PAGE_SIZE) -> List[Connection]:
+    """
+    Fetch every active connection in pages of page_size rows.
+
+    Args:
+        client: Supabase client
+        columns: Column projection (e.g. CONNECTION_LINK_COLUMNS); missing fields are None
+        page_size: Number of rows requested per round trip
+
+    Returns:
+        List of all active connections, ordered by ID
+    """
+    return list(stream_table(
+        client, "connection", columns, connection_from_row,
+        filters=lambda query: query.eq("active", True),
+        page_size=page_size
+    ))
+
+
+def build_connection_index(connections: List[Connection]) -> Dict[int, List[Connection]]:
+    """
+    Build an adjacency index mapping each character ID to its connections.
+
+    Each connection is listed under both of its characters, in the same order
+    fetch_connections_for_character would return them (char1 matches first,
+    then char2 matches).
+
+    Args:
+        connections: List of connections (typically from fetch_all_connections)
+
+    Returns:
+        Dictionary mapping character IDs to the connections they take part in
+    """
+    as_char1: Dict[int, List[Connection]] = {}
+    as_char2: Dict[int, List[Connection]] = {}
+
+    for conn in connections:
+        if conn.char1_id is not None:
+            as_char1.setdefault(conn.char1_id, []).append(conn)
+        if conn.char2_id is not None:
+            as_char2.setdefault(conn.char2_id, []).append(conn)
+
+    index = as_char1
+    for char_id, conns in as_char2.items():
+        index.setdefault(char_id, []).extend(conns)
+
+    return index
+
+
+def build_joker_index(character_lookup: Dict[int, Character]) -> JokerIndex:
+    """
+    Group joker characters by the category they connect to.
+
+    Build this once per deck and pass it to denormalize_connections so each card
+    only merges its own category group and the wildcard group, instead of
+    scanning every character.
+
+    Args:
+        character_lookup: Dictionary mapping character IDs to Character objects
+
+    Returns:
+        JokerIndex mapping joker_type to its pre-built joker connections
+    """
+    index: JokerIndex = {}
+
+    for position, (char_id, char) in enumerate(character_lookup.items()):
+        if not char.joker_type:
+            continue
+
+        index.setdefault(char.joker_type, []).append((
+            position,
+            char_id,
+            DenormalizedConnection(
+                other=char,
+                value=char.joker_type_value or 0,
+                why=char.joker_type_why or "",
+                why_short=char.joker_type_why_short
+            )
         ))
 
-    return connections
+    return index
+
+
+def count_connections(characters: List[Character], connections: List[Connection]) -> Dict[int, int]:
+    """
+    Count each character's card connections (regular plus joker) without building card data.
+
+    Gives the same numbers as len(card_data.connections) from build_all_card_data,
+    but never creates DenormalizedConnection objects.
+
+    Args:
+        characters: All characters (only id, type and joker_type are used)
+        connections: All active connections (only char1_id and char2_id are used)
+
+    Returns:
+        Dictionary mapping character ID to its number of connections
+    """
+    character_lookup = {char.id: char for char in characters}
+    counts = {char_id: 0 for char_id in character_lookup}
+
+    # Regular connections count for each side whose other character exists
+    for conn in connections:
+        if conn.char1_id in counts and conn.char2_id in character_lookup:
+            counts[conn.char1_id] += 1
+        if conn.char2_id in counts and conn.char1_id in character_lookup:
+            counts[conn.char2_id] += 1
+
+    # Number of jokers per target category ("*" for wildcard)
+    joker_counts: Dict[str, int] = {}
+    for char in character_lookup.values():
+        if char.joker_type:
+            joker_counts[char.joker_type] = joker_counts.get(char.joker_type, 0) + 1
+
+    for char_id, char in character_lookup.items():
+        # NOTE: Jokers do not count for category T
+        if char.type == "T":
+            continue
+
+        jokers = joker_counts.get("*", 0)
+        if char.type != "*":
+            jokers += joker_counts.get(char.type, 0)
+
+        # A character is never its own joker
+        if char.joker_type and (char.joker_type == "*" or char.joker_type == char.type):
+            jokers -= 1
+
+        counts[char_id] += jokers
+
+    return counts
 
 
 def denormalize_connections(
     client: Client,
     character_id: int,
     connections: List[Connection],
-    character_lookup: Dict[int, Character]
+    character_lookup: Dict[int, Character],
+    joker_index: Optional[JokerIndex] = None
 ) -> List[DenormalizedConnection]:
     """
     Replace character IDs with names in connections and add joker connections.
@@ -117,6 +506,7 @@ def denormalize_connections(
         character_id: ID of the current character
         connections: List of connections for the character
         character_lookup: Dictionary mapping character IDs to Character objects
+        joker_index: Optional index from build_joker_index (built on the fly if omitted)
 
     Returns:
         List of denormalized connections with character names, sorted by category then name
@@ -141,39 +531,28 @@ def denormalize_connections(
         other_char = character_lookup[other_char_id]
 
         denormalized.append(DenormalizedConnection(
-            character_name=other_char.name or "Unknown",
-            category_code=other_char.type or "Unknown",
+            other=other_char,
             value=conn.value or 0,
             why=conn.why or "",
             why_short=conn.why_short
         ))
 
-    # Add joker connections
-    # Check all other characters to see if they have a joker_type matching current character's category
+    # Add joker connections from characters whose joker_type matches the
+    # current character's category (or is wildcard)
     # NOTE: Jokers do not count for category T
-    for other_char_id, other_char in character_lookup.items():
-        # Skip self
-        if other_char_id == character_id:
-            continue
+    if current_category != "T":
+        if joker_index is None:
+            joker_index = build_joker_index(character_lookup)
 
-        # Check if other character has a joker type
-        if not other_char.joker_type:
-            continue
-
-        # Skip if current character is category T (jokers don't count for T)
-        if current_category == "T":
-            continue
+        wildcard_jokers = joker_index.get("*", [])
+        category_jokers = joker_index.get(current_category, []) if current_category != "*" else []
 
-        # Check if joker type matches current character's category (or is wildcard)
-        if other_char.joker_type == "*" or other_char.joker_type == current_category:
-            # Add joker connection
-            denormalized.append(DenormalizedConnection(
-                character_name=other_char.name or "Unknown",
-                category_code=other_char.type or "Unknown",
-                value=other_char.joker_type_value or 0,
-                why=other_char.joker_type_why or "",
-                why_short=other_char.joker_type_why_short
-            ))
+        # Merge by lookup position so jokers keep the character_lookup order
+        for _, joker_char_id, joker_conn in heapq.merge(wildcard_jokers, category_jokers, key=lambda entry: entry[0]):
+            # Skip self
+            if joker_char_id == character_id:
+                continue
+            denormalized.append(joker_conn)
 
     # Sort by category (in specific order) then by name
     denormalized.sort(key=lambda x: (
@@ -184,7 +563,13 @@ def denormalize_connections(
     return denormalized
 
 
-def fetch_card_data(client: Client, character: Character, character_lookup: Dict[int, Character]) -> CardData:
+def fetch_card_data(
+    client: Client,
+    character: Character,
+    character_lookup: Dict[int, Character],
+    connection_index: Optional[Dict[int, List[Connection]]] = None,
+    joker_index: Optional[JokerIndex] = None
+) -> CardData:
     """
     Fetch and prepare all data needed for a character card.
 
@@ -192,12 +577,18 @@ def fetch_card_data(client: Client, character: Character, character_lookup: Dict
         client: Supabase client
         character: Character to create card for
         character_lookup: Dictionary mapping character IDs to Character objects
+        connection_index: Optional adjacency index from build_connection_index.
+            When given, connections are read from it instead of queried per character.
+        joker_index: Optional index from build_joker_index, shared across a deck
 
     Returns:
         Complete CardData object ready for rendering
     """
-    connections = fetch_connections_for_character(client, character.id)
-    denormalized_connections = denormalize_connections(client, character.id, connections, character_lookup)
+    if connection_index is not None:
+        connections = connection_index.get(character.id, [])
+    else:
+        connections = fetch_connections_for_character(client, character.id)
+    denormalized_connections = denormalize_connections(client, character.id, connections, character_lookup, joker_index)
 
     return CardData(
         character=character,
@@ -205,13 +596,68 @@ def fetch_card_data(client: Client, character: Character, character_lookup: Dict
     )
 
 
+def fetch_linked_characters(
+    client: Client,
+    character: Character,
+    connections: List[Connection]
+) -> Dict[int, Character]:
+    """
+    Fetch only the characters a card refers to: its connections and its jokers.
+
+    Args:
+        client: Supabase client
+        character: Character the card is for
+        connections: The character's connections
+
+    Returns:
+        Character lookup (ordered by ID, like a full-table lookup) for denormalize_connections
+    """
+    linked = {character.id: character}
+
+    other_ids = sorted({
+        char_id
+        for conn in connections
+        for char_id in (conn.char1_id, conn.char2_id)
+        if char_id is not None and char_id != character.id
+    })
+    if other_ids:
+        for char in stream_table(
+            client, "character", CHARACTER_LINK_COLUMNS, character_from_row,
+            filters=lambda query: query.in_("id", other_ids)
+        ):
+            linked[char.id] = char
+
+    # NOTE: Jokers do not count for category T
+    if character.type != "T":
+        joker_types = ["*"] if character.type in (None, "*") else ["*", character.type]
+        for char in stream_table(
+            client, "character", CHARACTER_LINK_COLUMNS, character_from_row,
+            filters=lambda query: query.in_("joker_type", joker_types)
+        ):
+            linked.setdefault(char.id, char)
+
+    return {char_id: linked[char_id] for char_id in sorted(linked)}
+
+
+def fetch_card_number(client: Client, character_id: int) -> int:
+    """Return the 1-indexed position of a character in the ID-ordered character table."""
+    response = (
+        client.table("character")
+        .select("id", count=CountMethod.exact)
+        .lte("id", character_id)
+        .limit(1)
+        .execute()
+    )
+    return response.count or 0
+
+
 def fetch_single_card_data(client: Client, character_name: str) -> tuple[CardData | None, List[Character], int]:
     """
     Fetch card data for a single character by name.
 
-    This is more efficient than fetch_all_card_data when you only need one character,
-    as it still fetches all characters (needed for denormalization) but only processes
-    connections for the requested character.
+    Only the matched character, its connections and the characters those refer
+    to are fetched, so this needs a handful of small queries instead of the
+    whole character table. Suggestions come from the cached name index.
 
     Args:
         client: Supabase client
@@ -220,35 +666,46 @@ def fetch_single_card_data(client: Client, character_name: str) -> tuple[CardDat
     Returns:
         Tuple of (card_data, partial_matches, card_number)
         - card_data: CardData object if exact match found, None otherwise
-        - partial_matches: List of Character objects that partially match the name
-        - card_number: Position of character in alphabetical list (1-indexed), or 0 if not found
+        - partial_matches: Ranked name suggestions when there is no exact match
+        - card_number: Position of character in the ID-ordered character list (1-indexed), or 0 if not found
     """
-    # Fetch all characters (needed for character_lookup in denormalization)
-    all_characters = fetch_all_characters(client)
+    exact_match, partial_matches = fetch_character_by_name(client, character_name)
 
-    # Create lookup dictionary
-    character_lookup = {char.id: char for char in all_characters}
+    if not exact_match:
+        return None, partial_matches, 0
 
-    # Find the specific character by name (case-insensitive)
-    search_name = character_name.upper().strip()
-    exact_match = None
-    card_number = 0
-    partial_matches = []
+    connections = fetch_connections_for_character(client, exact_match.id)
+    character_lookup = fetch_linked_characters(client, exact_match, connections)
 
-    for idx, character in enumerate(all_characters):
-        char_name = (character.name or "").upper().strip()
-        if char_name == search_name:
-            exact_match = character
-            card_number = idx + 1
-            break
-        elif search_name in char_name:
-            partial_matches.append(character)
+    card_data = fetch_card_data(client, exact_match, character_lookup, {exact_match.id: connections})
+
+    return card_data, [], fetch_card_number(client, exact_match.id)
+
+
+def build_single_card_data(
+    characters: List[Character],
+    connections: List[Connection],
+    character_name: str
+) -> tuple[CardData | None, List[Character], int]:
+    """
+    Build card data for a single character from already-loaded tables (e.g. a snapshot).
+
+    Args:
+        characters: All characters
+        connections: All active connections
+        character_name: Name of the character (case-insensitive)
+
+    Returns:
+        Same tuple as fetch_single_card_data
+    """
+    character_lookup = {char.id: char for char in characters}
+
+    exact_match, _, card_number = match_character_name(characters, character_name)
 
     if not exact_match:
-        return None, partial_matches, 0
+        return None, NameIndex(characters).suggest(character_name), 0
 
-    # Fetch card data for the matched character
-    card_data = fetch_card_data(client, exact_match, character_lookup)
+    card_data = fetch_card_data(None, exact_match, character_lookup, build_connection_index(connections))
 
     return card_data, [], card_number
 
@@ -257,15 +714,33 @@ def fetch_all_card_data(client: Client) -> List[CardData]:
     """
     Fetch data for all character cards, sorted by category then name.
 
+    Connections are pulled in a single paginated query and indexed in memory,
+    so the number of round trips does not grow with the number of characters.
+
     Returns:
         List of CardData objects sorted by category order (R, S, P, I, M, N, A, B, C, D, T)
         and then alphabetically by name within each category.
     """
-    # Fetch all characters first
-    characters = fetch_all_characters(client)
+    return build_all_card_data(fetch_all_characters(client), fetch_all_connections(client))
+
+
+def iter_card_data(characters: List[Character], connections: List[Connection]) -> Iterator[CardData]:
+    """
+    Build card data one card at a time from already-loaded tables.
 
+    The deck-wide indexes are built up front; each card's connections are
+    only denormalized when the card is reached, so a streaming renderer
+    holds just the cards it is working on.
+
+    Args:
+        characters: All characters
+        connections: All active connections
+
+    Returns:
+        Iterator of CardData objects, sorted as in fetch_all_card_data
+    """
     # Sort characters by category order, then by name
-    characters.sort(key=lambda char: (
+    characters = sorted(characters, key=lambda char: (
         CATEGORY_ORDER.get(char.type, 99),  # Use 99 for unknown categories
         (char.name or "").upper()
     ))
@@ -273,10 +748,26 @@ def fetch_all_card_data(client: Client) -> List[CardData]:
     # Create lookup dictionary
     character_lookup = {char.id: char for char in characters}
 
-    # Fetch card data for each character (already sorted)
-    card_data_list = []
+    # Index connections by character
+    connection_index = build_connection_index(connections)
+
+    # Group jokers by target category once for the whole deck
+    joker_index = build_joker_index(character_lookup)
+
+    # Build card data for each character (already sorted)
     for character in characters:
-        card_data = fetch_card_data(client, character, character_lookup)
-        card_data_list.append(card_data)
+        yield fetch_card_data(None, character, character_lookup, connection_index, joker_index)
 
-    return card_data_list
+
+def build_all_card_data(characters: List[Character], connections: List[Connection]) -> List[CardData]:
+    """
+    Build data for all character cards from already-loaded tables.
+
+    Args:
+        characters: All characters
+        connections: All active connections
+
+    Returns:
+        List of CardData objects, sorted as in fetch_all_card_data
+    """
+    return list(iter_card_data(characters, connections))
@@ -1,11 +1,14 @@
 """
 Data models for Supabase tables.
+
+The models use __slots__ so large decks (tens of thousands of connections,
+several editions at once) don't pay for a __dict__ per object.
 """
 from dataclasses import dataclass
 from typing import Optional, List
 
 
-@dataclass
+@dataclass(slots=True)
 class Character:
     """Character data model matching Supabase character table."""
     id: int  # Integer ID (primary key)
@@ -23,7 +26,7 @@ class Character:
     joker_type_why_short: Optional[str] = None  # Joker connection why_short
 
 
-@dataclass
+@dataclass(slots=True)
 class Connection:
     """Connection data model matching Supabase connection table."""
     id: int  # Integer ID (primary key)
@@ -35,17 +38,24 @@ class Connection:
     active: Optional[bool] = None  # Whether the connection is active
 
 
-@dataclass
+@dataclass(slots=True)
 class DenormalizedConnection:
-    """Connection with character names instead of IDs."""
-    character_name: str
-    category_code: str
+    """Connection to another character, read through the shared Character record instead of an ID."""
+    other: Character  # The connected character (shared, not copied)
     value: int
     why: str
     why_short: Optional[str] = None  # Short version of connection description
 
+    @property
+    def character_name(self) -> str:
+        return self.other.name or "Unknown"
+
+    @property
+    def category_code(self) -> str:
+        return self.other.type or "Unknown"
+
 
-@dataclass
+@dataclass(slots=True)
 class CardData:
     """Complete card data ready for rendering."""
     character: Character
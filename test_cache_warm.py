@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark concurrent cache warming against lazy one-at-a-time downloads.
+
+Serves synthetic JPEG portraits (no Supabase access needed) from a storage
+stand-in that adds a fixed latency per request, fails some requests once with
+a transient error, has no metadata for some images and one corrupt image.
+Fills an empty cache once the way rendering does (one image after the other)
+and once with the concurrent warm-up, and checks that both produce the same
+cache and that only the corrupt image fails. Then checks validation against
+the bucket listing: metadata cached before the first listing is dropped, a
+rebuild with a warm cache makes a single request, and changed metadata is
+downloaded again.
+"""
+import io
+import os
+import json
+import sys
+import time
+import shutil
+import tempfile
+import contextlib
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.card import image_handler
+from src.card.cache_warmer import warm_image_cache, refresh_bucket_index, WARM_WORKERS
+from benchmark_fixtures import SimulatedClient, create_portraits, use_image_cache
+
+
+NUM_IMAGES = 60
+DOWNLOAD_LATENCY = 0.05  # Seconds per storage request
+CORRUPT_IMAGE = "PORTRAIT_007.jpg"
+
+
+def every_fifth(name: str) -> bool:
+    """Every fifth portrait fails on its first request."""
+    return name.endswith('0.jpg')
+
+
+def create_bucket(directory: str) -> list:
+    """Write portraits (every third one with landscape metadata); return their names."""
+    names = create_portraits(directory, NUM_IMAGES, size=(900, 1200))
+    for index in range(3, NUM_IMAGES + 1, 3):
+        with open(os.path.join(directory, f"PORTRAIT_{index:03d}.json"), 'w') as f:
+            f.write('{"orientation": "landscape"}')
+
+    # Truncated download
+    path = os.path.join(directory, CORRUPT_IMAGE)
+    with open(path, 'rb') as f:
+        data = f.read()
+    with open(path, 'wb') as f:
+        f.write(data[:len(data) // 2])
+    return names
+
+
+def cache_contents() -> dict:
+    """Map of relative path to bytes for everything in the cache."""
+    contents = {}
+    for root, _, files in os.walk(image_handler.CACHE_DIR):
+        for name in files:
+            path = os.path.join(root, name)
+            with open(path, 'rb') as f:
+                contents[os.path.relpath(path, image_handler.CACHE_DIR)] = f.read()
+    return contents
+
+
+def fill_lazily(client, names: list) -> float:
+    """Fetch each image and its metadata in turn, like rendering without warming."""
+    shutil.rmtree(image_handler.CACHE_DIR, ignore_errors=True)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name in names:
+            image_handler._download_metadata(client, name)
+            try:
+                image_handler._ensure_cached(client, name)
+            except Exception:
+                pass
+    return time.perf_counter() - start
+
+
+def main():
+    print("=" * 70)
+    print("Cache Warm Benchmark")
+    print("=" * 70)
+    print()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bucket_dir = os.path.join(tmp, 'bucket')
+        os.makedirs(bucket_dir)
+        names = create_bucket(bucket_dir)
+
+        use_image_cache(os.path.join(tmp, 'image_cache'))
+
+        print(f"Bucket: {NUM_IMAGES} images, {DOWNLOAD_LATENCY * 1000:.0f} ms per storage request")
+        print()
+
+        # Lazy fetching does not retry, so transient errors are already used up for it
+        client = SimulatedClient(bucket_dir, latency=DOWNLOAD_LATENCY, flaky=every_fifth)
+        client.storage.bucket.failed_once.update(names)
+        lazy_time = fill_lazily(client, names)
+        lazy_cache = cache_contents()
+
+        shutil.rmtree(image_handler.CACHE_DIR, ignore_errors=True)
+        client = SimulatedClient(bucket_dir, latency=DOWNLOAD_LATENCY, flaky=every_fifth)
+        result = warm_image_cache(client, [f"data/images/{name}" for name in names] + [None, ""],
+                                  workers=WARM_WORKERS)
+        warm_cache = cache_contents()
+
+        second = warm_image_cache(client, names, workers=WARM_WORKERS)
+
+        # Rebuild with a warm cache (without the corrupt image, which is never cached):
+        # list the bucket, warm, read every image's metadata
+        cached_names = [name for name in names if name != CORRUPT_IMAGE]
+        bucket = client.storage.bucket
+        refresh_bucket_index(client)
+        # Metadata cached before the first listing was never validated
+        unvalidated_dropped = not os.listdir(image_handler.METADATA_CACHE_DIR)
+        warm_image_cache(client, cached_names, workers=WARM_WORKERS)
+        bucket.requests = 0
+        refresh_bucket_index(client)
+        warm_image_cache(client, cached_names, workers=WARM_WORKERS)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for name in cached_names:
+                image_handler._download_metadata(client, name)
+        warm_requests = bucket.requests
+
+        # Re-upload one metadata file
+        time.sleep(0.01)
+        with open(os.path.join(bucket_dir, "PORTRAIT_003.json"), 'w') as f:
+            f.write('{"orientation": "portrait"}')
+        refresh_bucket_index(client)
+        warm_image_cache(client, cached_names, workers=WARM_WORKERS)
+        with open(os.path.join(image_handler.METADATA_CACHE_DIR, "PORTRAIT_003.json")) as f:
+            refreshed = json.load(f) == {"orientation": "portrait"}
+
+        checks = [
+            ("Same cache as lazy fetching", warm_cache == lazy_cache),
+            ("Transient errors retried", result.downloaded == NUM_IMAGES - 1),
+            ("Only the corrupt image failed", [name for name, _ in result.failed] == [CORRUPT_IMAGE]),
+            ("Corrupt image not cached", CORRUPT_IMAGE not in warm_cache),
+            ("Second run downloads no images", second.downloaded == 0 and second.cached == NUM_IMAGES - 1),
+            ("Unvalidated metadata dropped", unvalidated_dropped),
+            ("Validated rebuild makes 1 request", warm_requests == 1),
+            ("Changed metadata downloaded again", refreshed),
+        ]
+        for label, passed in checks:
+            print(f"  {label + ':':<34} {'✓' if passed else '✗'}")
+        print()
+
+        print(f"  Lazy, one at a time:      {lazy_time:6.2f}s")
+        print(f"  Warm ({WARM_WORKERS} workers):         {result.seconds:6.2f}s")
+        print(f"  Speedup:                  {lazy_time / result.seconds:6.1f}x")
+        print(f"  {result.summary()}")
+        print()
+
+    if not all(passed for _, passed in checks):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
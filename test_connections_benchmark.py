@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark the direct-draw connections table against platypus Tables.
+
+Draws synthetic connections (no Supabase access needed) in each of the three
+table layouts, once with the direct-draw renderer and once with a platypus
+Table styled like the original implementation. The platypus table is a
+reconstruction in this script, not the original code, so the timings compare
+against it rather than against the previous renderer. Checks that both place
+the same text at the same positions and reports the cost per card.
+"""
+import io
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pypdf import PdfReader
+from reportlab.pdfgen import canvas
+from reportlab.platypus import Table, TableStyle
+from reportlab.lib import colors
+from src.types.supabase_types import Character, DenormalizedConnection
+from src.card.components.back.connections import (
+    DETAILED_LAYOUT, TWO_COLUMN_LAYOUT, THREE_COLUMN_LAYOUT, ROW_COLORS, _draw_table
+)
+from src.config import CARD_WIDTH, CATEGORY_ORDER, get_category_color
+
+
+CARDS = 200
+CASES = [
+    ("Detailed (20 connections)", DETAILED_LAYOUT, 20),
+    ("Two columns (50 connections)", TWO_COLUMN_LAYOUT, 50),
+    ("Three columns (100 connections)", THREE_COLUMN_LAYOUT, 100),
+]
+
+
+def synthetic_connections(count: int) -> list:
+    categories = [code for code in CATEGORY_ORDER if code != 'T']
+    return [
+        DenormalizedConnection(
+            other=Character(id=i, name=f"CHARACTER {i:03d}", type=categories[i % len(categories)]),
+            value=i % 10 + 1,
+            why="Reason",
+            why_short="Short reason" if i % 3 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def draw_platypus_table(c: canvas.Canvas, layout, connections: list, x: float, table_y: float) -> float:
+    """Reference implementation: a platypus Table with the original styles."""
+    if layout.max_rows:
+        connections = connections[:layout.max_rows]
+    num_rows = -(-len(connections) // layout.sections)
+    sections = [connections[i * num_rows:(i + 1) * num_rows] for i in range(layout.sections)]
+    per_section = len(layout.cells) + 1  # Cells plus separator
+
+    table_data = []
+    for row in range(num_rows):
+        cells = []
+        for index, section in enumerate(sections):
+            if index:
+                cells.append("")
+            conn = section[row] if row < len(section) else None
+            cells += [
+                "" if conn is None else
+                str(conn.value) if cell.field == 'value' else
+                conn.category_code if cell.field == 'category' else
+                conn.character_name or "" if cell.field == 'name' else
+                conn.why_short or ""
+                for cell in layout.cells
+            ]
+        table_data.append(cells)
+
+    col_widths = []
+    for index in range(layout.sections):
+        if index:
+            col_widths.append(layout.separator_width)
+        col_widths += [cell.width for cell in layout.cells]
+
+    table = Table(table_data, colWidths=col_widths, rowHeights=[layout.row_height] * num_rows)
+    style = TableStyle([
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('ROWBACKGROUNDS', (0, 0), (-1, -1), list(ROW_COLORS)),
+        ('TOPPADDING', (0, 0), (-1, -1), layout.top_padding),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+    ])
+    for index in range(layout.sections):
+        offset = index * per_section
+        if index:
+            style.add('LEFTPADDING', (offset - 1, 0), (offset - 1, -1), 0)
+            style.add('RIGHTPADDING', (offset - 1, 0), (offset - 1, -1), 0)
+            style.add('BACKGROUND', (offset - 1, 0), (offset - 1, -1), colors.white)
+        for column, cell in enumerate(layout.cells, start=offset):
+            style.add('FONTNAME', (column, 0), (column, -1), cell.font_name)
+            style.add('FONTSIZE', (column, 0), (column, -1), cell.font_size)
+            style.add('LEFTPADDING', (column, 0), (column, -1), cell.left_padding)
+            style.add('RIGHTPADDING', (column, 0), (column, -1), cell.right_padding)
+            if cell.centered:
+                style.add('ALIGN', (column, 0), (column, -1), 'CENTER')
+            if cell.field == 'category':
+                for row, conn in enumerate(sections[index]):
+                    style.add('BACKGROUND', (column, row), (column, row), get_category_color(conn.category_code))
+                    style.add('TEXTCOLOR', (column, row), (column, row), colors.white)
+    table.setStyle(style)
+
+    table.wrapOn(c, CARD_WIDTH, 1000)
+    bottom_y = table_y - num_rows * layout.row_height
+    table.drawOn(c, x, bottom_y)
+    return bottom_y
+
+
+def render(draw, layout, connections: list, cards: int) -> tuple:
+    """Draw one table per page; return (drawing seconds per card, PDF bytes)."""
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer)
+    elapsed = 0
+    for _ in range(cards):
+        start = time.perf_counter()
+        draw(c, layout, connections, 10, 300)
+        elapsed += time.perf_counter() - start
+        c.showPage()
+    c.save()
+    return elapsed / cards, buffer.getvalue()
+
+
+def text_positions(pdf: bytes) -> list:
+    """Return (text, x, y) for every string on the first page."""
+    positions = []
+
+    def visit(text, cm, tm, font_dict, font_size):
+        if text.strip():
+            x = cm[0] * tm[4] + cm[2] * tm[5] + cm[4]
+            y = cm[1] * tm[4] + cm[3] * tm[5] + cm[5]
+            positions.append((text.strip(), round(x, 2), round(y, 2)))
+
+    PdfReader(io.BytesIO(pdf)).pages[0].extract_text(visitor_text=visit)
+    return sorted(positions)
+
+
+def main():
+    print("=" * 70)
+    print("Connections Table Benchmark")
+    print("=" * 70)
+    print()
+
+    all_identical = True
+    for label, layout, count in CASES:
+        connections = synthetic_connections(count)
+        platypus_time, platypus_pdf = render(draw_platypus_table, layout, connections, CARDS)
+        direct_time, direct_pdf = render(_draw_table, layout, connections, CARDS)
+
+        identical = text_positions(platypus_pdf) == text_positions(direct_pdf)
+        all_identical &= identical
+
+        print(f"{label}:")
+        print(f"  Text positions identical: {'✓' if identical else '✗'}")
+        print(f"  Platypus Table: {platypus_time * 1000:7.2f} ms/card")
+        print(f"  Direct draw:    {direct_time * 1000:7.2f} ms/card")
+        print(f"  Speedup:        {platypus_time / direct_time:7.1f}x")
+        print()
+
+    if not all_identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,10 @@ try:
     from reportlab.pdfgen import canvas
     print("OK")
 
+    print("  ✓ Importing pypdf...", end=" ")
+    from pypdf import PdfWriter
+    print("OK")
+
     print("  ✓ Importing PIL...", end=" ")
     from PIL import Image
     print("OK")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark the precomputed joker index against the per-card joker scan.
+
+Builds a synthetic 10k-character deck (no Supabase access needed), checks that
+the indexed denormalization gives identical results to the original scan, and
+reports the speedup.
+"""
+import sys
+import time
+import random
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.types.supabase_types import Character, DenormalizedConnection
+from src.supabase_client import denormalize_connections, build_joker_index
+from src.config import CATEGORY_ORDER
+
+
+NUM_CHARACTERS = 10_000
+NUM_JOKERS = 40
+SCAN_SAMPLE = 500  # The full O(N²) scan takes minutes, so time a sample and extrapolate
+
+
+def build_synthetic_deck(num_characters: int, num_jokers: int) -> dict:
+    """Create a character lookup with a handful of category and wildcard jokers."""
+    rng = random.Random(42)
+    categories = list(CATEGORY_ORDER.keys())
+
+    lookup = {}
+    for char_id in range(1, num_characters + 1):
+        lookup[char_id] = Character(
+            id=char_id,
+            name=f"CHARACTER {char_id:05d}",
+            type=rng.choice(categories),
+        )
+
+    for char_id in rng.sample(sorted(lookup), num_jokers):
+        char = lookup[char_id]
+        char.joker_type = rng.choice(categories + ['*'])
+        char.joker_type_value = rng.randint(1, 5)
+        char.joker_type_why = "Joker connection"
+        char.joker_type_why_short = "Joker"
+
+    return lookup
+
+
+def scan_joker_connections(character_id: int, character_lookup: dict) -> list:
+    """Reference implementation: the original scan over every character."""
+    denormalized = []
+    current_category = character_lookup[character_id].type
+
+    for other_char_id, other_char in character_lookup.items():
+        if other_char_id == character_id or not other_char.joker_type or current_category == "T":
+            continue
+        if other_char.joker_type == "*" or other_char.joker_type == current_category:
+            denormalized.append(DenormalizedConnection(
+                other=other_char,
+                value=other_char.joker_type_value or 0,
+                why=other_char.joker_type_why or "",
+                why_short=other_char.joker_type_why_short
+            ))
+
+    denormalized.sort(key=lambda x: (
+        CATEGORY_ORDER.get(x.category_code, 99),
+        x.character_name.upper() if x.character_name else ""
+    ))
+    return denormalized
+
+
+def main():
+    print("=" * 70)
+    print("Joker Index Benchmark")
+    print("=" * 70)
+    print()
+
+    lookup = build_synthetic_deck(NUM_CHARACTERS, NUM_JOKERS)
+    sample_ids = list(lookup)[:SCAN_SAMPLE]
+    print(f"Deck: {NUM_CHARACTERS} characters, {NUM_JOKERS} jokers")
+    print()
+
+    # Original scan on a sample of cards
+    start = time.perf_counter()
+    scanned = [scan_joker_connections(char_id, lookup) for char_id in sample_ids]
+    scan_per_card = (time.perf_counter() - start) / len(sample_ids)
+
+    # Indexed path on the full deck (including index construction)
+    start = time.perf_counter()
+    joker_index = build_joker_index(lookup)
+    indexed = [denormalize_connections(None, char_id, [], lookup, joker_index) for char_id in lookup]
+    indexed_total = time.perf_counter() - start
+
+    identical = scanned == indexed[:len(sample_ids)]
+    print(f"  Results identical on {len(sample_ids)} sampled cards: {'✓' if identical else '✗'}")
+    print()
+
+    scan_total = scan_per_card * NUM_CHARACTERS
+    print(f"  Scan:    {scan_per_card * 1000:8.3f} ms/card  (~{scan_total:.1f}s for full deck, extrapolated)")
+    print(f"  Indexed: {indexed_total / NUM_CHARACTERS * 1000:8.3f} ms/card  ({indexed_total:.2f}s for full deck)")
+    print(f"  Speedup: {scan_total / indexed_total:.0f}x")
+    print()
+
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memory footprint of a built deck with the slotted data models.
+
+Builds a synthetic deck with 50k connections from JSON rows (as returned by
+Supabase, no access needed) twice: once with plain dataclass copies of the
+previous models, and once with the current slotted models and interned
+strings. Reports the memory held by each deck.
+"""
+import sys
+import json
+import random
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional, List
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.supabase_client import character_from_row, connection_from_row, build_all_card_data
+from src.config import CATEGORY_ORDER
+
+
+NUM_CHARACTERS = 5_000
+NUM_CONNECTIONS = 50_000
+
+
+# Previous models: plain dataclasses, with names and categories stored on every connection
+
+@dataclass
+class LegacyCharacter:
+    id: int
+    name: Optional[str] = None
+    first_names: Optional[str] = None
+    birth_date: Optional[str] = None
+    death_date: Optional[str] = None
+    biography: Optional[str] = None
+    type: Optional[str] = None
+    link: Optional[str] = None
+    image_link: Optional[str] = None
+    joker_type: Optional[str] = None
+    joker_type_value: Optional[int] = None
+    joker_type_why: Optional[str] = None
+    joker_type_why_short: Optional[str] = None
+
+
+@dataclass
+class LegacyConnection:
+    id: int
+    char1_id: Optional[int] = None
+    char2_id: Optional[int] = None
+    value: Optional[int] = None
+    why: Optional[str] = None
+    why_short: Optional[str] = None
+    active: Optional[bool] = None
+
+
+@dataclass
+class LegacyDenormalizedConnection:
+    character_name: str
+    category_code: str
+    value: int
+    why: str
+    why_short: Optional[str] = None
+
+
+@dataclass
+class LegacyCardData:
+    character: LegacyCharacter
+    connections: List[LegacyDenormalizedConnection]
+
+
+def build_legacy_deck(character_rows: list, connection_rows: list) -> list:
+    """Reference implementation: the previous models and denormalization."""
+    characters = [LegacyCharacter(**row) for row in character_rows]
+    connections = [LegacyConnection(**row) for row in connection_rows]
+    lookup = {char.id: char for char in characters}
+
+    index = {}
+    for conn in connections:
+        index.setdefault(conn.char1_id, []).append(conn)
+    for conn in connections:
+        index.setdefault(conn.char2_id, []).append(conn)
+
+    deck = []
+    for char in characters:
+        denormalized = []
+        for conn in index.get(char.id, []):
+            other = lookup[conn.char2_id if conn.char1_id == char.id else conn.char1_id]
+            denormalized.append(LegacyDenormalizedConnection(
+                character_name=other.name or "Unknown",
+                category_code=other.type or "Unknown",
+                value=conn.value or 0,
+                why=conn.why or "",
+                why_short=conn.why_short
+            ))
+        denormalized.sort(key=lambda x: (CATEGORY_ORDER.get(x.category_code, 99), x.character_name.upper()))
+        deck.append(LegacyCardData(character=char, connections=denormalized))
+    return deck
+
+
+def build_current_deck(character_rows: list, connection_rows: list) -> list:
+    characters = [character_from_row(row) for row in character_rows]
+    connections = [connection_from_row(row) for row in connection_rows]
+    return build_all_card_data(characters, connections)
+
+
+def synthetic_rows() -> tuple:
+    """Create character and connection rows, decoded from JSON like an API response."""
+    rng = random.Random(42)
+    categories = list(CATEGORY_ORDER.keys())
+
+    characters = [
+        {
+            'id': char_id, 'name': f"CHARACTER {char_id:05d}", 'first_names': "Firstname",
+            'birth_date': "1500", 'death_date': "1560", 'biography': None,
+            'type': rng.choice(categories), 'link': None, 'image_link': None,
+            'joker_type': None, 'joker_type_value': None,
+            'joker_type_why': None, 'joker_type_why_short': None,
+        }
+        for char_id in range(1, NUM_CHARACTERS + 1)
+    ]
+    connections = []
+    for conn_id in range(1, NUM_CONNECTIONS + 1):
+        char1_id, char2_id = rng.sample(range(1, NUM_CHARACTERS + 1), 2)
+        connections.append({
+            'id': conn_id, 'char1_id': char1_id, 'char2_id': char2_id,
+            'value': rng.randint(1, 10), 'why': "Reason", 'why_short': "Short", 'active': True,
+        })
+
+    return json.loads(json.dumps(characters)), json.loads(json.dumps(connections))
+
+
+def measure(build, character_rows: list, connection_rows: list) -> tuple:
+    """Return (deck, bytes still allocated by the deck)."""
+    tracemalloc.start()
+    deck = build(character_rows, connection_rows)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return deck, size
+
+
+def main():
+    print("=" * 70)
+    print("Data Model Memory Benchmark")
+    print("=" * 70)
+    print()
+
+    character_rows, connection_rows = synthetic_rows()
+    print(f"Deck: {NUM_CHARACTERS} characters, {NUM_CONNECTIONS} connections")
+    print()
+
+    legacy_deck, legacy_size = measure(build_legacy_deck, character_rows, connection_rows)
+    current_deck, current_size = measure(build_current_deck, character_rows, connection_rows)
+
+    identical = [
+        [(c.character_name, c.category_code, c.value, c.why, c.why_short) for c in card.connections]
+        for card in legacy_deck
+    ] == [
+        [(c.character_name, c.category_code, c.value, c.why, c.why_short) for c in card.connections]
+        for card in sorted(current_deck, key=lambda card: card.character.id)
+    ]
+    print(f"  Connections identical: {'✓' if identical else '✗'}")
+    print()
+
+    print(f"  Plain dataclasses: {legacy_size / 1024 / 1024:7.1f} MB")
+    print(f"  Slotted models:    {current_size / 1024 / 1024:7.1f} MB")
+    print(f"  Reduction:         {(1 - current_size / legacy_size) * 100:7.0f}%")
+    print()
+
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark incremental deck rebuilds from the page library.
+
+Builds a synthetic deck with generated JPEG portraits (no Supabase access
+needed) and renders it in full, then incrementally: from an empty library,
+unchanged, after editing one biography, after renaming one character (which
+changes the backs of the cards connected to it), after replacing one
+portrait and after downloading one that was not cached (from a storage
+stand-in). Checks that only the affected cards are rendered and that the
+assembled PDF has the same pages as a full render. The fragments joined with
+pdf_concat are compared with a pypdf join page by page: content streams,
+images, fonts and form XObjects, with every reference resolved.
+"""
+import os
+import sys
+import time
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from PIL import Image
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+from src.card import image_handler
+from src.cards import generate_cards_pdf
+from src.page_library import generate_cards_pdf_incremental
+from src.pdf_concat import concatenate_pdfs
+from src.supabase_client import build_all_card_data
+from benchmark_fixtures import SimulatedClient, create_portraits, synthetic_tables, timed, use_image_cache
+
+
+NUM_CARDS = 300
+CONNECTIONS_PER_CARD = 15
+
+
+def page_texts(path: str) -> list:
+    return [page.extract_text() for page in PdfReader(path).pages]
+
+
+def resolved(obj):
+    """A PDF object with every reference resolved (streams as dictionary and decoded data)."""
+    if isinstance(obj, IndirectObject):
+        obj = obj.get_object()
+    if isinstance(obj, StreamObject):
+        return {key: resolved(value) for key, value in obj.items()}, obj.get_data()
+    if isinstance(obj, DictionaryObject):
+        return {key: resolved(value) for key, value in obj.items() if key != '/Parent'}
+    if isinstance(obj, ArrayObject):
+        return [resolved(value) for value in obj]
+    return obj
+
+
+def page_structures(path: str) -> list:
+    """Every page of a PDF resolved: contents, resources (images, fonts, forms) and boxes."""
+    return [resolved(page) for page in PdfReader(path).pages]
+
+
+def main():
+    print("=" * 70)
+    print("Page Library Benchmark")
+    print("=" * 70)
+    print()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        use_image_cache(os.path.join(tmp, 'image_cache'))
+        create_portraits(image_handler.CACHE_DIR, NUM_CARDS, size=(600, 800), quality=85)
+
+        library = os.path.join(tmp, 'page_cache')
+        full_path = os.path.join(tmp, 'full.pdf')
+        incremental_path = os.path.join(tmp, 'incremental.pdf')
+        characters, connections = synthetic_tables(NUM_CARDS, CONNECTIONS_PER_CARD)
+
+        def rebuild(supabase_client=None):
+            return timed(generate_cards_pdf_incremental, build_all_card_data(characters, connections),
+                         incremental_path, crop_marks=True, supabase_client=supabase_client, library_dir=library)
+
+        # Build the derivative cache first so every run finds the same portraits
+        timed(generate_cards_pdf, build_all_card_data(characters, connections), full_path, crop_marks=True)
+        full_time, _ = timed(generate_cards_pdf, build_all_card_data(characters, connections), full_path, crop_marks=True)
+        cold_time, (cold_rendered, _) = rebuild()
+        same_pages = page_texts(full_path) == page_texts(incremental_path)
+        unchanged_time, (unchanged_rendered, _) = rebuild()
+
+        characters[9].biography += " Edited."
+        biography_time, (biography_rendered, _) = rebuild()
+
+        renamed = characters[19]
+        renamed.name += " II"
+        linked = {conn.char1_id for conn in connections if conn.char2_id == renamed.id}
+        linked |= {conn.char2_id for conn in connections if conn.char1_id == renamed.id}
+        rename_time, (rename_rendered, _) = rebuild()
+
+        time.sleep(0.01)
+        Image.new('RGB', (600, 800), 'red').save(os.path.join(image_handler.CACHE_DIR, "PORTRAIT_030.jpg"))
+        portrait_time, (portrait_rendered, _) = rebuild()
+
+        # A portrait missing from the cache: drawn without it offline, with it once downloaded
+        storage = os.path.join(tmp, 'storage')
+        os.makedirs(storage)
+        os.replace(os.path.join(image_handler.CACHE_DIR, "PORTRAIT_040.jpg"), os.path.join(storage, "PORTRAIT_040.jpg"))
+        _, (offline_rendered, _) = rebuild()
+        _, (download_rendered, _) = rebuild(SimulatedClient(storage))
+        _, (downloaded_rendered, _) = rebuild()
+
+        timed(generate_cards_pdf, build_all_card_data(characters, connections), full_path, crop_marks=True)
+        same_after_edits = page_texts(full_path) == page_texts(incremental_path)
+
+        # Joining the fragments: pdf_concat against pypdf
+        fragments = sorted(os.path.join(library, name) for name in os.listdir(library))[:NUM_CARDS]
+        concat_time, _ = timed(concatenate_pdfs, fragments, os.path.join(tmp, 'joined.pdf'))
+        start = time.perf_counter()
+        writer = PdfWriter()
+        for fragment in fragments:
+            writer.append(fragment)
+        with open(os.path.join(tmp, 'joined_pypdf.pdf'), 'wb') as f:
+            writer.write(f)
+        pypdf_time = time.perf_counter() - start
+        same_as_pypdf = (page_structures(os.path.join(tmp, 'joined.pdf'))
+                         == page_structures(os.path.join(tmp, 'joined_pypdf.pdf')))
+
+        checks = [
+            ("pdf_concat pages match pypdf", same_as_pypdf),
+            ("Same pages as a full render", same_pages and same_after_edits),
+            ("Empty library renders every card", cold_rendered == NUM_CARDS),
+            ("Unchanged deck renders nothing", unchanged_rendered == 0),
+            ("Biography edit renders 1 card", biography_rendered == 1),
+            (f"Rename renders {len(linked | {renamed.id})} cards", rename_rendered == len(linked | {renamed.id})),
+            ("New portrait renders 1 card", portrait_rendered == 1),
+            ("Downloaded portrait renders 1 card", offline_rendered == download_rendered == 1 and downloaded_rendered == 0),
+        ]
+        for label, passed in checks:
+            print(f"  {label + ':':<36} {'✓' if passed else '✗'}")
+        print()
+
+        print(f"Deck: {NUM_CARDS} cards with portraits and crop marks")
+        print(f"  Full render:              {full_time:6.2f}s")
+        print(f"  Incremental, empty:       {cold_time:6.2f}s")
+        print(f"  Incremental, unchanged:   {unchanged_time:6.2f}s")
+        print(f"  One biography edited:     {biography_time:6.2f}s")
+        print(f"  One character renamed:    {rename_time:6.2f}s")
+        print(f"  One portrait replaced:    {portrait_time:6.2f}s")
+        print()
+        print(f"Joining {len(fragments)} fragments:")
+        print(f"  pypdf:      {pypdf_time:6.2f}s")
+        print(f"  pdf_concat: {concat_time:6.2f}s ({pypdf_time / concat_time:.0f}x faster)")
+        print()
+
+    if not all(passed for _, passed in checks):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
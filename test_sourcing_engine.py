@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Benchmark concurrent image sourcing against one character after another.
+
+Runs a local stand-in for Wikimedia Commons (no network access needed) that
+answers search queries with a fixed latency and serves small JPEGs. Sources a
+batch of characters with CharacterImageDownloader.download_batch and with the
+asyncio SourcingEngine, and checks that both write the same files and the
+same metadata JSON. Then does the same for review candidates
+(InteractiveImageSelector.download_candidates against
+SourcingEngine.source_candidates).
+"""
+import io
+import os
+import sys
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+sys.path.insert(0, str(Path(__file__).parent))
+
+from PIL import Image
+from src.download_images.config import WikimediaConfig, DownloadConfig
+from src.download_images.models import Character
+from src.download_images.http_session import WikimediaSession
+from src.download_images.response_cache import ResponseCache
+from src.download_images.wikimedia_api import WikimediaAPIClient
+from src.download_images.file_manager import FileManager
+from src.download_images.downloader import CharacterImageDownloader
+from src.download_images.interactive_selector import InteractiveImageSelector
+from src.download_images.sourcing_engine import SourcingEngine
+from benchmark_fixtures import timed
+
+
+NUM_CHARACTERS = 12
+HITS_PER_QUERY = 5
+LATENCY = 0.05        # Seconds per request
+CONCURRENCY = DownloadConfig.SOURCING_CONCURRENCY
+MAX_CANDIDATES = 6
+
+
+def small_jpeg() -> bytes:
+    buffer = io.BytesIO()
+    Image.new('RGB', (40, 52), 'gray').save(buffer, 'JPEG')
+    return buffer.getvalue()
+
+
+class SimulatedCommons(ThreadingHTTPServer):
+    """Wikimedia Commons stand-in: search API plus image files."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), SimulatedCommonsHandler)
+        self.image = small_jpeg()
+        self.lock = threading.Lock()
+        self.requests = 0
+
+
+class SimulatedCommonsHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        with self.server.lock:
+            self.server.requests += 1
+        url = urlsplit(self.path)
+        if url.path.startswith('/images/'):
+            self.respond('image/jpeg', self.server.image)
+            return
+
+        query = parse_qs(url.query)['gsrsearch'][0]
+        pages = {}
+        for index in range(1, HITS_PER_QUERY + 1):
+            digest = hashlib.sha1(f"{query} {index}".encode()).hexdigest()
+            pages[str(index)] = {
+                'pageid': index, 'ns': 6, 'index': index, 'title': f"File:{digest[:12]}.jpg",
+                'imageinfo': [{
+                    'url': f"http://{self.headers['Host']}/images/{digest[:12]}.jpg",
+                    'width': 1000, 'height': 1000 + 100 * index, 'mime': 'image/jpeg', 'sha1': digest,
+                }],
+            }
+        self.respond('application/json', json.dumps({'query': {'pages': pages}}).encode())
+
+    def respond(self, content_type: str, body: bytes):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def characters() -> list:
+    return [
+        Character(id=index, name=f"PHILOSOPHER {index}", type='P', first_names="Firstname",
+                  biography="A philosopher of note.", birth_date="1600", death_date="1660")
+        for index in range(1, NUM_CHARACTERS + 1)
+    ]
+
+
+def directory_contents(directory: Path) -> dict:
+    """Map of filename to bytes (JSON without timestamps)."""
+    contents = {}
+    for path in sorted(directory.iterdir()):
+        if path.suffix == '.json':
+            metadata = json.loads(path.read_text())
+            metadata.pop('download_timestamp', None)
+            contents[path.name] = metadata
+        else:
+            contents[path.name] = path.read_bytes()
+    return contents
+
+
+def main():
+    print("=" * 70)
+    print("Sourcing Engine Benchmark")
+    print("=" * 70)
+    print()
+
+    server = SimulatedCommons()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    class LocalConfig(WikimediaConfig):
+        API_URL = f"http://127.0.0.1:{server.server_address[1]}/w/api.php"
+        # Pace well above the simulated server so latency dominates
+        REQUESTS_PER_SECOND = MAX_REQUESTS_PER_SECOND = 200.0
+
+    session = WikimediaSession(LocalConfig())
+
+    def downloader():
+        # A fresh response cache per run, so every run sends its requests
+        return CharacterImageDownloader(
+            api_client=WikimediaAPIClient(session=session, cache=ResponseCache(':memory:')),
+            file_manager=FileManager(session=session),
+            verbose=False
+        )
+
+    print(f"Batch: {NUM_CHARACTERS} characters, {LATENCY * 1000:.0f} ms per request")
+    print()
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)  # The review selector writes to sourced_images/ in the working directory
+        try:
+            # Primary and alternative downloads
+            sequential_dir, engine_dir = Path(tmp, 'sequential'), Path(tmp, 'engine')
+            sequential_time, sequential_counts = timed(downloader().download_batch, characters(), sequential_dir)
+            requests_per_batch = server.requests
+            engine_time, engine_counts = timed(downloader().download_batch, characters(), engine_dir,
+                                               concurrency=CONCURRENCY)
+            same_files = directory_contents(sequential_dir) == directory_contents(engine_dir)
+
+            # Review candidates
+            selector = InteractiveImageSelector(downloader=downloader())
+            selector.file_manager = FileManager(session=session)
+            review_time, sequential_candidates = timed(
+                lambda: [selector.download_candidates(character, MAX_CANDIDATES) for character in characters()]
+            )
+            sequential_temp = directory_contents(selector.temp_dir)
+            timed(selector.cleanup_temp_files)
+            engine = SourcingEngine(CONCURRENCY, file_manager=selector.file_manager, session=session,
+                                    cache=ResponseCache(':memory:'))
+            engine_review_time, engine_candidates = timed(
+                engine.source_candidates, characters(), selector, MAX_CANDIDATES
+            )
+            same_candidates = (
+                [[(info, path.name) for info, path in found] for found in sequential_candidates]
+                == [[(info, path.name) for info, path in found] for found in engine_candidates]
+                and directory_contents(selector.temp_dir) == sequential_temp
+            )
+        finally:
+            os.chdir(cwd)
+
+    checks = [
+        ("Every character sourced", sequential_counts == engine_counts == (NUM_CHARACTERS, NUM_CHARACTERS)),
+        ("Same files and metadata", same_files),
+        ("Same review candidates", same_candidates),
+    ]
+    for label, passed in checks:
+        print(f"  {label + ':':<30} {'✓' if passed else '✗'}")
+    print()
+
+    print(f"Primary + alternatives ({requests_per_batch} requests):")
+    print(f"  One after another:        {sequential_time:6.2f}s")
+    print(f"  Engine ({CONCURRENCY} at a time):     {engine_time:6.2f}s ({sequential_time / engine_time:.1f}x faster)")
+    print(f"Review candidates ({MAX_CANDIDATES} per character):")
+    print(f"  One after another:        {review_time:6.2f}s")
+    print(f"  Engine ({CONCURRENCY} at a time):     {engine_review_time:6.2f}s ({review_time / engine_review_time:.1f}x faster)")
+    print()
+
+    server.shutdown()
+    if not all(passed for _, passed in checks):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark the streaming render pipeline against preparing each card inline.
+
+Builds a synthetic deck with generated JPEG portraits (no Supabase access
+needed) served by a storage stand-in that adds a fixed latency per download,
+like a remote bucket. Renders it once with images prepared inline
+(prefetch_depth=0) and once streamed, with portraits prepared by the
+producer thread while earlier cards are drawn. Image caches are emptied
+before each run.
+"""
+import io
+import os
+import sys
+import time
+import shutil
+import tempfile
+import contextlib
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.card import image_handler
+from src.cards import generate_cards_pdf
+from src.pipeline import PREFETCH_DEPTH
+from src.supabase_client import iter_card_data
+from src.config import CARD_WIDTH, CARD_HEIGHT
+from benchmark_fixtures import SimulatedClient, create_portraits, synthetic_tables, use_image_cache
+
+
+NUM_CARDS = 40
+CONNECTIONS_PER_CARD = 15
+DOWNLOAD_LATENCY = 0.05  # Seconds per storage request
+
+
+def render(tables: tuple, client, output_path: str, prefetch_depth: int) -> float:
+    """Render the deck with empty image caches; return the wall time."""
+    shutil.rmtree(image_handler.CACHE_DIR, ignore_errors=True)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate_cards_pdf(iter_card_data(*tables), output_path, supabase_client=client, prefetch_depth=prefetch_depth)
+    return time.perf_counter() - start
+
+
+def main():
+    print("=" * 70)
+    print("Streaming Render Benchmark")
+    print("=" * 70)
+    print()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bucket_dir = os.path.join(tmp, 'bucket')
+        os.makedirs(bucket_dir)
+        create_portraits(bucket_dir, NUM_CARDS)
+        use_image_cache(os.path.join(tmp, 'image_cache'))
+
+        client = SimulatedClient(bucket_dir, latency=DOWNLOAD_LATENCY)
+        tables = synthetic_tables(NUM_CARDS, CONNECTIONS_PER_CARD)
+        output_path = os.path.join(tmp, 'deck.pdf')
+
+        print(f"Deck: {NUM_CARDS} cards, {DOWNLOAD_LATENCY * 1000:.0f} ms per storage request")
+        print()
+
+        # Time each stage on its own: image preparation, then drawing with warm caches
+        shutil.rmtree(image_handler.CACHE_DIR, ignore_errors=True)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for card_data in iter_card_data(*tables):
+                image_handler.get_print_image(client, card_data.character.image_link, CARD_WIDTH, CARD_HEIGHT)
+        prepare_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_cards_pdf(iter_card_data(*tables), output_path, supabase_client=None, prefetch_depth=0)
+        draw_time = time.perf_counter() - start
+
+        inline_time = render(tables, client, output_path, prefetch_depth=0)
+        streamed_time = render(tables, client, output_path, prefetch_depth=PREFETCH_DEPTH)
+
+        print(f"  Image stage alone:      {prepare_time:6.2f}s")
+        print(f"  Drawing stage alone:    {draw_time:6.2f}s")
+        print()
+        print(f"  Slowest stage:          {max(prepare_time, draw_time):6.2f}s")
+        print(f"  Inline (sum of stages): {inline_time:6.2f}s")
+        print(f"  Streamed (depth {PREFETCH_DEPTH}):    {streamed_time:6.2f}s")
+        print(f"  Time saved:             {inline_time - streamed_time:6.2f}s "
+              f"({(1 - streamed_time / inline_time) * 100:.0f}%)")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Benchmark text wrapping and truncation with cached glyph widths.
+
+Compares the text measurement module against the original implementations
+(measuring the whole line with stringWidth for every word, and trimming
+one word or character at a time), checks that both give identical lines on
+random texts, and reports the time per call. No Supabase access needed.
+"""
+import sys
+import time
+import random
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from src.card.text import wrap_lines, fit_with_ellipsis, fit_length
+from src.config import CARD_WIDTH, MARGIN
+from src.card.components.back.header import CATEGORY_BOX_WIDTH
+
+
+NUM_TEXTS = 2_000
+HEADER_WIDTH = CARD_WIDTH - (2 * MARGIN) - CATEGORY_BOX_WIDTH
+WORDS = ("the of and to in a was his by for with as he that on at from king "
+         "Émile Zoë philosopher reformation CONSTANTINOPLE mathematician "
+         "astronomer-astrologer Holy Roman Emperor 1492 (1503-1519)").split()
+
+
+# Original implementations
+
+def reference_wrap(text: str, max_width: float, font_name: str, font_size: int) -> list:
+    words = text.split()
+    lines = []
+    current_line = []
+
+    for word in words:
+        test_line = ' '.join(current_line + [word])
+        width = stringWidth(test_line, font_name, font_size)
+
+        if width <= max_width:
+            current_line.append(word)
+        else:
+            if current_line:
+                lines.append(' '.join(current_line))
+                current_line = [word]
+            else:
+                lines.append(word)
+
+    if current_line:
+        lines.append(' '.join(current_line))
+
+    return lines
+
+
+def reference_ellipsis(line: str, max_width: float, font_name: str, font_size: int) -> str:
+    ellipsis = "..."
+    test_line = line + ellipsis
+    while stringWidth(test_line, font_name, font_size) > max_width and line:
+        words = line.split()
+        if len(words) > 1:
+            words = words[:-1]
+            line = ' '.join(words)
+        else:
+            line = line[:-1]
+        test_line = line + ellipsis
+    return test_line
+
+
+def reference_category(dates: str, category_name: str, max_width: float) -> str:
+    dates_category_text = f"{dates} | {category_name}"
+    category_display = category_name
+    while stringWidth(dates_category_text, "Helvetica", 6) > max_width and len(category_display) > 5:
+        category_display = category_display[:-1]
+        dates_category_text = f"{dates} | {category_display}"
+    return dates_category_text
+
+
+def current_category(dates: str, category_name: str, max_width: float) -> str:
+    length = fit_length(category_name, "Helvetica", 6, max_width, prefix=f"{dates} | ", min_length=5)
+    return f"{dates} | {category_name[:length]}"
+
+
+def random_text(rng: random.Random, num_words: int) -> str:
+    words = [rng.choice(WORDS) for _ in range(num_words)]
+    if rng.random() < 0.1:
+        words.insert(0, "Pneumonoultramicroscopicsilicovolcanoconiosis" * rng.randint(1, 3))
+    return " ".join(words)
+
+
+def timed(label: str, function, calls: list) -> float:
+    start = time.perf_counter()
+    for args in calls:
+        function(*args)
+    per_call = (time.perf_counter() - start) / len(calls) * 1e6
+    print(f"  {label:<34} {per_call:9.1f} µs/call")
+    return per_call
+
+
+def check_identical() -> bool:
+    rng = random.Random(42)
+    all_identical = True
+
+    wrap_cases = []
+    for _ in range(NUM_TEXTS):
+        font_size = rng.choice([6, 7, 9, 10, 12])
+        wrap_cases.append((random_text(rng, rng.randint(0, 80)), rng.uniform(10, 250), font_size))
+
+    identical = all(
+        reference_wrap(text, width, "Helvetica", size) == list(wrap_lines(text, "Helvetica", size, width))
+        for text, width, size in wrap_cases
+    )
+    print(f"  Wrapped lines identical:       {'✓' if identical else '✗'}")
+    all_identical &= identical
+
+    identical = all(
+        reference_ellipsis(text, width, "Helvetica", size) == fit_with_ellipsis(text, "Helvetica", size, width)
+        for text, width, size in wrap_cases
+    )
+    print(f"  Ellipsis truncation identical: {'✓' if identical else '✗'}")
+    all_identical &= identical
+
+    category_cases = [
+        (f"{rng.randint(1, 1999)}-{rng.randint(1, 1999)}", text[:rng.randint(0, 60)], width / 2)
+        for text, width, _ in wrap_cases
+    ]
+    identical = all(reference_category(*case) == current_category(*case) for case in category_cases)
+    print(f"  Category truncation identical: {'✓' if identical else '✗'}")
+    all_identical &= identical
+
+    return all_identical
+
+
+def main():
+    print("=" * 70)
+    print("Text Layout Benchmark")
+    print("=" * 70)
+    print()
+
+    all_identical = check_identical()
+    print()
+
+    rng = random.Random(7)
+    biographies = [(random_text(rng, 40),) for _ in range(500)]
+    long_texts = [(random_text(rng, 2_000),) for _ in range(10)]
+
+    for label, texts in (("Biography (40 words)", biographies), ("Long paragraph (2000 words)", long_texts)):
+        print(f"{label}:")
+        before = timed("stringWidth per word", lambda t: reference_wrap(t, HEADER_WIDTH, "Helvetica", 6), texts)
+        wrap_lines.cache_clear()
+        after = timed("Cached glyph widths", lambda t: wrap_lines(t, "Helvetica", 6, HEADER_WIDTH), texts)
+        cached = timed("Memoized layout", lambda t: wrap_lines(t, "Helvetica", 6, HEADER_WIDTH), texts)
+        print(f"  Speedup: {before / after:.0f}x (memoized {before / cached:.0f}x)")
+        print()
+
+    print("Header truncation:")
+    lines = [(" ".join(wrap_lines(t, "Helvetica", 6, HEADER_WIDTH * 2)[:1]),) for (t,) in biographies]
+    before = timed("Ellipsis, one word at a time", lambda l: reference_ellipsis(l, HEADER_WIDTH, "Helvetica", 6), lines)
+    after = timed("Ellipsis, binary search", lambda l: fit_with_ellipsis(l, "Helvetica", 6, HEADER_WIDTH), lines)
+    print(f"  Speedup: {before / after:.0f}x")
+    categories = [("1500-1560", t[:80], 40.0) for (t,) in biographies]
+    before = timed("Category, one char at a time", reference_category, categories)
+    after = timed("Category, binary search", current_category, categories)
+    print(f"  Speedup: {before / after:.0f}x")
+    print()
+
+    if not all_identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark re-running Wikimedia searches with the persistent response cache.
+
+Answers API queries from a session stand-in with a fixed latency (no network
+access needed): some queries find portraits, some only landscapes (rejected
+by the scorer) and some nothing at all. Runs the queries of a batch of
+characters against an empty cache file and again, and checks that the re-run
+sends no requests and returns the same results, that empty and rejected
+searches are stored as negative entries, that differently spelled copies of
+a query share an entry, and that expired entries and --refresh go back to
+the API.
+"""
+import io
+import os
+import sys
+import time
+import sqlite3
+import hashlib
+import tempfile
+import contextlib
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.download_images.models import Character
+from src.download_images.query_builder import QueryBuilder
+from src.download_images.wikimedia_api import WikimediaAPIClient
+from src.download_images.response_cache import ResponseCache
+
+
+NUM_CHARACTERS = 10
+LATENCY = 0.05  # Seconds per request
+
+
+class SimulatedResponse:
+    def __init__(self, data: dict):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self) -> dict:
+        return self.data
+
+
+class SimulatedSession:
+    """Session stand-in answering search queries after a fixed latency."""
+
+    def __init__(self):
+        self.requests = 0
+
+    def api_get(self, params: dict) -> SimulatedResponse:
+        time.sleep(LATENCY)
+        self.requests += 1
+        query = params['gsrsearch']
+        digest = int(hashlib.sha1(query.lower().encode()).hexdigest(), 16)
+        if digest % 4 == 0:
+            return SimulatedResponse({'batchcomplete': ''})  # Nothing found
+
+        landscape = digest % 4 == 1
+        pages = {}
+        for index in range(1, 4):
+            width, height = (1600, 1000) if landscape else (1000, 1200 + 100 * index)
+            pages[str(index)] = {
+                'pageid': index, 'ns': 6, 'index': index, 'title': f"File:{query} {index}.jpg",
+                'imageinfo': [{'url': f"https://example.org/{digest % 9973}_{index}.jpg", 'width': width,
+                               'height': height, 'mime': 'image/jpeg', 'sha1': f"{digest}{index}"}],
+            }
+        return SimulatedResponse({'query': {'pages': pages}})
+
+
+def characters() -> list:
+    return [
+        Character(id=index, name=f"ARTIST {index}", type='A', first_names="Firstname",
+                  biography="A painter of note.", birth_date="1500", death_date="1560")
+        for index in range(1, NUM_CHARACTERS + 1)
+    ]
+
+
+def search_batch(cache: ResponseCache, session: SimulatedSession) -> tuple:
+    """Run every query of the batch; return (seconds, results)."""
+    client = WikimediaAPIClient(session=session, cache=cache)
+    queries = [query for character in characters() for query in QueryBuilder().build_queries(character)]
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = [client.search_images(query) for query in queries]
+    return time.perf_counter() - start, results
+
+
+def main():
+    print("=" * 70)
+    print("Wikimedia Response Cache Benchmark")
+    print("=" * 70)
+    print()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'wikimedia_cache.db')
+        session = SimulatedSession()
+
+        cold = ResponseCache(path)
+        cold_time, cold_results = search_batch(cold, session)
+        cold_requests = session.requests
+        cold.close()
+
+        session.requests = 0
+        warm = ResponseCache(path)
+        warm_time, warm_results = search_batch(warm, session)
+        warm_requests = session.requests
+        warm_summary = warm.summary()
+        warm_misses, warm_negative_hits = warm.misses, warm.negative_hits
+
+        with sqlite3.connect(path) as conn:
+            negative_entries = conn.execute("SELECT COUNT(*) FROM responses WHERE negative = 1").fetchone()[0]
+        empty_or_rejected = sum(1 for results in cold_results if not results)
+
+        # The same search spelled differently
+        client = WikimediaAPIClient(session=session, cache=warm)
+        session.requests = 0
+        with contextlib.redirect_stdout(io.StringIO()):
+            client.search_images("Bayeux tapestry William Duke Normandy")
+            client.search_images("  bayeux  Tapestry william duke normandy ")
+        shared_requests = session.requests
+
+        # Expired and refreshed entries are fetched again
+        session.requests = 0
+        search_batch(ResponseCache(path, ttl_days=0, negative_ttl_days=0), session)
+        expired_requests = session.requests
+        session.requests = 0
+        refresh = ResponseCache(path, refresh=True)
+        search_batch(refresh, session)
+        refresh_requests = session.requests
+        warm.close()
+        refresh.close()
+
+        checks = [
+            ("Re-run sends no requests", warm_requests == 0 and warm_misses == 0),
+            ("Same results from the cache", warm_results == cold_results),
+            ("Empty/rejected stored as negative", negative_entries == empty_or_rejected > 0),
+            ("Negative entries served", warm_negative_hits == empty_or_rejected),
+            ("Normalized queries share an entry", shared_requests == 1),
+            ("Expired entries fetched again", expired_requests == cold_requests),
+            ("--refresh bypasses the cache", refresh_requests == cold_requests and refresh.hits == 0),
+        ]
+        for label, passed in checks:
+            print(f"  {label + ':':<36} {'✓' if passed else '✗'}")
+        print()
+
+        print(f"Batch: {NUM_CHARACTERS} characters, {len(cold_results)} queries, {LATENCY * 1000:.0f} ms per request")
+        print(f"  Empty cache:  {cold_time:6.2f}s, {cold_requests} requests")
+        print(f"  Re-run:       {warm_time:6.2f}s, {warm_requests} requests ({cold_time / warm_time:.0f}x faster)")
+        print(f"  {warm_summary}")
+        print()
+
+    if not all(passed for _, passed in checks):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
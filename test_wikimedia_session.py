@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark the pooled, adaptively paced Wikimedia session against fixed delays.
+
+Runs a local stand-in for the MediaWiki API (no network access needed) that
+answers search queries, throttles clients sending more than SERVER_RATE
+requests per second with 429 + Retry-After, and refuses a few requests with
+a maxlag error. Sends the same queries once the old way (module-level
+requests.get with a fixed API_DELAY_SECONDS sleep) and once through
+WikimediaSession, and checks that every query succeeds, throttled and
+maxlag requests are retried after the Retry-After time, and connections are
+reused.
+"""
+import sys
+import json
+import time
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+sys.path.insert(0, str(Path(__file__).parent))
+
+import requests
+from src.download_images.config import WikimediaConfig
+from src.download_images.http_session import WikimediaSession
+
+
+NUM_QUERIES = 24
+OLD_API_DELAY_SECONDS = 1.0  # Fixed pause between queries before adaptive pacing
+SERVER_RATE = 3.0            # Requests per second the server tolerates
+MAXLAG_EVERY = 10            # Every tenth request hits lagging replicas
+
+
+class SimulatedAPI(ThreadingHTTPServer):
+    """MediaWiki API stand-in that throttles fast clients."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), SimulatedAPIHandler)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.throttled = 0
+        self.maxlag = 0
+        self.connections = set()
+        self.early = 0               # Requests sent before Retry-After expired
+        self.blocked_until = 0.0
+        self.tokens = 1.0
+        self.updated = time.monotonic()
+
+    def admit(self) -> str:
+        """Return 'ok', 'throttled' or 'maxlag' for the next request."""
+        with self.lock:
+            now = time.monotonic()
+            self.requests += 1
+            if now < self.blocked_until:
+                self.early += 1
+            self.tokens = min(1.0, self.tokens + (now - self.updated) * SERVER_RATE)
+            self.updated = now
+            if self.tokens < 1.0:
+                self.throttled += 1
+                self.blocked_until = now + 1.0
+                return 'throttled'
+            self.tokens -= 1.0
+            if self.requests % MAXLAG_EVERY == 0:
+                self.maxlag += 1
+                self.blocked_until = now + 1.0
+                return 'maxlag'
+            return 'ok'
+
+
+class SimulatedAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        params = parse_qs(urlsplit(self.path).query)
+        status = self.server.admit()
+
+        if status == 'throttled':
+            self.respond(429, {'error': 'Too many requests'}, {'Retry-After': '1'})
+        elif status == 'maxlag' and 'maxlag' in params:
+            error = {'code': 'maxlag', 'info': 'Waiting for a database server: 6 seconds lagged.'}
+            self.respond(200, {'error': error}, {'Retry-After': '1'})
+        else:
+            title = f"File:{params['gsrsearch'][0]}.jpg"
+            page = {'pageid': 1, 'ns': 6, 'title': title, 'index': 1,
+                    'imageinfo': [{'url': 'https://example.org/a.jpg', 'width': 1000,
+                                   'height': 1300, 'mime': 'image/jpeg', 'sha1': 'abc'}]}
+            self.respond(200, {'query': {'pages': {'1': page}}})
+
+    def respond(self, status: int, payload: dict, headers: dict = None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def query_params(index: int) -> dict:
+    return {'action': 'query', 'generator': 'search', 'gsrsearch': f"Portrait {index}",
+            'gsrnamespace': '6', 'prop': 'imageinfo', 'iiprop': 'url|size|mime|sha1'}
+
+
+def run_fixed_delay(api_url: str) -> tuple:
+    """Old pacing: a new connection per request and a fixed sleep between queries."""
+    ok = 0
+    start = time.perf_counter()
+    for index in range(NUM_QUERIES):
+        response = requests.get(api_url, params={'format': 'json', **query_params(index)},
+                                headers=WikimediaConfig.HEADERS, timeout=10)
+        ok += response.status_code == 200 and 'query' in response.json()
+        time.sleep(OLD_API_DELAY_SECONDS)
+    return time.perf_counter() - start, ok
+
+
+def run_session(session: WikimediaSession) -> tuple:
+    ok = 0
+    start = time.perf_counter()
+    for index in range(NUM_QUERIES):
+        response = session.api_get(query_params(index))
+        ok += response.status_code == 200 and 'query' in response.json()
+    return time.perf_counter() - start, ok
+
+
+def main():
+    print("=" * 70)
+    print("Wikimedia Session Benchmark")
+    print("=" * 70)
+    print()
+
+    server = SimulatedAPI()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_address[1]}/w/api.php"
+
+    class LocalConfig(WikimediaConfig):
+        API_URL = api_url
+
+    print(f"Server: tolerates {SERVER_RATE:.0f} requests/s, maxlag on every {MAXLAG_EVERY}th request")
+    print(f"Queries: {NUM_QUERIES}")
+    print()
+
+    fixed_time, fixed_ok = run_fixed_delay(api_url)
+    fixed_connections = len(server.connections)
+
+    server.connections.clear()
+    server.requests = server.throttled = server.maxlag = server.early = 0
+    session = WikimediaSession(LocalConfig())
+    session_time, session_ok = run_session(session)
+    final_rate = session.bucket(api_url).rate
+
+    checks = [
+        ("Every query answered", fixed_ok == NUM_QUERIES and session_ok == NUM_QUERIES),
+        ("Throttled and maxlag requests retried", session.retries == server.throttled + server.maxlag),
+        ("Retry-After honoured", server.early == 0),
+        ("One keep-alive connection", len(server.connections) == 1),
+        ("Rate within limits", LocalConfig.MIN_REQUESTS_PER_SECOND <= final_rate <= LocalConfig.MAX_REQUESTS_PER_SECOND),
+    ]
+    for label, passed in checks:
+        print(f"  {label + ':':<40} {'✓' if passed else '✗'}")
+    print()
+
+    print(f"  Fixed {OLD_API_DELAY_SECONDS:.1f}s delay:  {fixed_time:6.2f}s, {fixed_connections} connections")
+    print(f"  Adaptive session: {session_time:6.2f}s, {len(server.connections)} connection(s), "
+          f"{session.throttled} throttled ({server.maxlag} maxlag), final rate {final_rate:.1f}/s")
+    print(f"  Speedup:          {fixed_time / session_time:6.1f}x")
+    print()
+
+    server.shutdown()
+    if not all(passed for _, passed in checks):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,23 +4,12 @@ Upload images from bigger_images folder to Supabase storage bucket.
 Overwrites existing images.
 """
 import os
+import sys
 from pathlib import Path
-from dotenv import load_dotenv
-from supabase import create_client
 
-# Load environment variables
-load_dotenv()
+sys.path.insert(0, str(Path(__file__).parent))
 
-
-def get_admin_supabase_client():
-    """Create and return a Supabase client with service role key (admin access)."""
-    url = os.getenv("SUPABASE_URL")
-    service_key = os.getenv("SUPABASE_SERVICE_KEY")
-
-    if not url or not service_key:
-        raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_KEY must be set in .env file")
-
-    return create_client(url, service_key)
+from src.supabase_client import get_admin_supabase_client
 
 
 def upload_images():